@@ -1,39 +1,25 @@
 # -*- coding: utf-8 -*-
+import time
+
+STARTUP_T0 = time.perf_counter()  # --startup-time 측정 기준 (import 포함)
+
 import datetime
 import json
 import math
 import os
 import platform
-import shutil
 import subprocess
+import sys
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 
 import random
 from mc_checklists import RELEASE_CHECKLIST, RECORDING_CHECKLIST
 from mc_docs import DOCS
-from mc_batch import find_occurrences, replace_in_workspace
-from mc_diff import DiffResult, compare_dirs, sync_dirs
-from mc_langcheck import check_lang_pack
-from mc_log import parse_log
-from mc_item import build_give_command, parse_enchants
-from mc_lint import lint_workspace
-from mc_migration import GUIDE_LINES, apply_migration, backup_before_migrate
-from mc_namespace import rename_namespace
-from mc_modelcheck import check_models
+from mc_jobs import JobScheduler
 from mc_presets import PROFILES
-from mc_particles import generate_circle_commands, generate_line_commands
-from mc_packmeta import bulk_update
-from mc_callgraph import build_call_graph, reachable_from, list_functions
-from mc_release import generate_changelog, generate_readme, list_packs
-from mc_recipe import build_shapeless, shaped_from_grid
-from mc_sounds import build_sound_event, parse_sound_list, update_sounds_file
-from mc_serverprops import ServerProps, load_properties, save_properties, TARGET_KEYS
-from mc_schema import scan_workspace_json, validate_file
-from mc_report import build_pack_report
-from mc_stats import collect_stats, summarize
-from mc_scanner import scan_workspace
-from mc_structure import read_nbt
+from mc_release import list_packs
+from mc_serverprops import TARGET_KEYS
 from mc_templates import (
     ADVANCEMENT_SAMPLE,
     CHALLENGE_POOL,
@@ -41,22 +27,59 @@ from mc_templates import (
     PACK_FORMATS,
     PREDICATE_SAMPLE,
 )
-from mc_tags import SUPPORTED_CATEGORIES, build_tag_json, save_tag
-from mc_schedules import ScheduledCommand, build_schedule
-from mc_text import gradient_text_payload
+from mc_tags import SUPPORTED_CATEGORIES
 
+# 도구 함수(mc_lint, mc_diff, mc_archive 등)는 각 핸들러 안에서 import 한다.
+# 시작 시에는 탭 구성에 필요한 상수 모듈만 읽어 첫 화면을 빨리 띄운다.
 
 CONFIG_FILE = os.path.join(os.path.dirname(__file__), "mc_helper_settings.json")
+LOG_FOLLOW_MIN_MS = 250  # 새 줄이 들어오는 동안의 폴링 간격
+LOG_FOLLOW_MAX_MS = 2000  # 조용할 때 늘어나는 최대 간격
+LOG_FOLLOW_MAX_LINES = 5000  # 결과 창에 남길 최대 줄 수
+
+TAB_SPECS = [
+    # (탭 본문 생성 메서드, 한국어 라벨, English label)
+    ("create_project_tab", "프로젝트 허브", "Project Hub"),
+    ("create_creator_tab", "크리에이터 유틸", "Creator Tools"),
+    ("create_calc_tab", "좌표/시간 계산기", "Coords/Time"),
+    ("create_command_tab", "명령어 & JSON 생성", "Commands & JSON"),
+    ("create_advanced_tab", "고급 명령어", "Advanced Cmd"),
+    ("create_pack_tab", "팩 스캐폴딩 & JSON", "Pack Scaffolding"),
+    ("create_dev_tools_tab", "개발 고급 도구", "Dev Tools"),
+    ("create_quality_tab", "품질/체크리스트", "Quality/Checklist"),
+    ("create_automation_tab", "배포/자동화", "Deploy/Automation"),
+    ("create_maintenance_tab", "편집/유지보수", "Edit/Maintenance"),
+    ("create_release_tab", "출시 문서", "Release Docs"),
+    ("create_stats_tab", "통계/인벤토리", "Stats/Inventory"),
+    ("create_server_tab", "서버 설정", "Server Settings"),
+    ("create_recipe_tab", "레시피 생성", "Recipes"),
+    ("create_particle_tab", "파티클/이펙트", "Particles/Effects"),
+    ("create_text_tab", "텍스트/채팅", "Text/Chat"),
+    ("create_tag_meta_tab", "태그/메타", "Tags/Meta"),
+    ("create_diff_tab", "비교/동기화", "Diff/Sync"),
+    ("create_migration_tab", "마이그레이션/스케줄", "Migration/Schedule"),
+    ("create_item_tab", "아이템/NBT", "Item/NBT"),
+    ("create_sound_tab", "사운드", "Sound"),
+    ("create_log_lang_tab", "로그/언어", "Log/Lang"),
+    ("create_schema_model_tab", "JSON/모델 검사", "JSON/Model Check"),
+    ("create_namespace_report_tab", "네임스페이스/리포트", "Namespace/Report"),
+    ("create_structure_tab", "구조/NBT", "Structure/NBT"),
+    ("create_callgraph_tab", "함수 그래프", "Call Graph"),
+]
 
 
 class MinecraftToolApp:
-    def __init__(self, root: tk.Tk):
+    def __init__(self, root: tk.Tk, eager_tabs: bool = False):
         self.root = root
+        self.eager_tabs = eager_tabs
         self.root.title("Minecraft 제작 도우미")
         self.root.geometry("1100x740")
         self.root.minsize(1000, 680)
 
         self.settings = self.load_settings()
+        self.jobs = JobScheduler(self.root.after)
+        self.job_bars: dict[str, tuple[ttk.Progressbar, ttk.Label, ttk.Button]] = {}
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         self.workspace_var = tk.StringVar(value=self.settings.get("workspace", ""))
         self.tab_filter_var = tk.StringVar(value="")
         self.language_var = tk.StringVar(value="ko")
@@ -91,6 +114,8 @@ class MinecraftToolApp:
         self.timer_remaining = 0
         self.timer_job = None
         self.world_path_var = tk.StringVar(value="")
+        self.backup_compression_var = tk.StringVar(value="fast")
+        self.backup_limit_var = tk.StringVar(value="0")
         self.challenge_output = None
 
         # 고급 명령어 빌더
@@ -129,9 +154,12 @@ class MinecraftToolApp:
         self.profile_choice = tk.StringVar(value="녹화 기본")
         self.pack_list_dp = None
         self.pack_list_rp = None
+        self.pack_minify_var = tk.BooleanVar(value=False)
         self.lint_output = None
         self.find_text = tk.StringVar(value="execute")
         self.replace_text = tk.StringVar(value="function")
+        self.find_json_var = tk.BooleanVar(value=False)
+        self.replace_regex_var = tk.BooleanVar(value=False)
         self.find_output = None
         self.doc_choice = tk.StringVar(value="점수판 설계")
         self.doc_view = None
@@ -183,9 +211,12 @@ class MinecraftToolApp:
         self.diff_src = tk.StringVar(value="")
         self.diff_dst = tk.StringVar(value="")
         self.diff_output = None
-        self.diff_last: DiffResult | None = None
+        self.diff_last = None  # mc_diff.DiffResult
+        self.diff_mirror = tk.BooleanVar(value=False)
+        self.diff_verify = tk.BooleanVar(value=False)
         # 마이그레이션/예약 실행
         self.migrate_kind = tk.StringVar(value="datapacks")
+        self.migrate_rules_path = tk.StringVar(value="")
         self.migrate_output = None
         self.schedule_namespace = tk.StringVar(value="example")
         self.schedule_name = tk.StringVar(value="timers")
@@ -211,6 +242,10 @@ class MinecraftToolApp:
         # 로그/언어
         self.log_path_var = tk.StringVar(value="")
         self.log_output = None
+        self.log_follower = None
+        self.log_follow_job = None
+        self.log_follow_delay = LOG_FOLLOW_MIN_MS
+        self.log_follow_btn = None
         self.lang_pack_var = tk.StringVar(value="")
         self.lang_output = None
         # JSON/모델 검사
@@ -260,6 +295,83 @@ class MinecraftToolApp:
             self.log_widget.see(tk.END)
         print(line)
 
+    def on_close(self):
+        self.stop_log_follow()
+        self.jobs.shutdown(cancel=True)
+        self.root.destroy()
+
+    # --- 백그라운드 작업 (진행률/취소) ---
+    def create_job_bar(self, parent, key: str) -> ttk.Frame:
+        bar = ttk.Frame(parent)
+        progress = ttk.Progressbar(bar, mode="determinate", length=220)
+        progress.pack(side="left", padx=(0, 6))
+        status = ttk.Label(bar, text="대기 중")
+        status.pack(side="left", fill="x", expand=True)
+        cancel_btn = ttk.Button(bar, text="취소", state="disabled", command=lambda: self.jobs.cancel(key))
+        cancel_btn.pack(side="right")
+        self.job_bars[key] = (progress, status, cancel_btn)
+        return bar
+
+    def run_job(self, key: str, name: str, func, on_done, on_emit=None):
+        """
+        func(job)을 작업 스레드에서 실행하고 결과를 on_done(result)로 받는다.
+        같은 key의 작업이 실행 중이면 경고만 띄운다. 다른 탭 작업과는 동시에 실행된다.
+        """
+        running = self.jobs.running(key)
+        if running:
+            messagebox.showwarning("작업 중", f"'{running.name}' 작업이 아직 실행 중입니다.")
+            return None
+        bar = self.job_bars.get(key)
+        started = time.perf_counter()
+        outcome = {"text": "완료"}
+
+        def on_progress(done: int, total: int, message: str):
+            if not bar:
+                return
+            progress, status, _ = bar
+            if total:
+                if str(progress.cget("mode")) != "determinate":
+                    progress.stop()
+                    progress.configure(mode="determinate")
+                progress.configure(maximum=total, value=done)
+            status.configure(text=message or (f"{name}: {done}/{total}" if total else f"{name}: {done}"))
+
+        def on_error(exc: BaseException):
+            outcome["text"] = "실패"
+            self.log(f"{name} 실패: {exc}")
+            messagebox.showerror("작업 실패", f"{name}\n{exc}")
+
+        def on_cancel():
+            outcome["text"] = "취소됨"
+            self.log(f"{name} 취소됨")
+
+        def on_finish():
+            if not bar:
+                return
+            progress, status, cancel_btn = bar
+            progress.stop()
+            progress.configure(mode="determinate", value=0)
+            status.configure(text=f"{name} {outcome['text']} ({time.perf_counter() - started:.1f}초)")
+            cancel_btn.configure(state="disabled")
+
+        if bar:
+            progress, status, cancel_btn = bar
+            progress.configure(mode="indeterminate")
+            progress.start(15)
+            status.configure(text=f"{name} 실행 중…")
+            cancel_btn.configure(state="normal")
+        return self.jobs.submit(
+            key,
+            name,
+            func,
+            on_done=on_done,
+            on_error=on_error,
+            on_progress=on_progress,
+            on_emit=on_emit,
+            on_cancel=on_cancel,
+            on_finish=on_finish,
+        )
+
     # --- UI 구성 ---
     def build_ui(self):
         style = ttk.Style(self.root)
@@ -292,44 +404,38 @@ class MinecraftToolApp:
 
         self.notebook = ttk.Notebook(container, style="Hidden.TNotebook")
         self.notebook.pack(fill="both", expand=True, padx=10, pady=10)
-        self.notebook.bind("<<NotebookTabChanged>>", lambda e: self.highlight_tab_buttons())
-
-        # 탭 생성
-        self.create_project_tab(self.notebook)
-        self.create_creator_tab(self.notebook)
-        self.create_calc_tab(self.notebook)
-        self.create_command_tab(self.notebook)
-        self.create_advanced_tab(self.notebook)
-        self.create_pack_tab(self.notebook)
-        self.create_dev_tools_tab(self.notebook)
-        self.create_quality_tab(self.notebook)
-        self.create_automation_tab(self.notebook)
-        self.create_maintenance_tab(self.notebook)
-        self.create_release_tab(self.notebook)
-        self.create_stats_tab(self.notebook)
-        self.create_server_tab(self.notebook)
-        self.create_recipe_tab(self.notebook)
-        self.create_particle_tab(self.notebook)
-        self.create_text_tab(self.notebook)
-        self.create_tag_meta_tab(self.notebook)
-        self.create_diff_tab(self.notebook)
-        self.create_migration_tab(self.notebook)
-        self.create_item_tab(self.notebook)
-        self.create_sound_tab(self.notebook)
-        self.create_log_lang_tab(self.notebook)
-        self.create_schema_model_tab(self.notebook)
-        self.create_namespace_report_tab(self.notebook)
-        self.create_structure_tab(self.notebook)
-        self.create_callgraph_tab(self.notebook)
+        self.notebook.bind("<<NotebookTabChanged>>", lambda e: self.on_tab_changed())
+
+        # 탭 생성: 라벨만 먼저 등록하고 본문은 처음 선택될 때 만든다
+        self.tab_builders: dict[str, str] = {}
+        self.tab_ids: dict[str, str] = {}
+        for builder, ko, _ in TAB_SPECS:
+            frame = ttk.Frame(self.notebook, padding=10)
+            self.notebook.add(frame, text=ko)
+            self.tab_builders[str(frame)] = builder
+            self.tab_ids[builder] = str(frame)
 
         self.setup_tab_labels()
         self.rebuild_tab_bar()
+        if self.eager_tabs:
+            for tab in list(self.tab_builders):
+                self.ensure_tab_built(tab)
+        else:
+            self.ensure_tab_built(self.notebook.select())
 
-    # --- 탭: 프로젝트 허브 ---
-    def create_project_tab(self, notebook: ttk.Notebook):
-        frame = ttk.Frame(notebook, padding=10)
-        notebook.add(frame, text="프로젝트 허브")
+    def ensure_tab_built(self, tab: str):
+        """탭 본문이 아직 없으면 지금 만든다."""
+        builder = self.tab_builders.pop(str(tab), None)
+        if builder is None:
+            return
+        getattr(self, builder)(self.notebook.nametowidget(tab))
+
+    def on_tab_changed(self):
+        self.ensure_tab_built(self.notebook.select())
+        self.highlight_tab_buttons()
 
+    # --- 탭: 프로젝트 허브 ---
+    def create_project_tab(self, frame: ttk.Frame):
         # 워크스페이스 선택
         ws_box = ttk.LabelFrame(frame, text="워크스페이스 (루트 경로를 지정하면 저장/생성이 편해집니다)")
         ws_box.pack(fill="x", pady=5)
@@ -420,9 +526,8 @@ class MinecraftToolApp:
         return path
 
     # --- 탭: 크리에이터 유틸 (플랜/랜덤 챌린지/타이머/백업) ---
-    def create_creator_tab(self, notebook: ttk.Notebook):
-        frame = ttk.Frame(notebook, padding=10)
-        notebook.add(frame, text="크리에이터 유틸")
+    def create_creator_tab(self, frame: ttk.Frame):
+        from mc_archive import COMPRESSION_CHOICES
 
         # 콘텐츠 플랜
         plan_box = ttk.LabelFrame(frame, text="콘텐츠 플랜 (아이디어/할일 메모)")
@@ -469,7 +574,20 @@ class MinecraftToolApp:
         b_row2 = ttk.Frame(backup_box)
         b_row2.pack(fill="x", pady=3)
         ttk.Button(b_row2, text="백업(zip) 만들기", command=self.create_world_backup).pack(side="left", padx=4)
+        ttk.Label(b_row2, text="압축").pack(side="left", padx=(8, 2))
+        ttk.Combobox(
+            b_row2, textvariable=self.backup_compression_var, values=list(COMPRESSION_CHOICES), state="readonly", width=8
+        ).pack(side="left")
+        ttk.Label(b_row2, text="속도 제한(MB/s, 0=없음)").pack(side="left", padx=(8, 2))
+        ttk.Entry(b_row2, textvariable=self.backup_limit_var, width=6).pack(side="left")
         ttk.Button(b_row2, text="저장 위치 열기", command=self.open_world_parent).pack(side="left", padx=4)
+        b_row3 = ttk.Frame(backup_box)
+        b_row3.pack(fill="x", pady=3)
+        ttk.Label(b_row3, text="증분 스냅샷").pack(side="left", padx=(4, 2))
+        ttk.Button(b_row3, text="스냅샷 백업", command=self.create_world_snapshot).pack(side="left", padx=4)
+        ttk.Button(b_row3, text="스냅샷 복원…", command=self.restore_world_snapshot).pack(side="left", padx=4)
+        ttk.Button(b_row3, text="오래된 스냅샷 정리", command=self.prune_world_snapshots).pack(side="left", padx=4)
+        self.create_job_bar(backup_box, "backup").pack(fill="x", padx=4, pady=(0, 4))
 
     def save_plan(self):
         title = self.plan_title_var.get().strip() or "plan"
@@ -585,27 +703,109 @@ class MinecraftToolApp:
             self.open_folder(parent)
 
     def create_world_backup(self):
+        from mc_archive import make_zip
+
         world = self.world_path_var.get().strip()
         if not world or not os.path.isdir(world):
             messagebox.showwarning("경로 확인", "유효한 월드 폴더를 선택하세요.")
             return
+        compression = self.backup_compression_var.get()
+        try:
+            limit = max(0.0, float(self.backup_limit_var.get() or 0))
+        except ValueError:
+            messagebox.showwarning("입력 확인", "속도 제한은 숫자(MB/s)로 입력하세요.")
+            return
         parent = os.path.dirname(world)
         base_name = os.path.basename(world.rstrip(os.sep))
         stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         out_base = os.path.join(parent, f"{base_name}_backup_{stamp}")
-        zip_path = shutil.make_archive(out_base, "zip", root_dir=world)
-        self.log(f"백업 생성: {zip_path}")
-        messagebox.showinfo("백업 완료", f"백업 파일이 생성되었습니다:\n{zip_path}")
-        self.open_folder(parent)
+
+        def done(zip_path: str):
+            self.log(f"백업 생성: {zip_path}")
+            messagebox.showinfo("백업 완료", f"백업 파일이 생성되었습니다:\n{zip_path}")
+            self.open_folder(parent)
+
+        self.run_job(
+            "backup",
+            "월드 백업",
+            lambda job: make_zip(world, out_base, progress=job.progress, compression=compression, limit_mbps=limit),
+            done,
+        )
+
+    def _world_or_warn(self) -> str:
+        world = self.world_path_var.get().strip()
+        if not world or not os.path.isdir(world):
+            messagebox.showwarning("경로 확인", "유효한 월드 폴더를 선택하세요.")
+            return ""
+        return world
+
+    def create_world_snapshot(self):
+        from mc_backup import create_snapshot
+
+        world = self._world_or_warn()
+        if not world:
+            return
+
+        def done(result):
+            mb = 1024 * 1024
+            self.log(
+                f"스냅샷 {result.snapshot.id}: 파일 {result.files}개, 읽음 {result.read_bytes / mb:.1f} MB, "
+                f"새 조각 {result.new_chunks}개 ({result.new_bytes / mb:.1f} MB)"
+            )
+            if result.skipped:
+                for rel in result.skipped:
+                    self.log(f"  읽을 수 없어 빠짐: {rel}")
+                messagebox.showwarning("일부 파일 제외", f"읽을 수 없는 파일 {len(result.skipped)}개가 스냅샷에서 빠졌습니다:\n" + "\n".join(result.skipped[:10]))
+
+        self.run_job("backup", "스냅샷 백업", lambda job: create_snapshot(world, progress=job.progress), done)
+
+    def restore_world_snapshot(self):
+        from mc_backup import default_store, restore_snapshot
+
+        world = self._world_or_warn()
+        if not world:
+            return
+        store = default_store(world)
+        path = filedialog.askopenfilename(
+            title="복원할 스냅샷 선택",
+            initialdir=os.path.join(store, "snapshots"),
+            filetypes=[("스냅샷", "*.json.gz")],
+        )
+        if not path:
+            return
+        snapshot_id = os.path.basename(path)[: -len(".json.gz")]
+        target = f"{world.rstrip(os.sep)}_restored_{snapshot_id}"
+        if not messagebox.askyesno("스냅샷 복원", f"{snapshot_id} 스냅샷을 새 폴더에 복원합니다.\n{target}"):
+            return
+
+        def done(count: int):
+            self.log(f"스냅샷 복원: {snapshot_id} → {target} ({count}개 파일)")
+            self.open_folder(os.path.dirname(target))
+
+        self.run_job(
+            "backup", "스냅샷 복원", lambda job: restore_snapshot(store, snapshot_id, target, progress=job.progress), done
+        )
+
+    def prune_world_snapshots(self):
+        from mc_backup import default_store, prune_snapshots
+
+        world = self._world_or_warn()
+        if not world:
+            return
+        if not messagebox.askyesno("스냅샷 정리", "최근 24개, 최근 7일의 하루 1개, 최근 4주의 주 1개만 남기고 지웁니다."):
+            return
+
+        def done(outcome):
+            snapshots, chunks, freed = outcome
+            self.log(f"스냅샷 정리: {snapshots}개 삭제, 조각 {chunks}개 ({freed / (1024 * 1024):.1f} MB) 확보")
+
+        self.run_job("backup", "스냅샷 정리", lambda job: prune_snapshots(default_store(world)), done)
 
     def safe_filename(self, name: str) -> str:
         return "".join(c for c in name if c.isalnum() or c in ("-", "_")) or "untitled"
 
     # --- 탭: 좌표/시간 계산 ---
-    def create_calc_tab(self, notebook: ttk.Notebook):
-        frame = ttk.Frame(notebook, padding=10)
-        notebook.add(frame, text="좌표/시간 계산기")
-
+    def create_calc_tab(self, frame: ttk.Frame):
         convert_box = ttk.LabelFrame(frame, text="네더 ↔ 오버월드 변환 (x,z만 8배 스케일)")
         convert_box.pack(fill="x", pady=5)
         c_row1 = ttk.Frame(convert_box)
@@ -713,10 +913,7 @@ class MinecraftToolApp:
             messagebox.showerror("입력 오류", "숫자를 정확히 입력해주세요.")
 
     # --- 탭: 명령어/JSON 생성 ---
-    def create_command_tab(self, notebook: ttk.Notebook):
-        frame = ttk.Frame(notebook, padding=10)
-        notebook.add(frame, text="명령어 & JSON 생성")
-
+    def create_command_tab(self, frame: ttk.Frame):
         left = ttk.Frame(frame)
         left.pack(side="left", fill="both", expand=True, padx=(0, 8))
 
@@ -834,10 +1031,7 @@ class MinecraftToolApp:
         messagebox.showinfo("복사 완료", "클립보드에 복사되었습니다.")
 
     # --- 탭: 고급 명령어/매크로 ---
-    def create_advanced_tab(self, notebook: ttk.Notebook):
-        frame = ttk.Frame(notebook, padding=10)
-        notebook.add(frame, text="고급 명령어")
-
+    def create_advanced_tab(self, frame: ttk.Frame):
         left = ttk.Frame(frame)
         left.pack(side="left", fill="both", expand=True, padx=(0, 8))
 
@@ -1029,10 +1223,7 @@ class MinecraftToolApp:
         messagebox.showinfo("복사 완료", "클립보드에 복사되었습니다.")
 
     # --- 탭: 개발 고급 도구 (스니펫/어드밴스먼트/검증) ---
-    def create_dev_tools_tab(self, notebook: ttk.Notebook):
-        frame = ttk.Frame(notebook, padding=10)
-        notebook.add(frame, text="개발 고급 도구")
-
+    def create_dev_tools_tab(self, frame: ttk.Frame):
         top = ttk.Frame(frame)
         top.pack(fill="x")
 
@@ -1172,10 +1363,7 @@ class MinecraftToolApp:
         self.log("팩 검증 완료")
 
     # --- 탭: 품질/체크리스트 ---
-    def create_quality_tab(self, notebook: ttk.Notebook):
-        frame = ttk.Frame(notebook, padding=10)
-        notebook.add(frame, text="품질/체크리스트")
-
+    def create_quality_tab(self, frame: ttk.Frame):
         top = ttk.Frame(frame)
         top.pack(fill="x")
 
@@ -1204,6 +1392,7 @@ class MinecraftToolApp:
         ttk.Label(scan_box, text="워크스페이스 내 datapacks/resourcepacks 구조를 빠르게 점검합니다.").pack(anchor="w", padx=6, pady=4)
         ttk.Button(scan_box, text="스캔 실행", command=self.run_workspace_scan).pack(padx=6, pady=4, anchor="w")
 
+        self.create_job_bar(frame, "quality").pack(fill="x", pady=(8, 0))
         out_box = ttk.LabelFrame(frame, text="결과/노트")
         out_box.pack(fill="both", expand=True, pady=8)
         self.quality_output = tk.Text(out_box, height=12, wrap="word")
@@ -1214,20 +1403,22 @@ class MinecraftToolApp:
             var.set(False)
 
     def run_workspace_scan(self):
+        from mc_scanner import scan_workspace
+
         base = self.ensure_workspace()
         if not base:
             return
-        results = scan_workspace(base)
-        self.quality_output.delete("1.0", tk.END)
-        self.quality_output.insert(tk.END, "\n".join(results))
-        self.quality_output.see(tk.END)
-        self.log("워크스페이스 스캔 완료")
 
-    # --- 탭: 배포/자동화 ---
-    def create_automation_tab(self, notebook: ttk.Notebook):
-        frame = ttk.Frame(notebook, padding=10)
-        notebook.add(frame, text="배포/자동화")
+        def show(results):
+            self.quality_output.delete("1.0", tk.END)
+            self.quality_output.insert(tk.END, "\n".join(results))
+            self.quality_output.see(tk.END)
+            self.log("워크스페이스 스캔 완료")
+
+        self.run_job("quality", "워크스페이스 스캔", lambda job: scan_workspace(base, progress=job.progress), show)
 
+    # --- 탭: 배포/자동화 ---
+    def create_automation_tab(self, frame: ttk.Frame):
         upper = ttk.Frame(frame)
         upper.pack(fill="x")
 
@@ -1254,11 +1445,19 @@ class MinecraftToolApp:
         ttk.Label(prof_box, text="프로파일을 선택하면 명령어 리스트를 출력합니다.").pack(anchor="w", padx=6, pady=4)
         ttk.Combobox(prof_box, textvariable=self.profile_choice, values=list(PROFILES.keys()), state="readonly").pack(fill="x", padx=6, pady=2)
         ttk.Button(prof_box, text="출력", command=self.render_profile_commands).pack(anchor="w", padx=6, pady=4)
+        build_row = ttk.Frame(frame)
+        build_row.pack(fill="x", pady=(6, 0))
+        ttk.Checkbutton(
+            build_row, text="릴리스 최소화 (JSON 공백·mcfunction 주석 제거, OS 부산물 제외)", variable=self.pack_minify_var
+        ).pack(side="left")
+        ttk.Button(build_row, text="전체 빌드 (모든 팩 → build/)", command=self.build_all_packs).pack(side="left", padx=8)
+        self.create_job_bar(frame, "zip").pack(fill="x", pady=(6, 0))
 
         # 린트/검사
         lint_box = ttk.LabelFrame(frame, text="mcfunction 린트/검사")
         lint_box.pack(fill="both", expand=True, pady=8)
         ttk.Button(lint_box, text="린트 실행", command=self.run_lint).pack(anchor="w", padx=6, pady=4)
+        self.create_job_bar(lint_box, "lint").pack(fill="x", padx=6)
         self.lint_output = tk.Text(lint_box, height=12, wrap="word")
         self.lint_output.pack(fill="both", expand=True, padx=6, pady=6)
 
@@ -1280,6 +1479,8 @@ class MinecraftToolApp:
                     lb.insert(tk.END, entry)
 
     def zip_selected(self, kind: str):
+        from mc_packbuild import build_pack_zip
+
         base = self.ensure_workspace()
         if not base:
             return
@@ -1295,10 +1496,49 @@ class MinecraftToolApp:
         if not os.path.isdir(target_dir):
             messagebox.showerror("경로 오류", f"폴더를 찾을 수 없습니다: {target_dir}")
             return
-        out_base = os.path.join(base, f"{name}")
-        zip_path = shutil.make_archive(out_base, "zip", root_dir=target_dir)
-        self.log(f"{kind} 압축 생성: {zip_path}")
-        messagebox.showinfo("완료", f"압축 파일이 생성되었습니다:\n{zip_path}")
+        out_path = os.path.join(base, f"{name}.zip")
+        minify = self.pack_minify_var.get()
+
+        def done(result):
+            self.log(
+                f"{kind} 압축 생성: {result.path} (SHA-1 {result.sha1}, "
+                f"캐시 재사용 {result.reused}/{result.entries}개)"
+            )
+            if minify:
+                from mc_minify import format_savings
+
+                for line in format_savings(result.savings, result.junk, result.junk_bytes):
+                    self.log(f"  {line}")
+            messagebox.showinfo(
+                "완료",
+                f"압축 파일이 생성되었습니다:\n{result.path}\n\nresource-pack-sha1={result.sha1}",
+            )
+
+        self.run_job(
+            "zip",
+            f"{name} 압축",
+            lambda job: build_pack_zip(target_dir, out_path, progress=job.progress, minify=minify),
+            done,
+        )
+
+    def build_all_packs(self):
+        from mc_packbuild import build_all
+
+        base = self.ensure_workspace()
+        if not base:
+            return
+        minify = self.pack_minify_var.get()
+
+        def done(outcome):
+            builds, manifest = outcome
+            for b in builds:
+                self.log(
+                    f"  {b.kind}/{b.name}.zip {b.result.size:,} 바이트, SHA-1 {b.result.sha1} ({b.seconds:.2f}초)"
+                )
+            self.log(f"전체 빌드 완료: {len(builds)}개 팩, {manifest}")
+            messagebox.showinfo("완료", f"{len(builds)}개 팩을 빌드했습니다.\n{manifest}")
+
+        self.run_job("zip", "전체 빌드", lambda job: build_all(base, minify=minify, progress=job.progress), done)
 
     def render_profile_commands(self):
         profile = self.profile_choice.get()
@@ -1307,6 +1547,7 @@ class MinecraftToolApp:
             messagebox.showwarning("프로파일 없음", "명령어가 정의되지 않은 프로파일입니다.")
             return
         text = "\n".join(cmds)
+        self.ensure_tab_built(self.tab_ids["create_advanced_tab"])
         if self.advanced_output:
             self.advanced_output.delete("1.0", tk.END)
             self.advanced_output.insert(tk.END, text)
@@ -1314,20 +1555,45 @@ class MinecraftToolApp:
         self.log(f"프로파일 출력: {profile}")
 
     def run_lint(self):
+        from mc_lint import iter_lint
+
         base = self.ensure_workspace()
         if not base:
             return
-        results = lint_workspace(base)
         self.lint_output.delete("1.0", tk.END)
-        self.lint_output.insert(tk.END, "\n".join(results))
-        self.lint_output.see(tk.END)
-        self.log("mcfunction 린트 완료")
 
-    # --- 탭: 편집/유지보수 (검색/치환, 오프라인 가이드) ---
-    def create_maintenance_tab(self, notebook: ttk.Notebook):
-        frame = ttk.Frame(notebook, padding=10)
-        notebook.add(frame, text="편집/유지보수")
+        def work(job):
+            # 끝난 파일부터 모아서 0.1초마다 화면으로 보낸다
+            files = found = 0
+            batch = []
+            last = time.perf_counter()
+            for rel, issues in iter_lint(base, progress=job.progress):
+                files += 1
+                found += len(issues)
+                batch.extend(f"{rel}: {msg}" for msg in issues)
+                if batch and time.perf_counter() - last >= 0.1:
+                    job.emit(batch)
+                    batch, last = [], time.perf_counter()
+            if batch:
+                job.emit(batch)
+            return files, found
+
+        def append(lines):
+            self.lint_output.insert(tk.END, "\n".join(lines) + "\n")
+            self.lint_output.see(tk.END)
+
+        def show(result):
+            files, found = result
+            if not files:
+                append(["검사할 mcfunction 파일이 없습니다."])
+            elif not found:
+                append(["모든 mcfunction 기본 포맷 OK"])
+            self.log(f"mcfunction 린트 완료: {files}개 파일, {found}건")
+
+        self.run_job("lint", "mcfunction 린트", work, show, on_emit=append)
 
+    # --- 탭: 편집/유지보수 (검색/치환, 오프라인 가이드) ---
+    def create_maintenance_tab(self, frame: ttk.Frame):
         top = ttk.Frame(frame)
         top.pack(fill="x")
 
@@ -1338,12 +1604,17 @@ class MinecraftToolApp:
         ttk.Label(f_row1, text="검색").pack(side="left")
         ttk.Entry(f_row1, textvariable=self.find_text, width=20).pack(side="left", padx=4)
         ttk.Button(f_row1, text="검색 실행", command=self.run_find).pack(side="left", padx=4)
+        ttk.Checkbutton(f_row1, text="JSON 포함", variable=self.find_json_var).pack(side="left", padx=4)
         f_row2 = ttk.Frame(find_box)
         f_row2.pack(fill="x", pady=3)
         ttk.Label(f_row2, text="치환 →").pack(side="left")
         ttk.Entry(f_row2, textvariable=self.replace_text, width=20).pack(side="left", padx=4)
         ttk.Button(f_row2, text="치환 실행", command=self.run_replace).pack(side="left", padx=4)
-        ttk.Label(find_box, text="※ 워크스페이스의 모든 mcfunction에서 문자열 기준으로 동작합니다.").pack(anchor="w", padx=6, pady=4)
+        ttk.Checkbutton(f_row2, text="정규식", variable=self.replace_regex_var).pack(side="left", padx=4)
+        ttk.Button(f_row2, text="규칙 파일 치환…", command=self.run_replace_rules).pack(side="left", padx=4)
+        ttk.Button(f_row2, text="되돌리기", command=lambda: self.rollback_last_edit(self.find_output)).pack(side="left", padx=4)
+        ttk.Label(find_box, text="※ 워크스페이스의 모든 mcfunction(검색은 JSON 선택 가능)에서 문자열 기준으로 동작합니다.").pack(anchor="w", padx=6, pady=4)
+        self.create_job_bar(find_box, "find").pack(fill="x", padx=6, pady=(0, 4))
 
         doc_box = ttk.LabelFrame(top, text="오프라인 베스트 프랙티스/FAQ")
         doc_box.pack(side="left", fill="both", expand=True)
@@ -1358,38 +1629,79 @@ class MinecraftToolApp:
         self.doc_view.pack(fill="both", expand=True, padx=6, pady=(0, 6))
 
     def run_find(self):
+        from mc_batch import find_occurrences
+
         base = self.ensure_workspace()
         if not base:
             return
         needle = self.find_text.get()
+        include_json = self.find_json_var.get()
         if not needle:
             messagebox.showwarning("입력 필요", "검색할 문자열을 입력하세요.")
             return
-        matches = find_occurrences(base, needle)
-        lines = []
-        for rel, rows in matches.items():
-            lines.append(f"{rel}: {', '.join(map(str, rows))}행")
-        if not lines:
-            lines.append("검색 결과 없음")
-        self.find_output.delete("1.0", tk.END)
-        self.find_output.insert(tk.END, "\n".join(lines))
-        self.find_output.see(tk.END)
-        self.log(f"검색 완료: '{needle}'")
+
+        def show(matches):
+            lines = []
+            for rel, rows in matches.items():
+                lines.append(f"{rel}: {', '.join(map(str, rows))}행")
+            if not lines:
+                lines.append("검색 결과 없음")
+            self.find_output.delete("1.0", tk.END)
+            self.find_output.insert(tk.END, "\n".join(lines))
+            self.find_output.see(tk.END)
+            self.log(f"검색 완료: '{needle}'")
+
+        self.run_job(
+            "find", "검색", lambda job: find_occurrences(base, needle, progress=job.progress, include_json=include_json), show
+        )
 
     def run_replace(self):
+        from mc_batch import replace_in_workspace
+
         base = self.ensure_workspace()
         if not base:
             return
         needle = self.find_text.get()
         replacement = self.replace_text.get()
+        regex = self.replace_regex_var.get()
         if not needle:
             messagebox.showwarning("입력 필요", "치환할 검색 문자열을 입력하세요.")
             return
-        changed = replace_in_workspace(base, needle, replacement)
-        self.find_output.delete("1.0", tk.END)
-        self.find_output.insert(tk.END, f"치환 완료: 변경된 파일 {changed}개")
-        self.find_output.see(tk.END)
-        self.log(f"치환 완료: '{needle}' -> '{replacement}', 파일 {changed}개")
+
+        def show(changed: int):
+            self.find_output.delete("1.0", tk.END)
+            self.find_output.insert(tk.END, f"치환 완료: 변경된 파일 {changed}개")
+            self.find_output.see(tk.END)
+            self.log(f"치환 완료: '{needle}' -> '{replacement}', 파일 {changed}개")
+
+        self.run_job(
+            "find", "치환", lambda job: replace_in_workspace(base, needle, replacement, progress=job.progress, regex=regex), show
+        )
+
+    def run_replace_rules(self):
+        from mc_batch import replace_rules
+        from mc_replace import load_rules
+
+        base = self.ensure_workspace()
+        if not base:
+            return
+        path = filedialog.askopenfilename(title="치환 규칙 파일 선택", filetypes=[("JSON", "*.json"), ("All", "*.*")])
+        if not path:
+            return
+        try:
+            rules = load_rules(path)
+        except (OSError, ValueError) as exc:
+            messagebox.showerror("규칙 파일 오류", str(exc))
+            return
+
+        def show(outcome):
+            changed, count = outcome
+            self.find_output.delete("1.0", tk.END)
+            self.find_output.insert(tk.END, f"규칙 {len(rules)}개 치환 완료: 변경된 파일 {changed}개, {count}곳")
+            self.find_output.see(tk.END)
+            self.log(f"규칙 파일 치환 완료: {os.path.basename(path)}, 파일 {changed}개")
+
+        self.run_job("find", "규칙 치환", lambda job: replace_rules(base, rules, progress=job.progress), show)
 
     def show_doc(self):
         key = self.doc_choice.get()
@@ -1399,10 +1711,7 @@ class MinecraftToolApp:
         self.doc_view.see(tk.END)
 
     # --- 탭: 출시 문서 (README/변경 로그) ---
-    def create_release_tab(self, notebook: ttk.Notebook):
-        frame = ttk.Frame(notebook, padding=10)
-        notebook.add(frame, text="출시 문서")
-
+    def create_release_tab(self, frame: ttk.Frame):
         top = ttk.Frame(frame)
         top.pack(fill="x")
 
@@ -1440,6 +1749,8 @@ class MinecraftToolApp:
             self.release_pack_combo.current(0)
 
     def generate_readme_doc(self):
+        from mc_release import generate_readme
+
         base = self.ensure_workspace()
         if not base:
             return
@@ -1455,6 +1766,8 @@ class MinecraftToolApp:
         self.log(f"README 미리보기 생성: {pack} {version}")
 
     def generate_changelog_doc(self):
+        from mc_release import generate_changelog
+
         pack = self.release_pack_var.get()
         if not pack:
             messagebox.showwarning("선택 필요", "팩을 선택하세요.")
@@ -1467,32 +1780,31 @@ class MinecraftToolApp:
         self.log(f"변경 로그 미리보기 생성: {pack} {version}")
 
     # --- 탭: 통계/인벤토리 ---
-    def create_stats_tab(self, notebook: ttk.Notebook):
-        frame = ttk.Frame(notebook, padding=10)
-        notebook.add(frame, text="통계/인벤토리")
-
+    def create_stats_tab(self, frame: ttk.Frame):
         ttk.Label(frame, text="워크스페이스 내 팩 개수, mcfunction/텍스처 수, 용량을 요약합니다.").pack(anchor="w", padx=6, pady=4)
         ttk.Button(frame, text="통계 새로고침", command=self.refresh_stats).pack(anchor="w", padx=6, pady=4)
+        self.create_job_bar(frame, "stats").pack(fill="x", padx=6)
 
         self.stats_output = tk.Text(frame, height=16, wrap="word")
         self.stats_output.pack(fill="both", expand=True, padx=6, pady=6)
 
     def refresh_stats(self):
+        from mc_stats import collect_stats, summarize
+
         base = self.ensure_workspace()
         if not base:
             return
-        stats = collect_stats(base)
-        text = summarize(stats)
-        self.stats_output.delete("1.0", tk.END)
-        self.stats_output.insert(tk.END, text)
-        self.stats_output.see(tk.END)
-        self.log("통계 새로고침 완료")
 
-    # --- 탭: 서버 설정 (server.properties 간단 편집) ---
-    def create_server_tab(self, notebook: ttk.Notebook):
-        frame = ttk.Frame(notebook, padding=10)
-        notebook.add(frame, text="서버 설정")
+        def show(text: str):
+            self.stats_output.delete("1.0", tk.END)
+            self.stats_output.insert(tk.END, text)
+            self.stats_output.see(tk.END)
+            self.log("통계 새로고침 완료")
 
+        self.run_job("stats", "통계 집계", lambda job: summarize(collect_stats(base)), show)
+
+    # --- 탭: 서버 설정 (server.properties 간단 편집) ---
+    def create_server_tab(self, frame: ttk.Frame):
         ttk.Label(frame, text="server.properties 경로를 선택해 주요 옵션을 편집합니다.").pack(anchor="w", padx=6, pady=4)
         path_row = ttk.Frame(frame)
         path_row.pack(fill="x", pady=4)
@@ -1515,6 +1827,8 @@ class MinecraftToolApp:
             self.server_props_path.set(path)
 
     def load_server_props(self):
+        from mc_serverprops import load_properties
+
         path = self.server_props_path.get().strip()
         if not path:
             messagebox.showwarning("경로 없음", "server.properties 파일을 선택하세요.")
@@ -1528,6 +1842,8 @@ class MinecraftToolApp:
             messagebox.showerror("불러오기 실패", str(exc))
 
     def save_server_props(self):
+        from mc_serverprops import ServerProps, save_properties
+
         path = self.server_props_path.get().strip()
         if not path:
             messagebox.showwarning("경로 없음", "server.properties 파일을 선택하세요.")
@@ -1541,10 +1857,7 @@ class MinecraftToolApp:
             messagebox.showerror("저장 실패", str(exc))
 
     # --- 탭: 레시피 생성 (shaped/shapeless) ---
-    def create_recipe_tab(self, notebook: ttk.Notebook):
-        frame = ttk.Frame(notebook, padding=10)
-        notebook.add(frame, text="레시피 생성")
-
+    def create_recipe_tab(self, frame: ttk.Frame):
         top = ttk.Frame(frame)
         top.pack(fill="x")
         ttk.Label(top, text="네임스페이스").pack(side="left")
@@ -1587,6 +1900,8 @@ class MinecraftToolApp:
         ttk.Button(btns, text="지우기", command=lambda: self.recipe_output.delete("1.0", tk.END)).pack(side="left", padx=4)
 
     def build_shaped_recipe(self):
+        from mc_recipe import shaped_from_grid
+
         try:
             grid_values = [v.get().strip() for v in self.recipe_grid]
             recipe = shaped_from_grid(grid_values, self.recipe_result.get().strip(), self.recipe_count.get())
@@ -1599,6 +1914,8 @@ class MinecraftToolApp:
         self.log("Shaped 레시피 생성")
 
     def build_shapeless_recipe(self):
+        from mc_recipe import build_shapeless
+
         try:
             items = [x.strip() for x in self.shapeless_items.get().split(",")]
             data = build_shapeless(items, self.recipe_result.get().strip(), self.recipe_count.get())
@@ -1639,10 +1956,7 @@ class MinecraftToolApp:
         messagebox.showinfo("복사 완료", "클립보드에 복사되었습니다.")
 
     # --- 탭: 파티클/이펙트 경로 생성 ---
-    def create_particle_tab(self, notebook: ttk.Notebook):
-        frame = ttk.Frame(notebook, padding=10)
-        notebook.add(frame, text="파티클/이펙트")
-
+    def create_particle_tab(self, frame: ttk.Frame):
         top = ttk.Frame(frame)
         top.pack(fill="x")
         ttk.Label(top, text="파티클 ID").pack(side="left")
@@ -1699,6 +2013,8 @@ class MinecraftToolApp:
         ttk.Button(p_btns, text="지우기", command=lambda: self.particle_output.delete("1.0", tk.END)).pack(side="left", padx=4)
 
     def build_particle_line(self):
+        from mc_particles import generate_line_commands
+
         try:
             cmds = generate_line_commands(
                 self.particle_id.get().strip(),
@@ -1716,6 +2032,8 @@ class MinecraftToolApp:
         self.log("파티클 라인 생성")
 
     def build_particle_circle(self):
+        from mc_particles import generate_circle_commands
+
         try:
             cmds = generate_circle_commands(
                 self.particle_id.get().strip(),
@@ -1759,10 +2077,7 @@ class MinecraftToolApp:
         messagebox.showinfo("저장 완료", f"mcfunction이 저장되었습니다:\n{path}")
 
     # --- 탭: 텍스트/채팅 (그라디언트) ---
-    def create_text_tab(self, notebook: ttk.Notebook):
-        frame = ttk.Frame(notebook, padding=10)
-        notebook.add(frame, text="텍스트/채팅")
-
+    def create_text_tab(self, frame: ttk.Frame):
         top = ttk.Frame(frame)
         top.pack(fill="x")
         ttk.Label(top, text="대상").pack(side="left")
@@ -1797,6 +2112,8 @@ class MinecraftToolApp:
         ttk.Label(frame, text=hint).pack(anchor="w", padx=6, pady=4)
 
     def build_gradient_tellraw(self):
+        from mc_text import gradient_text_payload
+
         try:
             payload = gradient_text_payload(
                 self.grad_text_var.get(),
@@ -1814,6 +2131,8 @@ class MinecraftToolApp:
         self.log("그라디언트 tellraw 생성")
 
     def build_gradient_title(self):
+        from mc_text import gradient_text_payload
+
         try:
             payload = gradient_text_payload(
                 self.grad_text_var.get(),
@@ -1839,10 +2158,7 @@ class MinecraftToolApp:
         messagebox.showinfo("복사 완료", "클립보드에 복사되었습니다.")
 
     # --- 탭: 태그/pack.mcmeta ---
-    def create_tag_meta_tab(self, notebook: ttk.Notebook):
-        frame = ttk.Frame(notebook, padding=10)
-        notebook.add(frame, text="태그/메타")
-
+    def create_tag_meta_tab(self, frame: ttk.Frame):
         top = ttk.Frame(frame)
         top.pack(fill="x")
 
@@ -1887,6 +2203,8 @@ class MinecraftToolApp:
         self.meta_output = self.tag_output
 
     def create_tag_file(self):
+        from mc_tags import build_tag_json, save_tag
+
         base = self.ensure_workspace()
         if not base:
             return
@@ -1910,6 +2228,8 @@ class MinecraftToolApp:
         messagebox.showinfo("저장 완료", f"Tag 파일이 저장되었습니다:\n{path}")
 
     def update_packmeta(self, kind: str):
+        from mc_packmeta import bulk_update
+
         base = self.ensure_workspace()
         if not base:
             return
@@ -1922,27 +2242,29 @@ class MinecraftToolApp:
         self.log(msg)
 
     # --- 탭: 비교/동기화 ---
-    def create_diff_tab(self, notebook: ttk.Notebook):
-        frame = ttk.Frame(notebook, padding=10)
-        notebook.add(frame, text="비교/동기화")
-
+    def create_diff_tab(self, frame: ttk.Frame):
         ttk.Label(frame, text="두 개의 팩 또는 폴더를 비교해 추가/수정/삭제 파일을 보여주고, src→dst로 동기화합니다.").pack(anchor="w", padx=6, pady=4)
         row1 = ttk.Frame(frame)
         row1.pack(fill="x", pady=3)
         ttk.Label(row1, text="소스(src)").pack(side="left")
         ttk.Entry(row1, textvariable=self.diff_src).pack(side="left", fill="x", expand=True, padx=4)
         ttk.Button(row1, text="폴더 선택", command=lambda: self.select_diff_path(self.diff_src)).pack(side="left", padx=4)
+        ttk.Button(row1, text="zip 선택", command=lambda: self.select_diff_zip(self.diff_src)).pack(side="left", padx=4)
 
         row2 = ttk.Frame(frame)
         row2.pack(fill="x", pady=3)
         ttk.Label(row2, text="대상(dst)").pack(side="left")
         ttk.Entry(row2, textvariable=self.diff_dst).pack(side="left", fill="x", expand=True, padx=4)
         ttk.Button(row2, text="폴더 선택", command=lambda: self.select_diff_path(self.diff_dst)).pack(side="left", padx=4)
+        ttk.Button(row2, text="zip 선택", command=lambda: self.select_diff_zip(self.diff_dst)).pack(side="left", padx=4)
 
         btns = ttk.Frame(frame)
         btns.pack(fill="x", pady=6)
         ttk.Button(btns, text="비교 실행", command=self.run_diff_compare).pack(side="left", padx=4)
-        ttk.Button(btns, text="src→dst 동기화(추가/수정)", command=self.run_diff_sync).pack(side="left", padx=4)
+        ttk.Button(btns, text="src→dst 동기화", command=self.run_diff_sync).pack(side="left", padx=4)
+        ttk.Checkbutton(btns, text="미러(dst에만 있는 파일 삭제)", variable=self.diff_mirror).pack(side="left", padx=4)
+        ttk.Checkbutton(btns, text="zip 내용 검증", variable=self.diff_verify).pack(side="left", padx=4)
+        self.create_job_bar(frame, "diff").pack(fill="x", pady=(0, 4))
 
         out_box = ttk.LabelFrame(frame, text="결과")
         out_box.pack(fill="both", expand=True, pady=6)
@@ -1954,23 +2276,38 @@ class MinecraftToolApp:
         if path:
             var.set(path)
 
+    def select_diff_zip(self, var: tk.StringVar):
+        path = filedialog.askopenfilename(title="zip 선택", filetypes=[("zip", "*.zip"), ("모든 파일", "*.*")])
+        if path:
+            var.set(path)
+
     def run_diff_compare(self):
+        from mc_diff import DiffResult, compare_dirs, is_zip
+
         src = self.diff_src.get().strip()
         dst = self.diff_dst.get().strip()
         if not (src and dst):
             messagebox.showwarning("경로 필요", "src와 dst 폴더를 모두 지정하세요.")
             return
-        if not (os.path.isdir(src) and os.path.isdir(dst)):
-            messagebox.showwarning("경로 확인", "유효한 폴더를 입력하세요.")
+        if not all(os.path.isdir(p) or is_zip(p) for p in (src, dst)):
+            messagebox.showwarning("경로 확인", "유효한 폴더 또는 zip 파일을 입력하세요.")
             return
-        diff = compare_dirs(src, dst)
-        self.diff_last = diff
-        lines = diff.summary_lines()
-        self.diff_output.delete("1.0", tk.END)
-        self.diff_output.insert(tk.END, "\n".join(lines))
-        self.log("비교 완료")
+        verify = self.diff_verify.get()
+
+        def show(diff: DiffResult):
+            self.diff_last = diff
+            lines = diff.summary_lines()
+            self.diff_output.delete("1.0", tk.END)
+            self.diff_output.insert(tk.END, "\n".join(lines))
+            self.log("비교 완료")
+
+        self.run_job(
+            "diff", "폴더 비교", lambda job: compare_dirs(src, dst, progress=job.progress, verify=verify), show
+        )
 
     def run_diff_sync(self):
+        from mc_diff import sync_dirs
+
         if not self.diff_last:
             messagebox.showwarning("먼저 비교", "비교를 먼저 실행하세요.")
             return
@@ -1979,15 +2316,26 @@ class MinecraftToolApp:
         if not (src and dst):
             messagebox.showwarning("경로 필요", "src와 dst 폴더를 모두 지정하세요.")
             return
-        copied = sync_dirs(src, dst, self.diff_last)
-        self.diff_output.insert(tk.END, f"\n동기화 완료: 복사 {copied}개\n")
-        self.diff_output.see(tk.END)
-        self.log(f"동기화 완료: {copied}개 복사")
+        diff = self.diff_last
+        mirror = self.diff_mirror.get()
+        if mirror and diff.removed and not messagebox.askyesno(
+            "미러 동기화", f"dst에만 있는 파일 {len(diff.removed)}개가 삭제(또는 이동)됩니다. 계속할까요?"
+        ):
+            return
+
+        def show(report):
+            self.diff_output.insert(tk.END, f"\n동기화 완료: {report.summary()}\n")
+            self.diff_output.see(tk.END)
+            self.log(f"동기화 완료: {report.summary()}")
+            self.diff_last = None  # dst가 바뀌었으므로 다시 비교해야 한다
+
+        self.run_job(
+            "diff", "동기화", lambda job: sync_dirs(src, dst, diff, progress=job.progress, mirror=mirror), show
+        )
 
     # --- 탭: 마이그레이션/예약 실행 ---
-    def create_migration_tab(self, notebook: ttk.Notebook):
-        frame = ttk.Frame(notebook, padding=10)
-        notebook.add(frame, text="마이그레이션/스케줄")
+    def create_migration_tab(self, frame: ttk.Frame):
+        from mc_migration import GUIDE_LINES
 
         top = ttk.Frame(frame)
         top.pack(fill="x")
@@ -1996,8 +2344,16 @@ class MinecraftToolApp:
         mig_box.pack(side="left", fill="both", expand=True, padx=(0, 8))
         ttk.Radiobutton(mig_box, text="데이터 팩", variable=self.migrate_kind, value="datapacks").pack(anchor="w", padx=6, pady=2)
         ttk.Radiobutton(mig_box, text="리소스 팩", variable=self.migrate_kind, value="resourcepacks").pack(anchor="w", padx=6, pady=2)
+        m_row = ttk.Frame(mig_box)
+        m_row.pack(fill="x", padx=6, pady=2)
+        ttk.Label(m_row, text="규칙 파일 (비우면 기본)").pack(side="left")
+        ttk.Entry(m_row, textvariable=self.migrate_rules_path, width=24).pack(side="left", fill="x", expand=True, padx=4)
+        ttk.Button(m_row, text="찾기", command=self.pick_migration_rules).pack(side="left")
         ttk.Button(mig_box, text="드라이 런 (미리보기)", command=lambda: self.run_migration(dry_run=True)).pack(anchor="w", padx=6, pady=4)
         ttk.Button(mig_box, text="실제 적용 (치환)", command=lambda: self.run_migration(dry_run=False)).pack(anchor="w", padx=6, pady=2)
+        ttk.Button(mig_box, text="마지막 적용 되돌리기", command=lambda: self.rollback_last_edit(self.migrate_output)).pack(
+            anchor="w", padx=6, pady=2
+        )
         ttk.Label(mig_box, text="가이드:").pack(anchor="w", padx=6, pady=(6, 2))
         for line in GUIDE_LINES:
             ttk.Label(mig_box, text="- " + line).pack(anchor="w", padx=10)
@@ -2016,31 +2372,75 @@ class MinecraftToolApp:
         ttk.Entry(s_row2, textvariable=self.schedule_entries).pack(side="left", fill="x", expand=True, padx=4)
         ttk.Button(sched_box, text="스케줄 생성", command=self.build_schedule_file).pack(anchor="w", padx=6, pady=4)
 
+        self.create_job_bar(frame, "migration").pack(fill="x", pady=(8, 0))
         out_box = ttk.LabelFrame(frame, text="결과")
         out_box.pack(fill="both", expand=True, pady=8)
         self.migrate_output = tk.Text(out_box, height=14, wrap="word")
         self.migrate_output.pack(fill="both", expand=True, padx=6, pady=6)
         self.schedule_output = self.migrate_output
 
+    def rollback_last_edit(self, output):
+        """일괄 치환/마이그레이션/네임스페이스 변경 중 가장 최근 작업을 저널로 되돌린다."""
+        from mc_journal import journal_busy, list_journals, rollback_last
+
+        base = self.ensure_workspace()
+        if not base:
+            return
+        if journal_busy(base):
+            messagebox.showwarning("작업 중", "일괄 수정 작업이 아직 진행 중입니다. 끝난 뒤 되돌리세요.")
+            return
+        pending = [j for j in list_journals(base) if j.state != "rolled_back"]
+        if not pending:
+            messagebox.showinfo("되돌리기", "되돌릴 작업이 없습니다.")
+            return
+        last = pending[0]
+        if not messagebox.askyesno("되돌리기", f"'{last.label}' ({last.created}) 작업을 되돌릴까요?"):
+            return
+
+        def show(logs):
+            output.delete("1.0", tk.END)
+            output.insert(tk.END, "\n".join(logs))
+            output.see(tk.END)
+            self.log(f"되돌리기 완료: {last.label}")
+
+        self.run_job("rollback", "되돌리기", lambda job: rollback_last(base), show)
+
+    def pick_migration_rules(self):
+        path = filedialog.askopenfilename(title="마이그레이션 규칙 파일 선택", filetypes=[("JSON", "*.json"), ("All", "*.*")])
+        if path:
+            self.migrate_rules_path.set(path)
+
     def run_migration(self, dry_run: bool):
+        from mc_migration import apply_migration
+        from mc_replace import load_rules
+
         base = self.ensure_workspace()
         if not base:
             return
         kind = self.migrate_kind.get()
-        if not dry_run:
+        rules = None
+        rules_path = self.migrate_rules_path.get().strip()
+        if rules_path:
             try:
-                backup = backup_before_migrate(base, kind)
-                self.log(f"백업 생성: {backup}")
-            except Exception as exc:
-                messagebox.showerror("백업 실패", str(exc))
+                rules = load_rules(rules_path)
+            except (OSError, ValueError) as exc:
+                messagebox.showerror("규칙 파일 오류", str(exc))
                 return
-        results = apply_migration(base, kind, dry_run=dry_run)
-        self.migrate_output.delete("1.0", tk.END)
-        self.migrate_output.insert(tk.END, "\n".join(results))
-        suffix = "(드라이 런)" if dry_run else "(적용됨)"
-        self.log(f"마이그레이션 완료 {suffix}")
+
+        def work(job):
+            return apply_migration(base, kind, dry_run=dry_run, progress=job.progress, rules=rules)
+
+        def show(results):
+            self.migrate_output.delete("1.0", tk.END)
+            self.migrate_output.insert(tk.END, "\n".join(results))
+            suffix = "(드라이 런)" if dry_run else "(적용됨)"
+            self.log(f"마이그레이션 완료 {suffix}")
+
+        self.run_job("migration", "마이그레이션", work, show)
 
     def build_schedule_file(self):
+        from mc_schedules import ScheduledCommand, build_schedule
+
         base = self.ensure_workspace()
         if not base:
             return
@@ -2070,10 +2470,7 @@ class MinecraftToolApp:
         self.log(f"스케줄 함수 저장: {path}")
 
     # --- 탭: 아이템/NBT 빌더 ---
-    def create_item_tab(self, notebook: ttk.Notebook):
-        frame = ttk.Frame(notebook, padding=10)
-        notebook.add(frame, text="아이템/NBT")
-
+    def create_item_tab(self, frame: ttk.Frame):
         top = ttk.Frame(frame)
         top.pack(fill="x")
         ttk.Label(top, text="대상").pack(side="left")
@@ -2112,6 +2509,8 @@ class MinecraftToolApp:
         ttk.Button(i_btns, text="지우기", command=lambda: self.item_output.delete("1.0", tk.END)).pack(side="left", padx=4)
 
     def build_item_command(self):
+        from mc_item import build_give_command, parse_enchants
+
         try:
             lore_list = [x.strip() for x in self.item_lore.get().split(",") if x.strip()]
             ench = parse_enchants(self.item_enchants.get())
@@ -2141,10 +2540,7 @@ class MinecraftToolApp:
         messagebox.showinfo("복사 완료", "클립보드에 복사되었습니다.")
 
     # --- 탭: 사운드 (sounds.json) ---
-    def create_sound_tab(self, notebook: ttk.Notebook):
-        frame = ttk.Frame(notebook, padding=10)
-        notebook.add(frame, text="사운드")
-
+    def create_sound_tab(self, frame: ttk.Frame):
         top = ttk.Frame(frame)
         top.pack(fill="x")
         ttk.Label(top, text="네임스페이스").pack(side="left")
@@ -2174,6 +2570,8 @@ class MinecraftToolApp:
         ttk.Label(frame, text=hint).pack(anchor="w", padx=6, pady=4)
 
     def save_sound_event(self):
+        from mc_sounds import build_sound_event, parse_sound_list, update_sounds_file
+
         base = self.ensure_workspace()
         if not base:
             return
@@ -2199,10 +2597,7 @@ class MinecraftToolApp:
         messagebox.showinfo("복사 완료", "클립보드에 복사되었습니다.")
 
     # --- 탭: 로그/언어 검사 ---
-    def create_log_lang_tab(self, notebook: ttk.Notebook):
-        frame = ttk.Frame(notebook, padding=10)
-        notebook.add(frame, text="로그/언어")
-
+    def create_log_lang_tab(self, frame: ttk.Frame):
         top = ttk.Frame(frame)
         top.pack(fill="x")
 
@@ -2213,7 +2608,13 @@ class MinecraftToolApp:
         ttk.Entry(l_row, textvariable=self.log_path_var).pack(side="left", fill="x", expand=True, padx=4)
         ttk.Button(l_row, text="파일 선택", command=self.browse_log_file).pack(side="left", padx=4)
         ttk.Button(l_row, text="파싱", command=self.parse_log_file).pack(side="left", padx=4)
+        self.log_follow_btn = ttk.Button(l_row, text="실시간 추적", command=self.toggle_log_follow)
+        self.log_follow_btn.pack(side="left", padx=4)
+        ttk.Button(l_row, text="전체 로그 분석", command=self.analyze_log_folder).pack(side="left", padx=4)
         ttk.Label(log_box, text="ERROR/Exception/Caused by 등을 포함한 최근 로그를 뽑아 보여줍니다.").pack(anchor="w", padx=6, pady=2)
+        ttk.Label(log_box, text="실시간 추적: 새로 쓰인 줄만 검사해 오류를 이어 붙입니다 (로그 회전 시 .log.gz에서 이어 읽음).").pack(anchor="w", padx=6, pady=2)
+        ttk.Label(log_box, text="전체 로그 분석: 같은 폴더의 날짜별 .log.gz까지 모아 오류 종류별 횟수와 처음 나온 시각을 보여줍니다.").pack(anchor="w", padx=6, pady=2)
+        self.create_job_bar(log_box, "logstats").pack(fill="x", padx=6, pady=(0, 4))
 
         lang_box = ttk.LabelFrame(top, text="lang 누락 키 검사(en_us ↔ ko_kr)")
         lang_box.pack(side="left", fill="both", expand=True)
@@ -2236,6 +2637,8 @@ class MinecraftToolApp:
             self.log_path_var.set(path)
 
     def parse_log_file(self):
+        from mc_log import parse_log
+
         path = self.log_path_var.get().strip()
         if not path:
             messagebox.showwarning("파일 필요", "latest.log 파일을 선택하세요.")
@@ -2250,6 +2653,79 @@ class MinecraftToolApp:
         self.log_output.see(tk.END)
         self.log(f"로그 파싱: {path}")
 
+    def analyze_log_folder(self):
+        from mc_logstats import analyze_logs, format_stats
+
+        path = self.log_path_var.get().strip()
+        folder = os.path.dirname(path) if os.path.isfile(path) else path
+        if not folder or not os.path.isdir(folder):
+            folder = filedialog.askdirectory(title="logs 폴더(또는 서버 폴더) 선택")
+            if not folder:
+                return
+
+        def done(stats):
+            self.log_output.delete("1.0", tk.END)
+            self.log_output.insert(tk.END, "\n".join(format_stats(stats)))
+            self.log(f"로그 분석: {folder} ({stats.files}개 파일, {len(stats.groups)}종류, {stats.seconds:.2f}초)")
+
+        self.run_job("logstats", "로그 분석", lambda job: analyze_logs(folder, progress=job.progress), done)
+
+    # --- 로그 실시간 추적 ---
+    def toggle_log_follow(self):
+        if self.log_follower is not None:
+            self.stop_log_follow()
+            self.log("로그 실시간 추적 정지")
+            return
+        from mc_log import LogFollower
+
+        path = self.log_path_var.get().strip()
+        if not path:
+            messagebox.showwarning("파일 필요", "latest.log 파일을 선택하세요.")
+            return
+        if not os.path.isfile(path):
+            messagebox.showerror("파일 없음", path)
+            return
+        self.parse_log_file()  # 지금까지의 오류를 먼저 보여 주고 그 뒤부터 따라간다
+        self.log_follower = LogFollower(path)
+        self.log_follow_delay = LOG_FOLLOW_MIN_MS
+        self.log_follow_btn.config(text="추적 정지")
+        self.log(f"로그 실시간 추적 시작: {path}")
+        self.log_follow_job = self.root.after(self.log_follow_delay, self.poll_log_follow)
+
+    def stop_log_follow(self):
+        if self.log_follow_job:
+            self.root.after_cancel(self.log_follow_job)
+        self.log_follow_job = None
+        self.log_follower = None
+        if self.log_follow_btn is not None:
+            self.log_follow_btn.config(text="실시간 추적")
+
+    def poll_log_follow(self):
+        """새 줄이 있으면 한 번에 붙이고, 조용하면 폴링 간격을 늘려 유휴 시 CPU를 거의 쓰지 않는다."""
+        follower = self.log_follower
+        if follower is None:
+            return
+        rotations, offset = follower.rotations, follower.offset
+        try:
+            hits = follower.poll()
+        except OSError as exc:
+            self.stop_log_follow()
+            self.log(f"로그 추적 중단: {exc}")
+            return
+        if follower.rotations != rotations:
+            hits.insert(0, "--- 로그 회전됨 ---")
+        if hits:
+            self.log_output.insert(tk.END, "\n" + "\n".join(hits))
+            lines = int(self.log_output.index("end-1c").split(".")[0])
+            if lines > LOG_FOLLOW_MAX_LINES:
+                self.log_output.delete("1.0", f"{lines - LOG_FOLLOW_MAX_LINES}.0")
+            self.log_output.see(tk.END)
+        if follower.offset != offset or follower.rotations != rotations:
+            self.log_follow_delay = LOG_FOLLOW_MIN_MS
+        else:
+            self.log_follow_delay = min(self.log_follow_delay * 2, LOG_FOLLOW_MAX_MS)
+        self.log_follow_job = self.root.after(self.log_follow_delay, self.poll_log_follow)
+
     def refresh_lang_packs(self):
         base = self.workspace_var.get().strip()
         if not base:
@@ -2260,6 +2736,8 @@ class MinecraftToolApp:
             self.lang_combo.current(0)
 
     def run_lang_check(self):
+        from mc_langcheck import check_lang_pack
+
         base = self.ensure_workspace()
         if not base:
             return
@@ -2285,10 +2763,7 @@ class MinecraftToolApp:
         self.log(f"lang 검사: {pack}")
 
     # --- 탭: JSON/모델 검사 ---
-    def create_schema_model_tab(self, notebook: ttk.Notebook):
-        frame = ttk.Frame(notebook, padding=10)
-        notebook.add(frame, text="JSON/모델 검사")
-
+    def create_schema_model_tab(self, frame: ttk.Frame):
         top = ttk.Frame(frame)
         top.pack(fill="x")
 
@@ -2300,6 +2775,7 @@ class MinecraftToolApp:
         ttk.Button(s_row, text="파일 선택", command=self.browse_schema_file).pack(side="left", padx=4)
         ttk.Button(s_row, text="검사", command=self.run_schema_file).pack(side="left", padx=4)
         ttk.Button(schema_box, text="워크스페이스 전체 스캔", command=self.scan_workspace_schema).pack(anchor="w", padx=6, pady=4)
+        self.create_job_bar(schema_box, "schema").pack(fill="x", padx=6, pady=(0, 4))
 
         model_box = ttk.LabelFrame(top, text="모델 텍스처 누락 검사")
         model_box.pack(side="left", fill="both", expand=True)
@@ -2322,6 +2798,8 @@ class MinecraftToolApp:
             self.schema_file_var.set(path)
 
     def run_schema_file(self):
+        from mc_schema import validate_file
+
         path = self.schema_file_var.get().strip()
         if not path:
             messagebox.showwarning("파일 필요", "검사할 JSON 파일을 선택하세요.")
@@ -2337,18 +2815,19 @@ class MinecraftToolApp:
         self.log(f"JSON 검사: {path}")
 
     def scan_workspace_schema(self):
+        from mc_schema import scan_workspace_json
+
         base = self.ensure_workspace()
         if not base:
             return
-        try:
-            results = scan_workspace_json(base)
-        except Exception as exc:
-            messagebox.showerror("스캔 실패", str(exc))
-            return
-        self.schema_output.delete("1.0", tk.END)
-        self.schema_output.insert(tk.END, "\n".join(results))
-        self.schema_output.see(tk.END)
-        self.log("워크스페이스 JSON 스캔 완료")
+
+        def show(results):
+            self.schema_output.delete("1.0", tk.END)
+            self.schema_output.insert(tk.END, "\n".join(results))
+            self.schema_output.see(tk.END)
+            self.log("워크스페이스 JSON 스캔 완료")
+
+        self.run_job("schema", "JSON 스캔", lambda job: scan_workspace_json(base, progress=job.progress), show)
 
     def refresh_model_packs(self):
         base = self.workspace_var.get().strip()
@@ -2360,6 +2839,8 @@ class MinecraftToolApp:
             self.model_combo.current(0)
 
     def run_model_check(self):
+        from mc_modelcheck import check_models
+
         base = self.ensure_workspace()
         if not base:
             return
@@ -2378,10 +2859,7 @@ class MinecraftToolApp:
         self.log(f"모델 검사: {pack}")
 
     # --- 탭: 네임스페이스/리포트 ---
-    def create_namespace_report_tab(self, notebook: ttk.Notebook):
-        frame = ttk.Frame(notebook, padding=10)
-        notebook.add(frame, text="네임스페이스/리포트")
-
+    def create_namespace_report_tab(self, frame: ttk.Frame):
         ns_box = ttk.LabelFrame(frame, text="네임스페이스 변경 (데이터팩)")
         ns_box.pack(fill="x", pady=4)
         ns_row = ttk.Frame(ns_box)
@@ -2391,7 +2869,8 @@ class MinecraftToolApp:
         ttk.Label(ns_row, text="new").pack(side="left")
         ttk.Entry(ns_row, textvariable=self.ns_new, width=14).pack(side="left", padx=4)
         ttk.Button(ns_row, text="리네임 실행", command=self.run_namespace_rename).pack(side="left", padx=4)
-        ttk.Label(ns_box, text="폴더명 및 파일 내 old: 참조를 new:로 치환합니다. 백업 후 사용을 권장합니다.").pack(anchor="w", padx=6, pady=2)
+        ttk.Button(ns_row, text="되돌리기", command=lambda: self.rollback_last_edit(self.ns_output)).pack(side="left", padx=4)
+        ttk.Label(ns_box, text="폴더명 및 파일 내 old: 참조를 new:로 치환합니다. 변경은 저널에 기록되어 되돌릴 수 있습니다.").pack(anchor="w", padx=6, pady=2)
 
         rep_box = ttk.LabelFrame(frame, text="워크스페이스 리포트 (Markdown)")
         rep_box.pack(fill="x", pady=4)
@@ -2404,6 +2883,8 @@ class MinecraftToolApp:
         self.report_output = self.ns_output
 
     def run_namespace_rename(self):
+        from mc_namespace import rename_namespace
+
         base = self.ensure_workspace()
         if not base:
             return
@@ -2423,6 +2904,8 @@ class MinecraftToolApp:
         self.log(f"네임스페이스 변경: {old} -> {new}")
 
     def build_report(self):
+        from mc_report import build_pack_report
+
         base = self.ensure_workspace()
         if not base:
             return
@@ -2433,10 +2916,7 @@ class MinecraftToolApp:
         self.log("워크스페이스 리포트 생성")
 
     # --- 탭: 구조 블록 NBT 확인 ---
-    def create_structure_tab(self, notebook: ttk.Notebook):
-        frame = ttk.Frame(notebook, padding=10)
-        notebook.add(frame, text="구조/NBT")
-
+    def create_structure_tab(self, frame: ttk.Frame):
         ttk.Label(frame, text=".nbt 구조 파일을 열어 크기/메타를 확인합니다. nbtlib이 있으면 더 자세한 정보를 보여줄 수 있습니다.").pack(anchor="w", padx=6, pady=4)
         row = ttk.Frame(frame)
         row.pack(fill="x", pady=4)
@@ -2455,6 +2935,8 @@ class MinecraftToolApp:
             self.nbt_path_var.set(path)
 
     def read_nbt_file(self):
+        from mc_structure import read_nbt
+
         path = self.nbt_path_var.get().strip()
         if not path:
             messagebox.showwarning("파일 필요", ".nbt 파일을 선택하세요.")
@@ -2470,10 +2952,7 @@ class MinecraftToolApp:
         self.log(f"NBT 읽기: {path}")
 
     # --- 탭: 함수 참조 그래프 ---
-    def create_callgraph_tab(self, notebook: ttk.Notebook):
-        frame = ttk.Frame(notebook, padding=10)
-        notebook.add(frame, text="함수 그래프")
-
+    def create_callgraph_tab(self, frame: ttk.Frame):
         top = ttk.Frame(frame)
         top.pack(fill="x")
         ttk.Label(top, text="시작 함수(콤마)").pack(side="left")
@@ -2481,6 +2960,7 @@ class MinecraftToolApp:
         ttk.Label(top, text="깊이").pack(side="left")
         ttk.Entry(top, textvariable=self.graph_depth, width=6).pack(side="left", padx=4)
         ttk.Button(top, text="그래프 생성", command=self.run_callgraph).pack(side="left", padx=4)
+        self.create_job_bar(frame, "callgraph").pack(fill="x", pady=(6, 0))
 
         out_box = ttk.LabelFrame(frame, text="결과")
         out_box.pack(fill="both", expand=True, pady=8)
@@ -2491,27 +2971,34 @@ class MinecraftToolApp:
         ttk.Label(frame, text=hint).pack(anchor="w", padx=6, pady=4)
 
     def run_callgraph(self):
+        from mc_callgraph import build_call_graph, reachable_from
+
         base = self.ensure_workspace()
         if not base:
             return
-        graph, id_to_path = build_call_graph(base)
         starts_text = self.graph_start.get().strip()
-        if starts_text:
-            starts = [s.strip() for s in starts_text.split(",") if s.strip()]
-        else:
-            # 기본 시작점: load/tick
-            starts = [fid for fid in id_to_path if fid.endswith("load") or fid.endswith("tick")]
-        if not starts:
-            messagebox.showwarning("시작점 없음", "시작 함수를 지정하거나 load/tick이 존재하는지 확인하세요.")
-            return
-        reach = reachable_from(graph, starts, depth=max(0, self.graph_depth.get()))
-        lines = [f"시작: {', '.join(starts)}", f"도달 함수 {len(reach)}개:"]
-        for fid in sorted(reach):
-            lines.append(f"- {fid}")
-        self.graph_output.delete("1.0", tk.END)
-        self.graph_output.insert(tk.END, "\n".join(lines))
-        self.graph_output.see(tk.END)
-        self.log("함수 그래프 생성 완료")
+        depth = max(0, self.graph_depth.get())
+
+        def show(built):
+            graph, id_to_path = built
+            if starts_text:
+                starts = [s.strip() for s in starts_text.split(",") if s.strip()]
+            else:
+                # 기본 시작점: load/tick
+                starts = [fid for fid in id_to_path if fid.endswith("load") or fid.endswith("tick")]
+            if not starts:
+                messagebox.showwarning("시작점 없음", "시작 함수를 지정하거나 load/tick이 존재하는지 확인하세요.")
+                return
+            reach = reachable_from(graph, starts, depth=depth)
+            lines = [f"시작: {', '.join(starts)}", f"도달 함수 {len(reach)}개:"]
+            for fid in sorted(reach):
+                lines.append(f"- {fid}")
+            self.graph_output.delete("1.0", tk.END)
+            self.graph_output.insert(tk.END, "\n".join(lines))
+            self.graph_output.see(tk.END)
+            self.log("함수 그래프 생성 완료")
+
+        self.run_job("callgraph", "함수 그래프", lambda job: build_call_graph(base, progress=job.progress), show)
 
     # --- 탭 버튼(3줄) ---
     def rebuild_tab_bar(self):
@@ -2552,36 +3039,8 @@ class MinecraftToolApp:
     # --- 탭 라벨 관리 / 언어 ---
     def setup_tab_labels(self):
         tabs = self.notebook.tabs()
-        labels = [
-            ("프로젝트 허브", "Project Hub"),
-            ("크리에이터 유틸", "Creator Tools"),
-            ("좌표/시간 계산기", "Coords/Time"),
-            ("명령어 & JSON 생성", "Commands & JSON"),
-            ("고급 명령어", "Advanced Cmd"),
-            ("팩 스캐폴딩 & JSON", "Pack Scaffolding"),
-            ("개발 고급 도구", "Dev Tools"),
-            ("품질/체크리스트", "Quality/Checklist"),
-            ("배포/자동화", "Deploy/Automation"),
-            ("편집/유지보수", "Edit/Maintenance"),
-            ("출시 문서", "Release Docs"),
-            ("통계/인벤토리", "Stats/Inventory"),
-            ("서버 설정", "Server Settings"),
-            ("레시피 생성", "Recipes"),
-            ("파티클/이펙트", "Particles/Effects"),
-            ("텍스트/채팅", "Text/Chat"),
-            ("태그/메타", "Tags/Meta"),
-            ("비교/동기화", "Diff/Sync"),
-            ("마이그레이션/스케줄", "Migration/Schedule"),
-            ("아이템/NBT", "Item/NBT"),
-            ("사운드", "Sound"),
-            ("로그/언어", "Log/Lang"),
-            ("JSON/모델 검사", "JSON/Model Check"),
-            ("네임스페이스/리포트", "Namespace/Report"),
-            ("구조/NBT", "Structure/NBT"),
-            ("함수 그래프", "Call Graph"),
-        ]
         self.tab_label_map = {}
-        for tab, (ko, en) in zip(tabs, labels):
+        for tab, (_, ko, en) in zip(tabs, TAB_SPECS):
             self.tab_label_map[tab] = {"ko": ko, "en": en}
         self.apply_language(trigger_rebuild=False)
 
@@ -2599,10 +3058,7 @@ class MinecraftToolApp:
         self.apply_language(trigger_rebuild=True)
 
     # --- 탭: 팩 스캐폴딩/JSON 생성 ---
-    def create_pack_tab(self, notebook: ttk.Notebook):
-        frame = ttk.Frame(notebook, padding=10)
-        notebook.add(frame, text="팩 스캐폴딩 & JSON")
-
+    def create_pack_tab(self, frame: ttk.Frame):
         upper = ttk.Frame(frame)
         upper.pack(fill="x")
 
@@ -2790,8 +3246,28 @@ class MinecraftToolApp:
 
 
 def main():
+    """
+    --startup-time: 첫 화면이 그려질 때까지의 시간을 출력하고 종료한다.
+    --eager-tabs: 모든 탭 본문을 시작 시 한꺼번에 만든다 (지연 생성 전 동작과 비교용).
+    """
+    measure = "--startup-time" in sys.argv
+    eager = "--eager-tabs" in sys.argv
+    imported = time.perf_counter()
     root = tk.Tk()
-    app = MinecraftToolApp(root)
+    app = MinecraftToolApp(root, eager_tabs=eager)
+    if measure:
+        built = time.perf_counter()
+        root.update()
+        painted = time.perf_counter()
+        total = len(TAB_SPECS)
+        print(
+            f"[startup] import {1000 * (imported - STARTUP_T0):.0f}ms, "
+            f"UI 구성 {1000 * (built - imported):.0f}ms, "
+            f"첫 화면 {1000 * (painted - STARTUP_T0):.0f}ms "
+            f"(탭 본문 {total - len(app.tab_builders)}/{total}개 생성, {'eager' if eager else 'lazy'})"
+        )
+        app.on_close()
+        return
     root.mainloop()
 
 
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+폴더 zip 압축 유틸 (월드 백업 등).
+파일을 1 MB씩 읽어 zip 항목에 바로 써 넣는 스트리밍 방식이라 큰 region 파일도 메모리를 쓰지 않고,
+조각마다 진행률 콜백(바이트 기준, 속도 메시지 포함)을 호출하므로 큰 파일 중간에서도 취소할 수 있다.
+취소(콜백에서 예외)되거나 실패하면 만들던 zip을 지운다. 서버가 잠가 두는 session.lock만 빼고,
+그 밖의 파일을 읽을 수 없으면 백업이 빠진 채 "성공"하지 않도록 실패로 끝낸다.
+압축 방식은 store / fast(deflate 1) / deflate(6) / bzip2 / lzma 중 고르고 (zstd는 지원하는 파이썬에서만),
+limit_mbps로 읽기 속도를 제한해 녹화·서버와 디스크를 다투지 않게 할 수 있다.
+"""
+from __future__ import annotations
+
+import importlib.util
+import os
+import time
+import warnings
+import zipfile
+from typing import Callable, Dict, List, Tuple
+
+STREAM_CHUNK = 1 << 20
+REPORT_INTERVAL = 0.1  # 진행률 콜백 최소 간격 (초). 취소 확인도 이 간격으로 한다.
+SKIP_NAMES = {"session.lock"}  # 서버가 잠가 두는 파일 (월드 백업에 넣지 않는다)
+
+
+def _compression_choices() -> Dict[str, Tuple[int, int | None]]:
+    """이름 -> (zipfile 압축 방식, 레벨). 이 파이썬에서 쓸 수 있는 것만."""
+    choices: Dict[str, Tuple[int, int | None]] = {
+        "store": (zipfile.ZIP_STORED, None),
+        "fast": (zipfile.ZIP_DEFLATED, 1),
+        "deflate": (zipfile.ZIP_DEFLATED, 6),
+    }
+    zstd = getattr(zipfile, "ZIP_ZSTANDARD", None)  # Python 3.14+
+    if zstd is not None:
+        choices["zstd"] = (zstd, 3)
+    # bz2/lzma는 빌드에 따라 빠져 있을 수 있다
+    if importlib.util.find_spec("bz2") is not None:
+        choices["bzip2"] = (zipfile.ZIP_BZIP2, 9)
+    if importlib.util.find_spec("lzma") is not None:
+        choices["lzma"] = (zipfile.ZIP_LZMA, None)
+    return choices
+
+
+COMPRESSION_CHOICES = _compression_choices()
+DEFAULT_COMPRESSION = "deflate"
+
+
+class Throttle:
+    """초당 limit 바이트를 넘지 않도록 consume()에서 잠든다 (limit <= 0이면 제한 없음)."""
+
+    def __init__(self, limit: float):
+        self.limit = limit
+        self.started = time.monotonic()
+        self.consumed = 0
+
+    def consume(self, amount: int):
+        if self.limit <= 0:
+            return
+        self.consumed += amount
+        ahead = self.consumed / self.limit - (time.monotonic() - self.started)
+        if ahead > 0:
+            time.sleep(ahead)
+
+
+def collect_files(root_dir: str) -> List[Tuple[str, str]]:
+    """(zip 내부 경로, 실제 경로) 목록. zip 내부 경로는 / 구분."""
+    items: List[Tuple[str, str]] = []
+    for root, dirs, files in os.walk(root_dir):
+        dirs.sort()
+        for f in sorted(files):
+            full = os.path.join(root, f)
+            items.append((os.path.relpath(full, root_dir).replace(os.sep, "/"), full))
+    return items
+
+
+def _set_compress_level(info: zipfile.ZipInfo, level: int | None):
+    """
+    ZipFile.write()처럼 항목에 압축 레벨을 지정한다.
+    공개 속성 compress_level은 3.13부터 있고, 3.11/3.12에서는 ZipFile.write()도 쓰는 비공개 _compresslevel에 넣는다.
+    둘 다 없는 파이썬이면 레벨 없이 압축 방식의 기본 레벨로 압축하고, 조용히 넘어가지 않도록 경고를 낸다.
+    """
+    if level is None:
+        return
+    if hasattr(info, "compress_level"):
+        info.compress_level = level
+    elif hasattr(info, "_compresslevel"):
+        info._compresslevel = level
+    else:
+        warnings.warn(f"이 파이썬에서는 zip 항목별 압축 레벨을 지정할 수 없어 기본 레벨로 압축합니다 (요청: {level})", RuntimeWarning)
+
+
+def format_rate(nbytes: float, seconds: float) -> str:
+    rate = nbytes / seconds if seconds > 0 else 0.0
+    return f"{rate / (1024 * 1024):.1f} MB/s"
+
+
+def make_zip(
+    root_dir: str,
+    out_base: str,
+    progress: Callable[..., None] | None = None,
+    compression: str = DEFAULT_COMPRESSION,
+    limit_mbps: float = 0,
+) -> str:
+    """
+    root_dir 내용을 out_base + ".zip"으로 압축한다.
+    progress(처리한 바이트, 전체 바이트, 메시지)를 REPORT_INTERVAL마다 호출한다.
+    임시 파일에 쓴 뒤 완료 시 교체하므로 실패/취소해도 기존 zip이 깨지지 않는다.
+    returns: 생성된 zip 경로
+    """
+    if compression not in COMPRESSION_CHOICES:
+        raise ValueError(f"지원하지 않는 압축 방식: {compression} (가능: {', '.join(COMPRESSION_CHOICES)})")
+    method, level = COMPRESSION_CHOICES[compression]
+    zip_path = out_base + ".zip"
+    tmp_path = zip_path + ".part"
+    items = [item for item in collect_files(root_dir) if os.path.basename(item[1]) not in SKIP_NAMES]
+    sizes = []
+    for _, full in items:
+        try:
+            sizes.append(os.path.getsize(full))
+        except OSError:
+            sizes.append(0)
+    total = sum(sizes)
+    throttle = Throttle(limit_mbps * 1024 * 1024)
+    started = last_report = time.monotonic()
+    done = 0
+
+    def report(index: int, force: bool = False):
+        nonlocal last_report
+        now = time.monotonic()
+        if progress and (force or now - last_report >= REPORT_INTERVAL):
+            last_report = now
+            progress(done, total, f"{index}/{len(items)}개 파일, {format_rate(done, now - started)}")
+
+    try:
+        with zipfile.ZipFile(tmp_path, "w", compression=method, compresslevel=level, allowZip64=True) as zf:
+            for index, (arcname, full) in enumerate(items, start=1):
+                info = zipfile.ZipInfo.from_file(full, arcname)
+                info.compress_type = method
+                _set_compress_level(info, level)
+                with open(full, "rb") as src, zf.open(info, "w") as dst:
+                    for chunk in iter(lambda: src.read(STREAM_CHUNK), b""):
+                        throttle.consume(len(chunk))
+                        dst.write(chunk)
+                        done += len(chunk)
+                        report(index)
+                report(index, force=index == len(items))
+        os.replace(tmp_path, zip_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return zip_path
+
+
+__all__ = [
+    "COMPRESSION_CHOICES",
+    "DEFAULT_COMPRESSION",
+    "SKIP_NAMES",
+    "Throttle",
+    "collect_files",
+    "format_rate",
+    "make_zip",
+]
@@ -0,0 +1,406 @@
+# -*- coding: utf-8 -*-
+"""
+증분·중복 제거 월드 백업 (스냅샷).
+파일을 고정 크기 조각(CHUNK_SIZE)으로 나눠 내용 해시를 이름으로 저장소에 넣고,
+이미 있는 조각은 다시 쓰지 않는다. 스냅샷마다 "파일 -> 조각 목록" 매니페스트만 따로 남기므로
+바뀐 region 파일 몇 개만 새로 저장된다. 직전 스냅샷과 크기/mtime이 같은 파일은 읽지도 않는다.
+
+region/*.mca는 헤더(위치·타임스탬프 표)를 읽어 헤더, 청크가 차지한 섹터 구간, 빈 구간으로 나눠
+같은 방식으로 저장한다. 바뀐 region 파일은 구간을 모두 읽어 해시하지만(헤더 타임스탬프는 믿지 않음),
+청크 경계로 나누므로 게임이 region 파일을 조금만 고쳐도 바뀐 청크만 새로 저장된다. 구간을 이어 붙이면
+원래 파일과 바이트 단위로 같으므로 복원은 일반 파일과 같다.
+
+저장소 구조 (기본: 월드 폴더 옆 <월드 이름>_snapshots/):
+    chunks/<해시 앞 2글자>/<해시>   zlib 압축된 조각 (압축이 안 되면 원본 그대로, 첫 바이트로 구분)
+    snapshots/<시각>.json.gz       스냅샷 매니페스트
+"""
+from __future__ import annotations
+
+import datetime
+import gzip
+import hashlib
+import json
+import os
+import struct
+import zlib
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Set, Tuple
+
+from mc_archive import SKIP_NAMES
+
+CHUNK_SIZE = 256 * 1024
+DIGEST_SIZE = 20
+REGION_EXTS = (".mca", ".mcr")
+SECTOR = 4096
+REGION_HEADER = 2 * SECTOR  # 위치 표 1024개 + 타임스탬프 표 1024개
+NO_TIMESTAMP = -1  # 헤더/빈 구간
+
+RAW = b"\x00"
+ZLIB = b"\x01"
+
+
+@dataclass
+class FileRecord:
+    size: int
+    mtime: float
+    chunks: List[str]
+    # region 파일만: chunks와 같은 순서의 [시작 바이트, 길이, 청크 타임스탬프(헤더/빈 구간은 -1)]
+    spans: List[List[int]] | None = None
+
+
+@dataclass
+class Snapshot:
+    id: str
+    created: str
+    world: str
+    files: Dict[str, FileRecord]
+
+    @property
+    def size(self) -> int:
+        return sum(rec.size for rec in self.files.values())
+
+
+@dataclass
+class BackupResult:
+    snapshot: Snapshot
+    files: int
+    read_bytes: int  # 실제로 읽은 바이트 (바뀐 파일)
+    new_chunks: int
+    new_bytes: int  # 저장소에 새로 쓴 바이트 (압축 후)
+    skipped: List[str] = field(default_factory=list)  # 읽을 수 없어 빠진 파일 (상대 경로)
+
+
+def default_store(world: str) -> str:
+    world = os.path.abspath(world).rstrip(os.sep)
+    return os.path.join(os.path.dirname(world), f"{os.path.basename(world)}_snapshots")
+
+
+class SnapshotStore:
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+        self.chunk_dir = os.path.join(self.root, "chunks")
+        self.snapshot_dir = os.path.join(self.root, "snapshots")
+
+    # --- 조각 ---
+    def chunk_path(self, digest: str) -> str:
+        return os.path.join(self.chunk_dir, digest[:2], digest)
+
+    def has_chunk(self, digest: str) -> bool:
+        return os.path.exists(self.chunk_path(digest))
+
+    def put_chunk(self, digest: str, data: bytes) -> int:
+        """조각을 저장한다. returns: 새로 쓴 바이트 (이미 있으면 0)"""
+        path = self.chunk_path(digest)
+        if os.path.exists(path):
+            return 0
+        packed = zlib.compress(data, 1)
+        blob = ZLIB + packed if len(packed) < len(data) else RAW + data
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(blob)
+        os.replace(tmp, path)
+        return len(blob)
+
+    def get_chunk(self, digest: str) -> bytes:
+        with open(self.chunk_path(digest), "rb") as f:
+            blob = f.read()
+        data = zlib.decompress(blob[1:]) if blob[:1] == ZLIB else blob[1:]
+        if hashlib.blake2b(data, digest_size=DIGEST_SIZE).hexdigest() != digest:
+            raise ValueError(f"손상된 조각: {digest}")
+        return data
+
+    # --- 스냅샷 ---
+    def snapshot_ids(self) -> List[str]:
+        """스냅샷 ID 목록 (오래된 순)."""
+        if not os.path.isdir(self.snapshot_dir):
+            return []
+        return sorted(name[: -len(".json.gz")] for name in os.listdir(self.snapshot_dir) if name.endswith(".json.gz"))
+
+    def load(self, snapshot_id: str) -> Snapshot:
+        with gzip.open(os.path.join(self.snapshot_dir, f"{snapshot_id}.json.gz"), "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        files = {
+            rel: FileRecord(rec["size"], rec["mtime"], rec["chunks"], rec.get("spans"))
+            for rel, rec in data["files"].items()
+        }
+        return Snapshot(snapshot_id, data["created"], data.get("world", ""), files)
+
+    def save(self, snapshot: Snapshot):
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        data = {
+            "created": snapshot.created,
+            "world": snapshot.world,
+            "chunk_size": CHUNK_SIZE,
+            "files": {rel: _record_json(rec) for rel, rec in sorted(snapshot.files.items())},
+        }
+        path = os.path.join(self.snapshot_dir, f"{snapshot.id}.json.gz")
+        tmp = path + ".tmp"
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, path)
+
+    def latest(self) -> Snapshot | None:
+        ids = self.snapshot_ids()
+        return self.load(ids[-1]) if ids else None
+
+
+def _record_json(rec: FileRecord) -> Dict:
+    data: Dict = {"size": rec.size, "mtime": rec.mtime, "chunks": rec.chunks}
+    if rec.spans is not None:
+        data["spans"] = rec.spans
+    return data
+
+
+def _world_files(world: str) -> List[Tuple[str, str]]:
+    """(상대 경로, 실제 경로), 정렬."""
+    items: List[Tuple[str, str]] = []
+    for root, dirs, files in os.walk(world):
+        dirs.sort()
+        for name in sorted(files):
+            if name in SKIP_NAMES:
+                continue
+            full = os.path.join(root, name)
+            items.append((os.path.relpath(full, world).replace(os.sep, "/"), full))
+    return items
+
+
+def store_file(store: SnapshotStore, path: str) -> Tuple[List[str], int, int]:
+    """파일을 조각으로 나눠 저장한다. returns: (조각 해시 목록, 새 조각 수, 새로 쓴 바이트)"""
+    chunks: List[str] = []
+    new_chunks = new_bytes = 0
+    with open(path, "rb") as f:
+        for data in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest = hashlib.blake2b(data, digest_size=DIGEST_SIZE).hexdigest()
+            written = store.put_chunk(digest, data)
+            if written:
+                new_chunks += 1
+                new_bytes += written
+            chunks.append(digest)
+    return chunks, new_chunks, new_bytes
+
+
+def region_segments(size: int, header: bytes) -> List[Tuple[int, int, int]] | None:
+    """
+    region 파일을 [헤더, 청크 섹터 구간, 빈 구간]으로 나눈 (시작, 길이, 타임스탬프) 목록 (파일 전체를 순서대로 덮음).
+    헤더가 깨졌거나 구간이 겹치면 None (일반 파일처럼 저장).
+    """
+    if size < REGION_HEADER or len(header) < REGION_HEADER:
+        return None
+    locations = struct.unpack(">1024I", header[:SECTOR])
+    timestamps = struct.unpack(">1024i", header[SECTOR:REGION_HEADER])
+    spans: List[Tuple[int, int, int]] = []
+    for loc, stamp in zip(locations, timestamps):
+        sector, count = loc >> 8, loc & 0xFF
+        if sector == 0 or count == 0:
+            continue
+        start = sector * SECTOR
+        if start < REGION_HEADER or start >= size:
+            return None
+        spans.append((start, min(count * SECTOR, size - start), stamp))
+    spans.sort()
+    segments: List[Tuple[int, int, int]] = [(0, REGION_HEADER, NO_TIMESTAMP)]
+    pos = REGION_HEADER
+    for start, length, stamp in spans:
+        if start < pos:
+            return None  # 겹치는 청크
+        if start > pos:
+            segments.append((pos, start - pos, NO_TIMESTAMP))
+        segments.append((start, length, stamp))
+        pos = start + length
+    if pos < size:
+        segments.append((pos, size - pos, NO_TIMESTAMP))
+    return segments
+
+
+def store_region_file(store: SnapshotStore, path: str) -> Tuple[FileRecord | None, int, int, int]:
+    """
+    region 파일을 구간별로 읽어 해시하고 저장한다.
+    헤더의 타임스탬프는 같은 초 안의 재저장이나 외부 편집기 수정을 놓칠 수 있으므로 믿지 않고 모든 구간을 읽는다.
+    returns: (기록(헤더를 해석할 수 없으면 None), 새 조각 수, 새로 쓴 바이트, 읽은 바이트)
+    """
+    st = os.stat(path)
+    with open(path, "rb") as f:
+        header = f.read(REGION_HEADER)
+        segments = region_segments(st.st_size, header)
+        if segments is None:
+            return None, 0, 0, len(header)
+        chunks: List[str] = []
+        new_chunks = new_bytes = read_bytes = 0
+        for start, length, _stamp in segments:
+            if start == 0:
+                data = header
+            else:
+                f.seek(start)
+                data = f.read(length)
+                read_bytes += len(data)
+            digest = hashlib.blake2b(data, digest_size=DIGEST_SIZE).hexdigest()
+            written = store.put_chunk(digest, data)
+            if written:
+                new_chunks += 1
+                new_bytes += written
+            chunks.append(digest)
+    record = FileRecord(st.st_size, st.st_mtime, chunks, [list(seg) for seg in segments])
+    return record, new_chunks, new_bytes, read_bytes + len(header)
+
+
+def create_snapshot(
+    world: str,
+    store_root: str | None = None,
+    progress: Callable[[int, int], None] | None = None,
+    region_aware: bool = True,
+) -> BackupResult:
+    """
+    월드 폴더의 스냅샷을 만든다. 직전 스냅샷과 크기/mtime이 같은 파일은 조각 목록을 그대로 쓴다.
+    region_aware=True이면 region 파일은 청크 단위로 나눠 바뀐 청크만 읽는다.
+    조각을 모두 쓴 뒤 마지막에 매니페스트를 저장하므로, 중간에 실패/취소하면 스냅샷은 생기지 않는다
+    (이미 쓴 조각은 다음 백업에서 재사용되거나 prune 때 지워진다).
+    stat/열기에 실패한 월드 파일(잠긴 파일 등)만 건너뛰고 BackupResult.skipped에 남긴다.
+    저장소 쓰기 오류(디스크 가득 참, 권한 등)는 그대로 올라가 매니페스트를 쓰지 않는다.
+    """
+    store = SnapshotStore(store_root or default_store(world))
+    previous = store.latest()
+    known = previous.files if previous else {}
+    now = datetime.datetime.now()
+    snapshot = Snapshot(now.strftime("%Y%m%d-%H%M%S"), now.isoformat(timespec="seconds"), os.path.abspath(world), {})
+    existing = set(store.snapshot_ids())
+    base_id, n = snapshot.id, 1
+    while snapshot.id in existing:  # 같은 초에 두 번 만든 경우
+        snapshot.id = f"{base_id}-{n:02d}"
+        n += 1
+    items = _world_files(world)
+    read_bytes = new_chunks = new_bytes = 0
+    skipped: List[str] = []
+    for done, (rel, full) in enumerate(items, start=1):
+        if progress:
+            progress(done, len(items))
+        try:
+            st = os.stat(full)
+        except OSError:
+            skipped.append(rel)  # 목록을 만든 뒤 지워졌거나 접근할 수 없다
+            continue
+        old = known.get(rel)
+        if old and old.size == st.st_size and old.mtime == st.st_mtime:
+            snapshot.files[rel] = old
+            continue
+        try:
+            with open(full, "rb"):
+                pass
+        except OSError:
+            skipped.append(rel)  # 잠긴 파일 등
+            continue
+        record = None
+        if region_aware and rel.lower().endswith(REGION_EXTS):
+            record, n_chunks, n_bytes, n_read = store_region_file(store, full)
+            read_bytes += n_read
+        if record is None:
+            chunks, n_chunks, n_bytes = store_file(store, full)
+            record = FileRecord(st.st_size, st.st_mtime, chunks)
+            read_bytes += st.st_size
+        snapshot.files[rel] = record
+        new_chunks += n_chunks
+        new_bytes += n_bytes
+    store.save(snapshot)
+    return BackupResult(snapshot, len(snapshot.files), read_bytes, new_chunks, new_bytes, skipped)
+
+
+def restore_snapshot(
+    store_root: str,
+    snapshot_id: str,
+    target: str,
+    progress: Callable[[int, int], None] | None = None,
+) -> int:
+    """
+    스냅샷을 target 폴더에 복원한다. target은 없거나 비어 있어야 한다 (현재 월드를 덮어쓰지 않는다).
+    조각마다 해시를 다시 확인하고, 파일 mtime도 백업 당시로 되돌린다. returns: 복원한 파일 수
+    """
+    if os.path.isdir(target) and os.listdir(target):
+        raise ValueError(f"복원 위치가 비어 있지 않습니다: {target}")
+    store = SnapshotStore(store_root)
+    snapshot = store.load(snapshot_id)
+    total = len(snapshot.files)
+    for done, (rel, rec) in enumerate(sorted(snapshot.files.items()), start=1):
+        if progress:
+            progress(done, total)
+        path = os.path.join(target, *rel.split("/"))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            for digest in rec.chunks:
+                f.write(store.get_chunk(digest))
+        os.utime(path, (rec.mtime, rec.mtime))
+    return total
+
+
+def select_keep(ids: List[str], keep_last: int = 24, keep_daily: int = 7, keep_weekly: int = 4) -> Set[str]:
+    """
+    보존 정책: 최근 keep_last개 + 최근 keep_daily일의 하루 마지막 스냅샷 + 최근 keep_weekly주의 주 마지막 스냅샷.
+    ids는 "YYYYmmdd-HHMMSS" 형식 (오래된 순).
+    """
+    keep: Set[str] = set(ids[-keep_last:]) if keep_last > 0 else set()
+    for bucket_of, count in ((lambda sid: sid[:8], keep_daily), (_iso_week, keep_weekly)):
+        buckets: Dict[str, str] = {}
+        for sid in ids:
+            buckets[bucket_of(sid)] = sid  # 같은 날/주의 마지막 것
+        if count > 0:
+            keep.update(sorted(buckets.values())[-count:])
+    return keep
+
+
+def _iso_week(snapshot_id: str) -> str:
+    try:
+        year, week, _ = datetime.datetime.strptime(snapshot_id[:8], "%Y%m%d").isocalendar()
+    except ValueError:
+        return snapshot_id[:8]
+    return f"{year}-{week:02d}"
+
+
+def prune_snapshots(
+    store_root: str, keep_last: int = 24, keep_daily: int = 7, keep_weekly: int = 4
+) -> Tuple[int, int, int]:
+    """
+    보존 정책에서 빠진 스냅샷을 지우고, 남은 스냅샷 어디에도 쓰이지 않는 조각을 지운다.
+    returns: (지운 스냅샷 수, 지운 조각 수, 확보한 바이트)
+    """
+    store = SnapshotStore(store_root)
+    ids = store.snapshot_ids()
+    keep = select_keep(ids, keep_last, keep_daily, keep_weekly)
+    removed = 0
+    for sid in ids:
+        if sid not in keep:
+            os.remove(os.path.join(store.snapshot_dir, f"{sid}.json.gz"))
+            removed += 1
+    live: Set[str] = set()
+    for sid in store.snapshot_ids():
+        for rec in store.load(sid).files.values():
+            live.update(rec.chunks)
+    chunks = freed = 0
+    if os.path.isdir(store.chunk_dir):
+        for root, _, files in os.walk(store.chunk_dir):
+            for name in files:
+                if name in live:
+                    continue
+                full = os.path.join(root, name)
+                try:
+                    freed += os.path.getsize(full)
+                    os.remove(full)
+                except OSError:
+                    continue
+                chunks += 1
+    return removed, chunks, freed
+
+
+__all__ = [
+    "CHUNK_SIZE",
+    "FileRecord",
+    "Snapshot",
+    "BackupResult",
+    "SnapshotStore",
+    "default_store",
+    "store_file",
+    "region_segments",
+    "store_region_file",
+    "create_snapshot",
+    "restore_snapshot",
+    "select_keep",
+    "prune_snapshots",
+]
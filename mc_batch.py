@@ -1,44 +1,56 @@
 # -*- coding: utf-8 -*-
 """
 mcfunction 일괄 검색/치환 유틸.
-간단한 문자열 기반 치환으로, 대규모 프로젝트에서 반복 수정 시 편리하다.
+문자열/정규식 규칙 여러 개를 mc_replace 엔진으로 파일당 한 번에 적용한다.
+검색/치환 대상은 mc_search 트라이그램 색인으로 먼저 좁힌 뒤 실제 내용을 확인한다.
 """
 
 from __future__ import annotations
 
-import os
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from mc_index import get_index
+from mc_journal import Journal
+from mc_replace import ReplaceEngine, ReplaceRule
+from mc_search import get_search_index
 
 
 def iter_mcfunctions(base: str) -> List[Tuple[str, str]]:
-    results = []
-    dp_root = os.path.join(base, "datapacks")
-    if not os.path.isdir(dp_root):
-        return results
-    for pack in os.listdir(dp_root):
-        p_path = os.path.join(dp_root, pack)
-        if not os.path.isdir(p_path):
-            continue
-        data_dir = os.path.join(p_path, "data")
-        if not os.path.isdir(data_dir):
-            continue
-        for ns in os.listdir(data_dir):
-            fn_dir = os.path.join(data_dir, ns, "functions")
-            if not os.path.isdir(fn_dir):
-                continue
-            for root, _, files in os.walk(fn_dir):
-                for file in files:
-                    if file.endswith(".mcfunction"):
-                        full = os.path.join(root, file)
-                        rel = os.path.relpath(full, base)
-                        results.append((rel, full))
-    return results
+    return [(e.rel, e.path) for e in get_index(base).mcfunctions()]
+
+
+def _candidates(
+    base: str, needles: Iterable[str] | None, include_json: bool, progress: Callable[[int, int], None] | None
+) -> List[Tuple[str, str]]:
+    """
+    needles 중 하나라도 포함할 수 있는 (상대 경로, 실제 경로). 색인 갱신 후 후보만 남긴다.
+    needles가 None(정규식 규칙 등)이면 대상 파일 전체.
+    """
+    items = iter_mcfunctions(base)
+    if include_json:
+        items += [(e.rel, e.path) for e in get_index(base).files(ext=".json")]
+    if needles is None:
+        return items
+    paths = dict(items)
+    index = get_search_index(base, progress=progress)
+    found = set()
+    for needle in needles:
+        found.update(index.candidates(needle, paths))
+    return [(rel, paths[rel]) for rel in sorted(found)]
 
 
-def find_occurrences(base: str, needle: str) -> Dict[str, List[int]]:
-    """needle을 포함하는 파일과 행 번호를 반환."""
+def find_occurrences(
+    base: str,
+    needle: str,
+    progress: Callable[[int, int], None] | None = None,
+    include_json: bool = False,
+) -> Dict[str, List[int]]:
+    """needle을 포함하는 파일과 행 번호를 반환. include_json=True이면 팩 안 JSON도 검색."""
     matches: Dict[str, List[int]] = {}
-    for rel, full in iter_mcfunctions(base):
+    candidates = _candidates(base, [needle], include_json, progress)
+    for done, (rel, full) in enumerate(candidates, start=1):
+        if progress:
+            progress(done, len(candidates))
         with open(full, "r", encoding="utf-8", errors="replace") as f:
             for idx, line in enumerate(f, start=1):
                 if needle in line:
@@ -46,20 +58,45 @@ def find_occurrences(base: str, needle: str) -> Dict[str, List[int]]:
     return matches
 
 
-def replace_in_workspace(base: str, needle: str, replacement: str) -> int:
+def replace_rules(
+    base: str,
+    rules: List[ReplaceRule],
+    progress: Callable[[int, int], None] | None = None,
+    include_json: bool = False,
+) -> Tuple[int, int]:
+    """
+    규칙 목록을 모든 mcfunction(선택 시 JSON 포함)에 한 번에 적용한다.
+    원본은 mc_journal에 보관되며, 중간에 실패/취소되면 바꾼 파일을 모두 되돌린다.
+    returns: (변경된 파일 수, 치환 횟수)
+    """
+    engine = ReplaceEngine(rules)
+    needles = list(engine.literals) if engine.literal_only else None
+    changed = total = 0
+    candidates = _candidates(base, needles, include_json, progress)
+    with Journal(base, "replace") as journal:
+        for done, (_, full) in enumerate(candidates, start=1):
+            if progress:
+                progress(done, len(candidates))
+            with open(full, "r", encoding="utf-8", errors="replace") as f:
+                content = f.read()
+            new_content, count = engine.apply(content)
+            if new_content != content:
+                journal.write_text(full, new_content)
+                changed += 1
+                total += count
+    return changed, total
+
+
+def replace_in_workspace(
+    base: str,
+    needle: str,
+    replacement: str,
+    progress: Callable[[int, int], None] | None = None,
+    regex: bool = False,
+) -> int:
     """모든 mcfunction에서 needle을 replacement로 치환하고 변경된 파일 수를 반환."""
-    changed = 0
-    for _, full in iter_mcfunctions(base):
-        with open(full, "r", encoding="utf-8", errors="replace") as f:
-            content = f.read()
-        if needle not in content:
-            continue
-        new_content = content.replace(needle, replacement)
-        if new_content != content:
-            with open(full, "w", encoding="utf-8") as f:
-                f.write(new_content)
-            changed += 1
+    changed, _ = replace_rules(base, [ReplaceRule(needle, replacement, regex)], progress=progress)
     return changed
 
 
-__all__ = ["find_occurrences", "replace_in_workspace"]
+__all__ = ["find_occurrences", "replace_in_workspace", "replace_rules"]
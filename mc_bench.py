@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+성능 측정용 유틸.
+임시 폴더에 합성 데이터팩/파일 트리를 만들고, 린트·해시 등 작업을 설정별로 실행해 걸린 시간을 잰다.
+`python -m mc_cli bench lint --files 50000`, `python -m mc_cli bench hash --files 2000 --size 512`로 실행한다.
+"""
+from __future__ import annotations
+
+import os
+import random
+import time
+from dataclasses import dataclass
+from typing import List
+
+SAMPLE_LINES = [
+    "say hello",
+    "scoreboard players add @s timer 1",
+    "execute as @a at @s run particle minecraft:flame ~ ~1 ~ 0.2 0.2 0.2 0 4",
+    "function demo:sub/tick",
+    "effect give @a[tag=runner] minecraft:speed 2 1 true",
+    "tellraw @a {\"text\":\"round start\",\"color\":\"gold\"}",
+    "    kill @e[type=item,distance=..8]",
+    "title @a actionbar {\"text\":\"ready \"} ",
+    "\tsetblock ~ ~-1 ~ minecraft:stone",
+]
+
+
+@dataclass
+class BenchRow:
+    label: str
+    workers: int
+    seconds: float
+    files: int
+    nbytes: int = 0
+
+    @property
+    def files_per_sec(self) -> float:
+        return self.files / self.seconds if self.seconds else 0.0
+
+    @property
+    def mb_per_sec(self) -> float:
+        return self.nbytes / self.seconds / (1 << 20) if self.seconds else 0.0
+
+
+def make_synthetic_pack(root: str, files: int, lines: int = 20, seed: int = 1) -> str:
+    """
+    root 아래에 datapacks/bench 팩을 만들고 mcfunction 파일 files개를 채운다.
+    폴더당 200개씩 나눠 넣는다. returns: 워크스페이스 경로(root)
+    """
+    rng = random.Random(seed)
+    pack = os.path.join(root, "datapacks", "bench")
+    os.makedirs(pack, exist_ok=True)
+    with open(os.path.join(pack, "pack.mcmeta"), "w", encoding="utf-8") as f:
+        f.write('{"pack": {"pack_format": 15, "description": "bench"}}\n')
+    for i in range(files):
+        folder = os.path.join(pack, "data", "bench", "functions", f"group{i // 200:04d}")
+        if i % 200 == 0:
+            os.makedirs(folder, exist_ok=True)
+        body = "\n".join(rng.choice(SAMPLE_LINES) for _ in range(lines))
+        with open(os.path.join(folder, f"f{i:06d}.mcfunction"), "w", encoding="utf-8") as f:
+            f.write(body + "\n")
+    return root
+
+
+def make_synthetic_tree(root: str, files: int, size_kb: int = 256, seed: int = 1) -> str:
+    """root/tree 아래에 임의 바이트 파일 files개(각 size_kb KB)를 만든다. returns: 트리 경로"""
+    rng = random.Random(seed)
+    tree = os.path.join(root, "tree")
+    block = bytes(rng.getrandbits(8) for _ in range(64 * 1024))
+    for i in range(files):
+        folder = os.path.join(tree, f"d{i // 200:03d}")
+        if i % 200 == 0:
+            os.makedirs(folder, exist_ok=True)
+        remaining = size_kb * 1024
+        with open(os.path.join(folder, f"f{i:05d}.bin"), "wb") as f:
+            f.write(i.to_bytes(4, "little"))  # 파일마다 내용이 다르도록
+            while remaining > 0:
+                f.write(block[: min(remaining, len(block))])
+                remaining -= len(block)
+    return tree
+
+
+def bench_lint(base: str, worker_counts: List[int], repeat: int = 1) -> List[BenchRow]:
+    """캐시 없이 iter_lint를 작업자 수별로 실행한다. 같은 설정은 repeat번 중 최솟값."""
+    from mc_lint import iter_lint, iter_mcfunctions
+
+    files = len(iter_mcfunctions(base))
+    rows: List[BenchRow] = []
+    for workers in worker_counts:
+        best = None
+        for _ in range(max(1, repeat)):
+            started = time.perf_counter()
+            for _item in iter_lint(base, workers=workers, use_cache=False):
+                pass
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        rows.append(BenchRow("lint", workers, best or 0.0, files))
+    return rows
+
+
+def _timed(func, repeat: int) -> float:
+    best = None
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best or 0.0
+
+
+def bench_hash(tree: str, worker_counts: List[int], repeat: int = 1) -> List[BenchRow]:
+    """
+    기존 경로(sha1, 8 KB 읽기, 단일 스레드)와 hash_files(blake2b, 1 MB 읽기, 스레드 풀)를 비교한다.
+    두 번째 실행부터는 OS 페이지 캐시에 올라간 상태이므로 repeat>1이면 순수 해시 처리량에 가깝다.
+    """
+    from mc_diff import CHUNK_SIZE, file_hash, hash_files, scan_tree
+
+    info = scan_tree(tree)
+    paths = [os.path.join(tree, rel) for rel in sorted(info)]
+    nbytes = sum(size for size, _ in info.values())
+    rows = [
+        BenchRow(
+            "sha1/8KB",
+            1,
+            _timed(lambda: [file_hash(p, "sha1", 8192) for p in paths], repeat),
+            len(paths),
+            nbytes,
+        )
+    ]
+    for algo in ("sha1", "blake2b"):
+        for workers in worker_counts:
+            seconds = _timed(lambda: hash_files(paths, algo, CHUNK_SIZE, workers=workers), repeat)
+            rows.append(BenchRow(f"{algo}/1MB", workers, seconds, len(paths), nbytes))
+    return rows
+
+
+def format_rows(title: str, rows: List[BenchRow]) -> List[str]:
+    """첫 행을 기준(1.00x)으로 한 표."""
+    lines = [title, f"{'case':<12} {'workers':>7} {'seconds':>8} {'files/s':>10} {'MB/s':>8} {'speedup':>8}"]
+    base_time = rows[0].seconds if rows else 0.0
+    for row in rows:
+        speedup = base_time / row.seconds if row.seconds else 0.0
+        lines.append(
+            f"{row.label:<12} {row.workers:>7} {row.seconds:>8.3f} {row.files_per_sec:>10.0f} "
+            f"{row.mb_per_sec:>8.1f} {speedup:>7.2f}x"
+        )
+    return lines
+
+
+def default_worker_counts() -> List[int]:
+    """1, 2, 4, ... CPU 수까지."""
+    cpus = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 < cpus:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cpus:
+        counts.append(cpus)
+    return counts
+
+
+__all__ = [
+    "BenchRow",
+    "make_synthetic_pack",
+    "make_synthetic_tree",
+    "bench_lint",
+    "bench_hash",
+    "format_rows",
+    "default_worker_counts",
+]
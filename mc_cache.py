@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+세션 간 유지되는 캐시 저장소(SQLite).
+설정 파일(mc_helper_settings.json)과 같은 폴더에 mc_helper_cache.sqlite3를 두고,
+각 모듈은 필요한 테이블을 CREATE TABLE IF NOT EXISTS로 직접 만든다.
+MC_HELPER_CACHE 환경 변수로 위치를 바꿀 수 있다(CI 등).
+DB에 넣기에는 큰 데이터(압축 스트림 등)는 DB 옆 폴더(blob_dir)에 파일로 둔다.
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+
+DEFAULT_CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mc_helper_cache.sqlite3")
+# 예전 코드 호환용: import 시점의 경로. 실제 경로는 cache_file()로 얻는다.
+CACHE_FILE = os.environ.get("MC_HELPER_CACHE") or DEFAULT_CACHE_FILE
+
+
+def cache_file() -> str:
+    """캐시 DB 경로. MC_HELPER_CACHE는 호출할 때마다 읽는다 (CLI --cache가 import 뒤에 설정하므로)."""
+    return os.environ.get("MC_HELPER_CACHE") or DEFAULT_CACHE_FILE
+
+
+def connect(path: str | None = None) -> sqlite3.Connection:
+    """캐시 DB 연결을 연다. 스레드마다 따로 열어서 사용한다."""
+    conn = sqlite3.connect(path or cache_file(), timeout=10)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def blob_dir(name: str) -> str:
+    """캐시 DB 옆의 파일 캐시 폴더 (<DB 이름>_blobs/<name>). 없으면 만든다."""
+    path = os.path.join(os.path.splitext(cache_file())[0] + "_blobs", name)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+__all__ = ["CACHE_FILE", "DEFAULT_CACHE_FILE", "blob_dir", "cache_file", "connect"]
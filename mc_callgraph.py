@@ -7,9 +7,11 @@ from __future__ import annotations
 
 import os
 import re
-from typing import Dict, List, Set, Tuple
+from typing import Callable, Dict, List, Set, Tuple
 
-FUNC_RE = re.compile(r"\\bfunction\\s+([a-z0-9_\\-\\.]+:[a-z0-9_\\/\\.]+)", re.IGNORECASE)
+from mc_index import get_index
+
+FUNC_RE = re.compile(r"\bfunction\s+([a-z0-9_\-.]+:[a-z0-9_\-./]+)", re.IGNORECASE)
 
 
 def list_functions(base: str) -> Dict[str, str]:
@@ -18,38 +20,25 @@ def list_functions(base: str) -> Dict[str, str]:
     id 형식: <namespace>:<path> (확장자 제외, 슬래시는 /)
     """
     mapping: Dict[str, str] = {}
-    dp_root = os.path.join(base, "datapacks")
-    if not os.path.isdir(dp_root):
-        return mapping
-    for pack in os.listdir(dp_root):
-        p_path = os.path.join(dp_root, pack)
-        if not os.path.isdir(p_path):
-            continue
-        data_dir = os.path.join(p_path, "data")
-        if not os.path.isdir(data_dir):
-            continue
-        for ns in os.listdir(data_dir):
-            fn_dir = os.path.join(data_dir, ns, "functions")
-            if not os.path.isdir(fn_dir):
-                continue
-            for root, _, files in os.walk(fn_dir):
-                for f in files:
-                    if f.endswith(".mcfunction"):
-                        full = os.path.join(root, f)
-                        rel = os.path.relpath(full, fn_dir).replace("\\\\", "/").replace(".mcfunction", "")
-                        func_id = f"{ns}:{rel}"
-                        mapping[func_id] = full
+    for entry in get_index(base).mcfunctions():
+        # datapacks/<pack>/data/<ns>/functions/<path>.mcfunction
+        rel = "/".join(entry.rel.split(os.sep)[5:])[: -len(".mcfunction")]
+        mapping[f"{entry.namespace}:{rel}"] = entry.path
     return mapping
 
 
-def build_call_graph(base: str) -> Tuple[Dict[str, Set[str]], Dict[str, str]]:
+def build_call_graph(
+    base: str, progress: Callable[[int, int], None] | None = None
+) -> Tuple[Dict[str, Set[str]], Dict[str, str]]:
     """
     returns: (graph, id_to_path)
     graph: func_id -> set(called_func_id)
     """
     id_to_path = list_functions(base)
     graph: Dict[str, Set[str]] = {fid: set() for fid in id_to_path}
-    for fid, path in id_to_path.items():
+    for done, (fid, path) in enumerate(id_to_path.items(), start=1):
+        if progress:
+            progress(done, len(id_to_path))
         try:
             with open(path, "r", encoding="utf-8", errors="replace") as f:
                 for line in f:
@@ -0,0 +1,438 @@
+# -*- coding: utf-8 -*-
+"""
+GUI 없이 워크스페이스 도구를 실행하는 CLI (CI 파이프라인용).
+tkinter를 import 하지 않으며, 결과를 JSON/NDJSON/텍스트로 출력한다.
+
+    python -m mc_cli lint <workspace> --format ndjson
+    python -m mc_cli diff <src> <dst> [--sync [--mirror]]
+    python -m mc_cli pack <pack folder> -o <out.zip>
+    python -m mc_cli build <workspace> [--only "core_*"] [--minify]
+    python -m mc_cli backup create|list|restore|prune|zip <world>
+
+종료 코드: 0 = 문제 없음, 1 = 발견 사항 있음, 2 = 사용법/실행 오류
+"""
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import os
+import sys
+from typing import Any, Dict, List, Tuple
+
+EXIT_OK = 0
+EXIT_FINDINGS = 1
+EXIT_ERROR = 2
+
+# (findings, summary): findings는 레코드(dict) 리스트, summary는 추가 정보
+Outcome = Tuple[List[Dict[str, Any]], Dict[str, Any]]
+
+
+def cmd_lint(args) -> Outcome:
+    from mc_lint import iter_mcfunctions, lint_issues
+
+    findings = [{"file": rel, "message": msg} for rel, msg in lint_issues(args.workspace)]
+    return findings, {"files": len(iter_mcfunctions(args.workspace))}
+
+
+def cmd_scan(args) -> Outcome:
+    from mc_index import get_index
+    from mc_scanner import scan_datapack, scan_resourcepack
+
+    index = get_index(args.workspace)
+    findings: List[Dict[str, Any]] = []
+    packs = 0
+    missing: List[str] = []
+    for kind, scan_func in (("datapacks", scan_datapack), ("resourcepacks", scan_resourcepack)):
+        if not index.has_kind(kind):
+            missing.append(kind)  # 데이터 팩만 있는 저장소 등: 발견 사항이 아니라 참고 정보
+            continue
+        for pack in index.packs(kind):
+            packs += 1
+            for msg in scan_func(os.path.join(args.workspace, kind, pack)):
+                findings.append({"kind": kind, "pack": pack, "message": msg})
+    if len(missing) == 2:
+        findings.append({"kind": None, "pack": None, "message": "datapacks/resourcepacks 폴더가 모두 없음"})
+    return findings, {"packs": packs, "missing": missing}
+
+
+def cmd_schema(args) -> Outcome:
+    from mc_schema import json_issues
+
+    return [{"file": rel, "message": msg} for rel, msg in json_issues(args.workspace)], {}
+
+
+def cmd_models(args) -> Outcome:
+    from mc_modelcheck import model_issues
+    from mc_release import list_packs
+
+    packs = [args.pack] if args.pack else list_packs(args.workspace, "resourcepacks")
+    findings = [{"pack": pack, "message": msg} for pack in packs for msg in model_issues(args.workspace, pack)]
+    return findings, {"packs": len(packs)}
+
+
+def cmd_lang(args) -> Outcome:
+    from mc_langcheck import check_lang_pack
+    from mc_release import list_packs
+
+    packs = [args.pack] if args.pack else list_packs(args.workspace, "resourcepacks")
+    findings: List[Dict[str, Any]] = []
+    for pack in packs:
+        try:
+            missing, extra = check_lang_pack(args.workspace, pack)
+        except FileNotFoundError as exc:
+            findings.append({"pack": pack, "type": "error", "message": str(exc)})
+            continue
+        findings.extend({"pack": pack, "type": "missing", "key": key} for key in missing)
+        findings.extend({"pack": pack, "type": "extra", "key": key} for key in extra)
+    return findings, {"packs": len(packs)}
+
+
+def cmd_diff(args) -> Outcome:
+    from mc_diff import compare_dirs, sync_dirs
+
+    diff = compare_dirs(args.src, args.dst, verify=args.verify)
+    findings: List[Dict[str, Any]] = []
+    for status, paths in (("added", diff.added), ("removed", diff.removed), ("modified", diff.modified)):
+        findings.extend({"status": status, "file": rel} for rel in paths)
+    summary: Dict[str, Any] = {
+        "added": len(diff.added),
+        "removed": len(diff.removed),
+        "modified": len(diff.modified),
+        "touched": len(diff.touched),
+    }
+    if args.sync or args.mirror:
+        report = sync_dirs(args.src, args.dst, diff, mirror=args.mirror)
+        summary["sync"] = report.summary()
+    return findings, summary
+
+
+def cmd_pack(args) -> Outcome:
+    from mc_packbuild import build_pack_zip
+
+    out = args.out or os.path.abspath(args.src).rstrip(os.sep) + ".zip"
+    result = build_pack_zip(
+        args.src, out, level=args.level, workers=args.workers, use_cache=not args.no_cache, minify=args.minify
+    )
+    summary: Dict[str, Any] = {
+        "zip": result.path,
+        "sha1": result.sha1,
+        "entries": result.entries,
+        "reused": result.reused,
+        "bytes": result.size,
+    }
+    if args.minify:
+        summary["savings"] = {
+            ext: {"files": files, "before": before, "after": after}
+            for ext, (files, before, after) in result.savings.items()
+            if before != after
+        }
+        summary["junk_removed"] = result.junk
+    return [], summary
+
+
+def cmd_build(args) -> Outcome:
+    from mc_packbuild import PACK_KINDS, build_all
+
+    kinds = (args.kind,) if args.kind else PACK_KINDS
+    builds, manifest = build_all(
+        args.workspace,
+        out_dir=args.out,
+        kinds=kinds,
+        patterns=args.only,
+        level=args.level,
+        workers=args.workers,
+        pack_jobs=args.jobs,
+        use_cache=not args.no_cache,
+        minify=args.minify,
+    )
+    packs = [
+        {"kind": b.kind, "pack": b.name, "zip": b.result.path, "sha1": b.result.sha1, "bytes": b.result.size}
+        for b in builds
+    ]
+    return [], {"manifest": manifest, "packs": packs}
+
+
+def cmd_backup(args) -> Outcome:
+    import mc_backup
+
+    if not os.path.isdir(args.world):
+        raise FileNotFoundError(f"월드 폴더를 찾을 수 없습니다: {args.world}")
+    if args.action == "zip":
+        from mc_archive import make_zip
+
+        world = os.path.abspath(args.world).rstrip(os.sep)
+        stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        out_base = args.to or f"{world}_backup_{stamp}"
+        path = make_zip(world, out_base, compression=args.compression, limit_mbps=args.limit)
+        return [], {"zip": path, "bytes": os.path.getsize(path), "compression": args.compression}
+    store = args.store or mc_backup.default_store(args.world)
+    if args.action == "create":
+        result = mc_backup.create_snapshot(args.world, store, region_aware=not args.no_region)
+        findings = [{"file": rel, "message": "읽을 수 없어 스냅샷에서 빠짐"} for rel in result.skipped]
+        return findings, {
+            "snapshot": result.snapshot.id,
+            "files": result.files,
+            "read_bytes": result.read_bytes,
+            "new_chunks": result.new_chunks,
+            "new_bytes": result.new_bytes,
+            "skipped": len(result.skipped),
+        }
+    if args.action == "list":
+        snapshots = mc_backup.SnapshotStore(store)
+        rows = []
+        for sid in snapshots.snapshot_ids():
+            snap = snapshots.load(sid)
+            rows.append({"snapshot": sid, "created": snap.created, "files": len(snap.files), "bytes": snap.size})
+        return [], {"store": store, "snapshots": rows}
+    if args.action == "restore":
+        ids = mc_backup.SnapshotStore(store).snapshot_ids()
+        sid = args.snapshot or (ids[-1] if ids else None)
+        if sid is None:
+            raise ValueError("복원할 스냅샷이 없습니다.")
+        target = args.to or f"{os.path.abspath(args.world).rstrip(os.sep)}_restored_{sid}"
+        return [], {"snapshot": sid, "target": target, "files": mc_backup.restore_snapshot(store, sid, target)}
+    removed, chunks, freed = mc_backup.prune_snapshots(store, args.keep_last, args.keep_daily, args.keep_weekly)
+    return [], {"removed_snapshots": removed, "removed_chunks": chunks, "freed_bytes": freed}
+
+
+def cmd_find(args) -> Outcome:
+    from mc_batch import find_occurrences
+
+    matches = find_occurrences(args.workspace, args.needle)
+    return [{"file": rel, "lines": rows} for rel, rows in matches.items()], {"needle": args.needle}
+
+
+def cmd_log(args) -> Outcome:
+    from mc_log import find_errors, tail_lines
+
+    if not os.path.exists(args.log):
+        raise FileNotFoundError(f"log 파일을 찾을 수 없습니다: {args.log}")
+    lines = tail_lines(args.log, args.tail)
+    return [{"line": line} for line in find_errors(lines)], {"scanned": len(lines)}
+
+
+def cmd_logs(args) -> Outcome:
+    from mc_logstats import LEVELS, analyze_logs, format_stats
+
+    levels = LEVELS[LEVELS.index(args.level) :]
+    stats = analyze_logs(args.path, bucket=args.bucket, levels=levels, workers=args.workers)
+    findings = [
+        {
+            "fingerprint": g.fingerprint,
+            "level": g.level,
+            "count": g.count,
+            "first_seen": g.first_seen,
+            "last_seen": g.last_seen,
+            "title": g.title,
+            "timeline": g.timeline,
+        }
+        for g in stats.groups[: args.top or None]
+    ]
+    summary: Dict[str, Any] = {
+        "files": stats.files,
+        "lines": stats.lines,
+        "events": stats.events,
+        "groups": len(stats.groups),
+        "read_bytes": stats.read_bytes,
+        "seconds": round(stats.seconds, 3),
+    }
+    if args.format == "text":
+        summary["markdown"] = "\n".join(format_stats(stats, top=args.top or len(stats.groups)))
+    return findings, summary
+
+
+def cmd_stats(args) -> Outcome:
+    from dataclasses import asdict
+
+    from mc_stats import collect_stats
+
+    return [], {kind: asdict(st) for kind, st in collect_stats(args.workspace).items()}
+
+
+def cmd_callgraph(args) -> Outcome:
+    from mc_callgraph import build_call_graph, reachable_from
+
+    graph, id_to_path = build_call_graph(args.workspace)
+    summary: Dict[str, Any] = {"functions": len(id_to_path), "graph": {fid: sorted(calls) for fid, calls in sorted(graph.items())}}
+    findings = [
+        {"function": fid, "calls": callee, "message": "정의되지 않은 함수 호출"}
+        for fid, calls in sorted(graph.items())
+        for callee in sorted(calls)
+        if callee not in graph and not callee.startswith("minecraft:")
+    ]
+    if args.start:
+        starts = [s.strip() for s in args.start.split(",") if s.strip()]
+        summary["reachable"] = sorted(reachable_from(graph, starts, depth=args.depth))
+    return findings, summary
+
+
+def cmd_report(args) -> Outcome:
+    from mc_report import build_pack_report
+
+    return [], {"markdown": build_pack_report(args.workspace)}
+
+
+def cmd_bench(args) -> Outcome:
+    import shutil
+    import tempfile
+
+    root = args.keep or tempfile.mkdtemp(prefix="mc_bench_")
+    if not args.cache:
+        # 합성 팩의 인덱스/캐시가 기본 캐시 DB에 남지 않도록 임시 DB 사용
+        os.environ["MC_HELPER_CACHE"] = os.path.join(root, "bench_cache.sqlite3")
+    import mc_bench
+
+    counts = [int(n) for n in args.workers.split(",")] if args.workers else mc_bench.default_worker_counts()
+    try:
+        if args.target == "lint":
+            if not os.path.isdir(os.path.join(root, "datapacks", "bench")):
+                mc_bench.make_synthetic_pack(root, args.files)
+            rows = mc_bench.bench_lint(root, counts, repeat=args.repeat)
+            title = f"lint ({args.files} files)"
+        else:
+            tree = os.path.join(root, "tree")
+            if not os.path.isdir(tree):
+                mc_bench.make_synthetic_tree(root, args.files, args.size)
+            rows = mc_bench.bench_hash(tree, counts, repeat=args.repeat)
+            title = f"hash ({args.files} files x {args.size} KB)"
+    finally:
+        if not args.keep:
+            shutil.rmtree(root, ignore_errors=True)
+    summary = {
+        "target": args.target,
+        "files": args.files,
+        "cpus": os.cpu_count(),
+        "rows": [
+            {
+                "case": r.label,
+                "workers": r.workers,
+                "seconds": round(r.seconds, 4),
+                "files_per_sec": round(r.files_per_sec),
+                "mb_per_sec": round(r.mb_per_sec, 1),
+            }
+            for r in rows
+        ],
+    }
+    if args.format == "text":
+        summary = {"markdown": "\n".join(mc_bench.format_rows(title, rows))}
+    return [], summary
+
+
+def build_parser() -> argparse.ArgumentParser:
+    from mc_archive import COMPRESSION_CHOICES
+
+    parser = argparse.ArgumentParser(prog="python -m mc_cli", description="Minecraft 제작 도우미 CLI")
+    parser.add_argument("--format", choices=("json", "ndjson", "text"), default="json", help="출력 형식 (기본 json)")
+    parser.add_argument("--cache", help="캐시 DB 경로 (기본: mc_helper_cache.sqlite3, MC_HELPER_CACHE)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add(name: str, func, help_text: str, workspace: bool = True):
+        p = sub.add_parser(name, help=help_text)
+        if workspace:
+            p.add_argument("workspace", help="워크스페이스 루트 (datapacks/resourcepacks 상위)")
+        p.set_defaults(func=func)
+        return p
+
+    add("lint", cmd_lint, "mcfunction 린트")
+    add("scan", cmd_scan, "팩 구조 스캔")
+    add("schema", cmd_schema, "JSON 스키마 검사")
+    add("models", cmd_models, "모델 텍스처 누락 검사").add_argument("--pack", help="리소스 팩 이름 (기본: 전체)")
+    add("lang", cmd_lang, "lang 누락/초과 키 검사 (en_us vs ko_kr)").add_argument("--pack", help="리소스 팩 이름 (기본: 전체)")
+    p = add("diff", cmd_diff, "두 폴더(또는 zip) 비교", workspace=False)
+    p.add_argument("src")
+    p.add_argument("dst")
+    p.add_argument("--verify", action="store_true", help="zip 비교 시 CRC가 같은 항목도 내용을 풀어 확인")
+    p.add_argument("--sync", action="store_true", help="비교 후 src→dst 동기화 (추가/수정)")
+    p.add_argument("--mirror", action="store_true", help="동기화 시 dst에만 있는 파일도 삭제 (--sync 포함)")
+    p = add("pack", cmd_pack, "팩 폴더를 결정적 zip으로 빌드 (SHA-1 출력)", workspace=False)
+    p.add_argument("src", help="팩 폴더")
+    p.add_argument("-o", "--out", help="출력 zip 경로 (기본: <팩 폴더>.zip)")
+    p.add_argument("--level", type=int, default=9, choices=range(0, 10), metavar="0-9", help="deflate 압축 레벨")
+    p.add_argument("--workers", type=int, default=None, help="압축 스레드 수")
+    p.add_argument("--no-cache", action="store_true", help="빌드 캐시 없이 모든 항목을 다시 압축")
+    p.add_argument("--minify", action="store_true", help="JSON/mcfunction 최소화, OS 부산물 제외")
+    p = add("build", cmd_build, "모든 팩을 동시에 빌드하고 manifest.json 작성")
+    p.add_argument("-o", "--out", help="출력 폴더 (기본: <workspace>/build)")
+    p.add_argument("--kind", choices=("datapacks", "resourcepacks"), help="한 종류만 빌드")
+    p.add_argument("--only", action="append", metavar="PATTERN", help="팩 이름 패턴 (반복 가능, 예: core_*)")
+    p.add_argument("--level", type=int, default=9, choices=range(0, 10), metavar="0-9", help="deflate 압축 레벨")
+    p.add_argument("--workers", type=int, default=None, help="공유 압축 스레드 수")
+    p.add_argument("--jobs", type=int, default=3, help="동시에 빌드할 팩 수")
+    p.add_argument("--no-cache", action="store_true", help="빌드 캐시 없이 모든 항목을 다시 압축")
+    p.add_argument("--minify", action="store_true", help="JSON/mcfunction 최소화, OS 부산물 제외")
+    p = add("backup", cmd_backup, "월드 증분 스냅샷 백업/목록/복원/정리", workspace=False)
+    p.add_argument("action", choices=("create", "list", "restore", "prune", "zip"))
+    p.add_argument("world", help="월드 폴더")
+    p.add_argument("--store", help="스냅샷 저장소 (기본: <월드>_snapshots)")
+    p.add_argument("--no-region", action="store_true", help="create: region(.mca)도 고정 크기 조각으로 저장")
+    p.add_argument("--snapshot", help="restore: 스냅샷 ID (기본: 최신)")
+    p.add_argument("--to", help="restore: 복원할 빈 폴더 (기본: <월드>_restored_<ID>), zip: 출력 경로(.zip 제외)")
+    p.add_argument("--compression", default="fast", choices=list(COMPRESSION_CHOICES), help="zip: 압축 방식")
+    p.add_argument("--limit", type=float, default=0, help="zip: 읽기 속도 제한 (MB/s, 0=없음)")
+    p.add_argument("--keep-last", type=int, default=24, help="prune: 최근 N개 보존")
+    p.add_argument("--keep-daily", type=int, default=7, help="prune: 최근 N일의 하루 마지막 스냅샷 보존")
+    p.add_argument("--keep-weekly", type=int, default=4, help="prune: 최근 N주의 주 마지막 스냅샷 보존")
+    add("find", cmd_find, "mcfunction 문자열 검색 (일치 항목을 발견 사항으로 보고)").add_argument("needle")
+    p = add("log", cmd_log, "latest.log 오류 추출", workspace=False)
+    p.add_argument("log")
+    p.add_argument("--tail", type=int, default=400)
+    p = add("logs", cmd_logs, "회전된 로그(*.log.gz)까지 모아 오류 종류별 횟수/발생 시기 집계", workspace=False)
+    p.add_argument("path", help="서버 폴더, logs 폴더 또는 로그 파일 하나")
+    p.add_argument("--bucket", choices=("day", "hour"), default="day", help="횟수를 셀 구간")
+    p.add_argument("--level", choices=("WARN", "ERROR", "FATAL"), default="WARN", help="이 레벨 이상만 (스택 트레이스는 항상 포함)")
+    p.add_argument("--top", type=int, default=50, help="보고할 종류 수 (0=전체)")
+    p.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    add("stats", cmd_stats, "워크스페이스 통계")
+    p = add("callgraph", cmd_callgraph, "함수 호출 그래프")
+    p.add_argument("--start", default="", help="시작 함수 (콤마 구분)")
+    p.add_argument("--depth", type=int, default=5)
+    add("report", cmd_report, "Markdown 리포트")
+    p = add("bench", cmd_bench, "합성 팩으로 성능 측정 (작업자 수별)", workspace=False)
+    p.add_argument("target", choices=("lint", "hash"))
+    p.add_argument("--files", type=int, default=50000, help="합성 파일 수 (lint: mcfunction, hash: 바이너리)")
+    p.add_argument("--size", type=int, default=256, help="hash: 파일당 크기(KB)")
+    p.add_argument("--workers", default="", help="작업자 수 목록 (콤마 구분, 기본 1,2,4..CPU)")
+    p.add_argument("--repeat", type=int, default=1)
+    p.add_argument("--keep", help="합성 팩을 만들/재사용할 폴더 (지정 시 지우지 않음)")
+    return parser
+
+
+def emit(command: str, findings: List[Dict[str, Any]], summary: Dict[str, Any], fmt: str, out=sys.stdout):
+    if fmt == "ndjson":
+        for record in findings:
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        out.write(json.dumps({"summary": summary, "findings": len(findings)}, ensure_ascii=False) + "\n")
+    elif fmt == "text":
+        for record in findings:
+            out.write(" ".join(f"{k}={v}" for k, v in record.items()) + "\n")
+        if "markdown" in summary:
+            out.write(summary["markdown"] + "\n")
+        else:
+            out.write(f"[{command}] 발견 {len(findings)}건 {json.dumps(summary, ensure_ascii=False)}\n")
+    else:
+        json.dump({"command": command, "findings": findings, "summary": summary}, out, ensure_ascii=False, indent=2)
+        out.write("\n")
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.cache:
+        os.environ["MC_HELPER_CACHE"] = args.cache
+    for attr in ("workspace", "src", "dst"):
+        path = getattr(args, attr, None)
+        is_archive = attr != "workspace" and path is not None and path.lower().endswith(".zip") and os.path.isfile(path)
+        if path is not None and not (os.path.isdir(path) or is_archive):
+            sys.stderr.write(f"폴더를 찾을 수 없습니다: {path}\n")
+            return EXIT_ERROR
+    try:
+        findings, summary = args.func(args)
+    except Exception as exc:
+        sys.stderr.write(f"{args.command} 실패: {exc}\n")
+        return EXIT_ERROR
+    emit(args.command, findings, summary, args.format)
+    return EXIT_FINDINGS if findings else EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
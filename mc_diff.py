@@ -3,6 +3,13 @@
 팩/디렉터리 비교 및 동기화 유틸.
 두 경로를 비교해 추가/삭제/수정된 파일을 리스트업하고,
 필요하면 src→dst로 복사/동기화를 수행한다.
+동기화는 먼저 작업 계획(복사/이동/삭제/시각 맞춤)을 세우고, 내용이 같은 파일이
+dst 안에서 경로만 바뀐 경우에는 다시 복사하지 않고 dst 안에서 옮긴다.
+비교 대상 한쪽(또는 양쪽)이 zip이면 압축을 풀지 않고 중앙 디렉터리의 크기/CRC32로 비교하며,
+verify=True일 때만 CRC가 같은 항목의 내용을 스트리밍해 확인한다.
+크기가 다르면 수정, 크기+mtime이 같으면 동일로 보고 해시를 생략하며,
+계산한 해시는 mc_cache에 폴더별로 저장해 다음 비교 때 재사용한다.
+해시는 스레드 풀에서 여러 파일을 동시에 계산한다 (hashlib은 큰 버퍼에서 GIL을 놓는다).
 """
 
 from __future__ import annotations
@@ -10,14 +17,96 @@ from __future__ import annotations
 import hashlib
 import os
 import shutil
-from dataclasses import dataclass
-from typing import Dict, List, Tuple
+import sqlite3
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Tuple
 
+import mc_cache
 
-def file_hash(path: str) -> str:
-    h = hashlib.sha1()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
+
+HASH_ALGO = "blake2b"
+CHUNK_SIZE = 1 << 20  # 1 MB
+
+
+def file_hash(path: str, algo: str = HASH_ALGO, chunk_size: int = CHUNK_SIZE) -> str:
+    h = hashlib.new(algo)
+    with open(path, "rb", buffering=0) as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def file_crc32(path: str, chunk_size: int = CHUNK_SIZE) -> int:
+    crc = 0
+    with open(path, "rb", buffering=0) as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            crc = zlib.crc32(chunk, crc)
+    return crc
+
+
+def _map_files(
+    func: Callable[[str], object],
+    paths: List[str],
+    workers: int | None = None,
+    progress: Callable[[int, int], None] | None = None,
+) -> Dict[str, object]:
+    """func(경로)를 스레드 풀에서 동시에 실행한다. returns: 경로 -> 결과"""
+    result: Dict[str, object] = {}
+    workers = workers or min(32, (os.cpu_count() or 1) * 2)
+    if workers <= 1 or len(paths) < 2:
+        for done, path in enumerate(paths, start=1):
+            if progress:
+                progress(done, len(paths))
+            result[path] = func(path)
+        return result
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mc-hash") as pool:
+        futures = {pool.submit(func, path): path for path in paths}
+        try:
+            for done, fut in enumerate(as_completed(futures), start=1):
+                if progress:
+                    progress(done, len(paths))
+                result[futures[fut]] = fut.result()
+        except BaseException:
+            for fut in futures:
+                fut.cancel()
+            raise
+    return result
+
+
+def hash_files(
+    paths: List[str],
+    algo: str = HASH_ALGO,
+    chunk_size: int = CHUNK_SIZE,
+    workers: int | None = None,
+    progress: Callable[[int, int], None] | None = None,
+) -> Dict[str, str]:
+    """여러 파일을 스레드 풀에서 동시에 해시한다 (hashlib은 큰 버퍼에서 GIL을 놓는다). returns: 경로 -> 해시"""
+    return _map_files(lambda path: file_hash(path, algo, chunk_size), paths, workers, progress)
+
+
+def is_zip(path: str) -> bool:
+    return os.path.isfile(path) and zipfile.is_zipfile(path)
+
+
+def scan_zip(zip_path: str) -> Dict[str, Tuple[int, int]]:
+    """zip 중앙 디렉터리만 읽어 상대 경로(os.sep 구분) -> (원본 크기, CRC32). 폴더 항목은 제외."""
+    found: Dict[str, Tuple[int, int]] = {}
+    with zipfile.ZipFile(zip_path) as zf:
+        for info in zf.infolist():
+            if info.is_dir():
+                continue
+            found[info.filename.replace("/", os.sep)] = (info.file_size, info.CRC)
+    return found
+
+
+def zip_member_hash(zf: zipfile.ZipFile, rel: str, algo: str = HASH_ALGO, chunk_size: int = CHUNK_SIZE) -> str:
+    """zip 항목을 풀면서 해시한다 (zipfile이 끝에서 CRC도 확인). 디스크에 쓰지 않는다."""
+    h = hashlib.new(algo)
+    with zf.open(rel.replace(os.sep, "/")) as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
             h.update(chunk)
     return h.hexdigest()
 
@@ -27,10 +116,13 @@ class DiffResult:
     added: List[str]
     removed: List[str]
     modified: List[str]
+    touched: List[str] = field(default_factory=list)  # 내용은 같고 mtime만 다른 파일
 
     def summary_lines(self) -> List[str]:
         lines: List[str] = []
         lines.append(f"추가 {len(self.added)}개, 삭제 {len(self.removed)}개, 수정 {len(self.modified)}개")
+        if self.touched:
+            lines.append(f"(내용은 같고 수정 시각만 다른 파일 {len(self.touched)}개)")
         if self.added:
             lines.append("추가:")
             lines.extend(f" + {p}" for p in self.added)
@@ -43,42 +135,435 @@ class DiffResult:
         return lines
 
 
-def compare_dirs(src: str, dst: str) -> DiffResult:
-    src_files: Dict[str, str] = {}
-    dst_files: Dict[str, str] = {}
+def scan_tree(root_dir: str) -> Dict[str, Tuple[int, float]]:
+    """root_dir 아래 모든 파일의 상대 경로 -> (크기, mtime). os.scandir로 한 번만 훑는다."""
+    found: Dict[str, Tuple[int, float]] = {}
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        try:
+            it = os.scandir(os.path.join(root_dir, rel_dir))
+        except OSError:
+            continue
+        with it:
+            for de in it:
+                rel = os.path.join(rel_dir, de.name) if rel_dir else de.name
+                try:
+                    if de.is_dir(follow_symlinks=False):
+                        stack.append(rel)
+                    elif de.is_file():
+                        st = de.stat()
+                        found[rel] = (st.st_size, st.st_mtime)
+                except OSError:
+                    continue
+    return found
+
+
+def list_files(root_dir: str) -> List[str]:
+    """root_dir 아래 모든 파일의 상대 경로."""
+    return list(scan_tree(root_dir))
+
+
+class HashCache:
+    """
+    폴더별 파일 해시 캐시 (mc_cache의 diff_hashes 테이블).
+    크기+mtime이 저장된 값과 같으면 파일을 읽지 않고 저장된 해시를 쓴다.
+    해시는 "알고리즘:값" 형태로 저장하므로 HASH_ALGO를 바꾸면 다시 계산된다.
+    """
+
+    def __init__(self, root_dir: str, conn: sqlite3.Connection | None):
+        self.root = os.path.abspath(root_dir)
+        self.conn = conn
+        self.rows: Dict[str, Tuple[int, float, str]] = {}
+        self.updates: List[Tuple[str, str, int, float, str]] = []
+        if conn is None:
+            return
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS diff_hashes ("
+            "root TEXT NOT NULL, rel TEXT NOT NULL, size INTEGER NOT NULL, mtime REAL NOT NULL, "
+            "digest TEXT NOT NULL, PRIMARY KEY (root, rel))"
+        )
+        for rel, size, mtime, digest in conn.execute(
+            "SELECT rel, size, mtime, digest FROM diff_hashes WHERE root = ?", (self.root,)
+        ):
+            self.rows[rel] = (size, mtime, digest)
+
+    def lookup(self, rel: str, size: int, mtime: float) -> str | None:
+        cached = self.rows.get(rel)
+        if cached and cached[0] == size and cached[1] == mtime and cached[2].startswith(HASH_ALGO + ":"):
+            return cached[2]
+        return None
+
+    def store(self, rel: str, size: int, mtime: float, digest: str) -> str:
+        digest = f"{HASH_ALGO}:{digest}"
+        self.rows[rel] = (size, mtime, digest)
+        self.updates.append((self.root, rel, size, mtime, digest))
+        return digest
+
+    def save(self):
+        if self.conn is None or not self.updates:
+            return
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO diff_hashes (root, rel, size, mtime, digest) VALUES (?, ?, ?, ?, ?)",
+                self.updates,
+            )
+        self.updates = []
+
+
+def _side_digests(
+    sides: List[Tuple[str, Dict[str, Tuple[int, float]], Iterable[str]]],
+    progress: Callable[[int, int], None] | None = None,
+) -> List[Dict[str, str]]:
+    """
+    sides: (폴더, scan_tree 결과, 해시할 상대 경로들) 목록.
+    캐시에 없는 파일만 모든 폴더를 합쳐 한 번에 hash_files로 계산한다. returns: 폴더별 상대 경로 -> 해시
+    """
+    try:
+        conn = mc_cache.connect()
+    except sqlite3.Error:
+        conn = None
+    caches = [HashCache(root_dir, conn) for root_dir, _, _ in sides]
+    digests: List[Dict[str, str]] = [{} for _ in sides]
+    try:
+        todo: Dict[str, Tuple[int, str]] = {}
+        for side, ((root_dir, files, rels), cache) in enumerate(zip(sides, caches)):
+            for rel in rels:
+                cached = cache.lookup(rel, *files[rel])
+                if cached is None:
+                    todo[os.path.join(root_dir, rel)] = (side, rel)
+                else:
+                    digests[side][rel] = cached
+        for path, digest in hash_files(list(todo), progress=progress).items():
+            side, rel = todo[path]
+            digests[side][rel] = caches[side].store(rel, *sides[side][1][rel], digest)
+    finally:
+        try:
+            for cache in caches:
+                cache.save()
+        except sqlite3.Error:
+            pass
+        if conn is not None:
+            conn.close()
+    return digests
+
+
+def _compare_with_zip(
+    src: str, dst: str, progress: Callable[[int, int], None] | None = None, verify: bool = False
+) -> DiffResult:
+    """
+    한쪽 이상이 zip인 비교. 크기가 다르면 수정, 같으면 CRC32로 비교한다
+    (폴더 쪽 파일만 읽어 CRC를 계산하고, zip 쪽은 중앙 디렉터리 값을 쓴다).
+    verify=True이면 CRC까지 같은 항목을 양쪽 모두 스트리밍 해시로 다시 확인한다.
+    """
+    zips = {root: zipfile.ZipFile(root) for root in (src, dst) if is_zip(root)}
+    try:
+        infos = [scan_zip(root) if root in zips else scan_tree(root) for root in (src, dst)]
+        src_files, dst_files = infos
+        added = [p for p in src_files if p not in dst_files]
+        removed = [p for p in dst_files if p not in src_files]
+        modified: List[str] = []
+        same_size = [rel for rel, (size, _) in src_files.items() if rel in dst_files and dst_files[rel][0] == size]
+        modified.extend(rel for rel, (size, _) in src_files.items() if rel in dst_files and dst_files[rel][0] != size)
+
+        crcs: List[Dict[str, int]] = []
+        for root, files in zip((src, dst), infos):
+            if root in zips:
+                crcs.append({rel: files[rel][1] for rel in same_size})
+            else:
+                by_path = _map_files(file_crc32, [os.path.join(root, rel) for rel in same_size], progress=progress)
+                crcs.append({rel: by_path[os.path.join(root, rel)] for rel in same_size})
+        matched = [rel for rel in same_size if crcs[0][rel] == crcs[1][rel]]
+        modified.extend(rel for rel in same_size if crcs[0][rel] != crcs[1][rel])
+
+        if verify and matched:
+            digests: List[Dict[str, str]] = []
+            for root in (src, dst):
+                if root in zips:
+                    side: Dict[str, str] = {}
+                    for done, rel in enumerate(matched, start=1):
+                        if progress:
+                            progress(done, len(matched))
+                        try:
+                            side[rel] = zip_member_hash(zips[root], rel)
+                        except zipfile.BadZipFile:
+                            side[rel] = ""  # 손상된 항목 (CRC 불일치 등)
+                    digests.append(side)
+                else:
+                    by_path = hash_files([os.path.join(root, rel) for rel in matched], progress=progress)
+                    digests.append({rel: by_path[os.path.join(root, rel)] for rel in matched})
+            modified.extend(rel for rel in matched if not digests[0][rel] or digests[0][rel] != digests[1][rel])
+    finally:
+        for zf in zips.values():
+            zf.close()
+    return DiffResult(added=sorted(added), removed=sorted(removed), modified=sorted(set(modified)))
+
+
+def compare_dirs(
+    src: str, dst: str, progress: Callable[[int, int], None] | None = None, verify: bool = False
+) -> DiffResult:
+    """
+    크기가 다르면 수정, 크기와 mtime이 모두 같으면 동일로 판단하고,
+    나머지(크기는 같고 mtime만 다른 파일)만 해시로 비교한다.
+    해시까지 같은 파일은 touched(시각만 다름)로 분류한다.
+    src/dst 중 zip 파일이 있으면 압축을 풀지 않고 CRC32로 비교한다 (verify는 zip 비교에만 쓰인다).
+    """
+    if is_zip(src) or is_zip(dst):
+        return _compare_with_zip(src, dst, progress=progress, verify=verify)
+    src_files = scan_tree(src)
+    dst_files = scan_tree(dst)
+
+    added = [p for p in src_files if p not in dst_files]
+    removed = [p for p in dst_files if p not in src_files]
+    modified: List[str] = []
+    touched: List[str] = []
+    uncertain: List[str] = []
+    for rel, (size, mtime) in src_files.items():
+        other = dst_files.get(rel)
+        if other is None:
+            continue
+        if other[0] != size:
+            modified.append(rel)
+        elif other[1] != mtime:
+            uncertain.append(rel)
+
+    if uncertain:
+        src_digests, dst_digests = _side_digests(
+            [(src, src_files, uncertain), (dst, dst_files, uncertain)], progress=progress
+        )
+        for rel in uncertain:
+            (modified if src_digests[rel] != dst_digests[rel] else touched).append(rel)
+
+    return DiffResult(
+        added=sorted(added), removed=sorted(removed), modified=sorted(modified), touched=sorted(touched)
+    )
+
+
+@dataclass
+class SyncOp:
+    """
+    op: "copy"(src→dst), "move"(dst 안에서 origin→rel), "clone"(dst 안에서 origin을 rel로 복사),
+        "delete"(dst에서 삭제), "touch"(src의 시각/권한만 dst에 반영)
+    """
+
+    op: str
+    rel: str
+    origin: str = ""
+
+
+@dataclass
+class SyncReport:
+    copied: int = 0
+    moved: int = 0
+    cloned: int = 0
+    deleted: int = 0
+    touched: int = 0
+
+    def summary(self) -> str:
+        return (
+            f"복사 {self.copied}개, 이동 {self.moved}개, 로컬 복제 {self.cloned}개, "
+            f"삭제 {self.deleted}개, 시각 맞춤 {self.touched}개"
+        )
+
+
+def plan_sync(
+    src: str, dst: str, diff: DiffResult, mirror: bool = False, progress: Callable[[int, int], None] | None = None
+) -> List[SyncOp]:
+    """
+    diff를 최소 작업 계획으로 바꾼다.
+    추가된 파일 중 dst의 삭제 대상(mirror가 아니면 dst의 모든 파일)과 크기·해시가 같은 것은
+    src에서 다시 복사하지 않고 dst 안에서 이동(mirror) 또는 복제한다.
+    mirror=True이면 src에 없는 dst 파일을 삭제한다.
+    """
+    src_files = scan_tree(src) if diff.added else {}
+    dst_files = scan_tree(dst) if diff.added else {}
+    pool = [rel for rel in diff.removed if rel in dst_files] if mirror else sorted(dst_files)
+    by_size: Dict[int, List[str]] = {}
+    for rel in pool:
+        by_size.setdefault(dst_files[rel][0], []).append(rel)
+    added = [rel for rel in diff.added if rel in src_files]
+    maybe = [rel for rel in added if src_files[rel][0] in by_size]
+    origins: Dict[str, str] = {}
+    if maybe:
+        sizes = {src_files[rel][0] for rel in maybe}
+        pool = [rel for rel in pool if dst_files[rel][0] in sizes]
+        src_digests, dst_digests = _side_digests(
+            [(src, src_files, maybe), (dst, dst_files, pool)], progress=progress
+        )
+        by_digest: Dict[str, List[str]] = {}
+        for rel in pool:
+            by_digest.setdefault(dst_digests[rel], []).append(rel)
+        for rel in maybe:
+            candidates = by_digest.get(src_digests[rel])
+            if candidates:
+                origins[rel] = candidates.pop(0) if mirror else candidates[0]
+
+    plan: List[SyncOp] = []
+    used = set(origins.values())
+    for rel in diff.added:
+        if rel in origins:
+            plan.append(SyncOp("move" if mirror else "clone", rel, origins[rel]))
+        else:
+            plan.append(SyncOp("copy", rel))
+    plan.extend(SyncOp("copy", rel) for rel in diff.modified)
+    plan.extend(SyncOp("touch", rel) for rel in diff.touched)
+    if mirror:
+        plan.extend(SyncOp("delete", rel) for rel in diff.removed if rel not in used)
+    return plan
+
+
+def _prune_empty_dirs(root_dir: str, rel: str):
+    """rel의 상위 폴더 중 비어 있는 것을 root_dir 바로 아래까지 지운다."""
+    parent = os.path.dirname(rel)
+    while parent:
+        try:
+            os.rmdir(os.path.join(root_dir, parent))
+        except OSError:
+            return
+        parent = os.path.dirname(parent)
+
+
+def _copy_file(src_path: str, dst_path: str):
+    os.makedirs(os.path.dirname(dst_path), exist_ok=True)
+    shutil.copy2(src_path, dst_path)
+
+
+def _blocked(dst: str, rel: str) -> bool:
+    """dst 안의 rel 자리(또는 그 상위 폴더 자리)를 지금 다른 파일/폴더가 차지하고 있는지."""
+    parts = rel.split(os.sep)
+    for i in range(1, len(parts) + 1):
+        path = os.path.join(dst, *parts[:i])
+        if not os.path.lexists(path):
+            return False
+        if i == len(parts) or not os.path.isdir(path):
+            return True
+    return False
+
+
+def run_sync_plan(
+    src: str,
+    dst: str,
+    plan: List[SyncOp],
+    workers: int | None = None,
+    progress: Callable[[int, int], None] | None = None,
+) -> SyncReport:
+    """
+    계획 실행 순서: dst 안 이동/복제 → 삭제 → src에서 복사(스레드 풀, 동시 실행) → 시각 맞춤.
+    이동과 복제는 삭제보다 먼저 해야 원본이 남아 있다.
+    이동할 자리(또는 그 상위 폴더 자리)를 아직 다른 파일/폴더가 차지하고 있으면(파일 x → 폴더 x/ 등)
+    원본을 dst 안의 임시 이름으로 먼저 옮겨 두고, 삭제가 끝난 뒤 제자리로 옮긴다.
+    """
+    report = SyncReport()
+    total = len(plan)
+    done = 0
+
+    def step():
+        nonlocal done
+        done += 1
+        if progress:
+            progress(done, total)
+
+    def place(item: SyncOp, origin: str):
+        target = os.path.join(dst, item.rel)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        if item.op == "move":
+            os.replace(origin, target)
+            report.moved += 1
+        else:
+            shutil.copy2(origin, target)
+            report.cloned += 1
+        # 경로만 바뀐 파일도 시각은 src와 맞춘다 (다음 비교에서 해시 생략)
+        shutil.copystat(os.path.join(src, item.rel), target)
+
+    parked: List[Tuple[SyncOp, str]] = []
+    for item in plan:
+        if item.op not in ("move", "clone"):
+            continue
+        origin = os.path.join(dst, item.origin)
+        if item.op == "move" and _blocked(dst, item.rel):
+            temp = os.path.join(dst, f".mc-sync-{os.getpid()}-{len(parked)}.tmp")
+            os.replace(origin, temp)
+            _prune_empty_dirs(dst, item.origin)
+            parked.append((item, temp))
+            continue
+        step()
+        place(item, origin)
+        if item.op == "move":
+            _prune_empty_dirs(dst, item.origin)
 
-    for root, _, files in os.walk(src):
-        for f in files:
-            path = os.path.join(root, f)
-            rel = os.path.relpath(path, src)
-            src_files[rel] = file_hash(path)
+    for item in plan:
+        if item.op != "delete":
+            continue
+        step()
+        try:
+            os.remove(os.path.join(dst, item.rel))
+        except FileNotFoundError:
+            pass
+        _prune_empty_dirs(dst, item.rel)
+        report.deleted += 1
 
-    for root, _, files in os.walk(dst):
-        for f in files:
-            path = os.path.join(root, f)
-            rel = os.path.relpath(path, dst)
-            dst_files[rel] = file_hash(path)
+    for item, temp in parked:
+        step()
+        place(item, temp)
 
-    added = [p for p in src_files.keys() if p not in dst_files]
-    removed = [p for p in dst_files.keys() if p not in src_files]
-    modified = [p for p in src_files.keys() if p in dst_files and src_files[p] != dst_files[p]]
+    copies = [item.rel for item in plan if item.op == "copy"]
+    workers = workers or min(8, (os.cpu_count() or 1) * 2)
+    if copies:
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="mc-sync") as pool:
+            futures = [pool.submit(_copy_file, os.path.join(src, rel), os.path.join(dst, rel)) for rel in copies]
+            try:
+                for fut in as_completed(futures):
+                    step()
+                    fut.result()
+                    report.copied += 1
+            except BaseException:
+                for fut in futures:
+                    fut.cancel()
+                raise
 
-    return DiffResult(added=sorted(added), removed=sorted(removed), modified=sorted(modified))
+    for item in plan:
+        if item.op != "touch":
+            continue
+        step()
+        shutil.copystat(os.path.join(src, item.rel), os.path.join(dst, item.rel))
+        report.touched += 1
+    return report
 
 
-def sync_dirs(src: str, dst: str, diff: DiffResult) -> int:
+def sync_dirs(
+    src: str,
+    dst: str,
+    diff: DiffResult,
+    progress: Callable[[int, int], None] | None = None,
+    mirror: bool = False,
+    workers: int | None = None,
+) -> SyncReport:
     """
-    src→dst로 추가/수정 파일을 복사. 삭제 항목은 건드리지 않는다.
-    반환: 복사된 파일 개수.
+    src→dst 동기화. 기본은 추가/수정 파일만 반영하고,
+    mirror=True이면 src에 없는 dst 파일도 삭제해 dst를 src와 똑같이 만든다.
     """
-    copied = 0
-    for rel in diff.added + diff.modified:
-        src_path = os.path.join(src, rel)
-        dst_path = os.path.join(dst, rel)
-        os.makedirs(os.path.dirname(dst_path), exist_ok=True)
-        shutil.copy2(src_path, dst_path)
-        copied += 1
-    return copied
+    if not (os.path.isdir(src) and os.path.isdir(dst)):
+        raise ValueError("동기화는 폴더끼리만 할 수 있습니다 (zip은 비교만 지원).")
+    plan = plan_sync(src, dst, diff, mirror=mirror, progress=progress)
+    return run_sync_plan(src, dst, plan, workers=workers, progress=progress)
 
 
-__all__ = ["DiffResult", "compare_dirs", "sync_dirs"]
+__all__ = [
+    "DiffResult",
+    "HashCache",
+    "SyncOp",
+    "SyncReport",
+    "compare_dirs",
+    "plan_sync",
+    "run_sync_plan",
+    "sync_dirs",
+    "list_files",
+    "scan_tree",
+    "file_hash",
+    "hash_files",
+    "file_crc32",
+    "is_zip",
+    "scan_zip",
+    "zip_member_hash",
+    "HASH_ALGO",
+]
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+"""
+워크스페이스 파일 인덱스.
+datapacks/resourcepacks 트리를 os.scandir로 한 번만 훑어 파일 목록(경로, 종류, 팩,
+네임스페이스, 리소스 유형)을 만들고, lint/stats/schema/callgraph 등
+여러 스캐너가 같은 인덱스를 조회하도록 한다.
+다시 조회할 때는 mtime이 바뀐 디렉터리만 새로 읽는다. 디렉터리 mtime은 파일을 제자리에서 고쳐도
+바뀌지 않으므로 인덱스에는 파일 크기/mtime을 두지 않는다 (필요한 쪽에서 직접 stat).
+팩을 심볼릭 링크로 datapacks/에 넣어도 따라가며, 이미 본 디렉터리(링크 순환)는 다시 읽지 않는다.
+인덱스는 mc_cache(SQLite)에 저장되어 다음 실행 때도 이어서 쓴다.
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Set, Tuple
+
+import mc_cache
+
+PACK_KINDS = ("datapacks", "resourcepacks")
+
+
+@dataclass
+class IndexEntry:
+    rel: str  # base 기준 상대 경로 (os.sep 구분)
+    path: str
+    kind: str  # datapacks / resourcepacks
+    pack: str
+    namespace: str  # data/<ns> 또는 assets/<ns>, 그 외는 ""
+    resource: str  # functions, textures, lang ... (네임스페이스 바로 아래 폴더)
+
+    @property
+    def name(self) -> str:
+        return os.path.basename(self.rel)
+
+
+@dataclass
+class DirRecord:
+    mtime: float
+    subdirs: List[str] = field(default_factory=list)
+    files: List[IndexEntry] = field(default_factory=list)
+
+
+def classify(rel: str) -> Tuple[str, str, str, str]:
+    """상대 경로에서 (kind, pack, namespace, resource)를 추정."""
+    parts = rel.split(os.sep)
+    kind = parts[0]
+    pack = parts[1] if len(parts) > 2 else ""
+    namespace = ""
+    resource = ""
+    if len(parts) > 4 and parts[2] in ("data", "assets"):
+        namespace = parts[3]
+        if len(parts) > 5:
+            resource = parts[4]
+    return kind, pack, namespace, resource
+
+
+class WorkspaceIndex:
+    """datapacks/resourcepacks 아래 모든 파일의 인벤토리."""
+
+    def __init__(self, base: str):
+        self.base = os.path.abspath(base)
+        self.dirs: Dict[str, DirRecord] = {}
+        self.entries: List[IndexEntry] = []
+        self._dirty: Set[str] = set()
+        self._removed: Set[str] = set()
+
+    @property
+    def unsaved(self) -> bool:
+        """save()로 저장할 변경이 있는지."""
+        return bool(self._dirty or self._removed)
+
+    # --- 구축/갱신 ---
+    def refresh(self, rescan: bool = False) -> int:
+        """
+        트리를 다시 확인한다. mtime이 그대로인 디렉터리는 이전 목록을 재사용하고,
+        바뀐 디렉터리만 scandir로 다시 읽는다. rescan=True이면 전부 다시 읽는다.
+        returns: 새로 읽은 디렉터리 수
+        """
+        previous = self.dirs
+        old = {} if rescan else previous
+        self.dirs = {}
+        changed = 0
+        seen: Set[Tuple[int, int]] = set()
+        stack = [kind for kind in PACK_KINDS]
+        while stack:
+            rel = stack.pop()
+            full = os.path.join(self.base, rel)
+            try:
+                st = os.stat(full)
+            except OSError:
+                continue
+            if (st.st_dev, st.st_ino) in seen:
+                continue  # 심볼릭 링크 순환 (또는 같은 폴더를 가리키는 두 번째 링크)
+            seen.add((st.st_dev, st.st_ino))
+            mtime = st.st_mtime
+            record = old.get(rel)
+            if record is None or record.mtime != mtime:
+                record = self._read_dir(rel, full, mtime)
+                self._dirty.add(rel)
+                changed += 1
+            self.dirs[rel] = record
+            stack.extend(os.path.join(rel, sub) for sub in record.subdirs)
+        gone = set(previous) - set(self.dirs)
+        self._removed |= gone
+        if changed or gone:
+            self.entries = [e for rel in sorted(self.dirs) for e in self.dirs[rel].files]
+        return changed
+
+    def _read_dir(self, rel: str, full: str, mtime: float) -> DirRecord:
+        record = DirRecord(mtime=mtime)
+        depth = rel.count(os.sep)
+        try:
+            it = os.scandir(full)
+        except OSError:
+            return record
+        with it:
+            for de in it:
+                try:
+                    if de.is_dir():  # 링크된 팩 폴더도 따라간다 (순환은 refresh에서 막는다)
+                        record.subdirs.append(de.name)
+                        continue
+                    if depth == 0 or not de.is_file():
+                        # datapacks/ 바로 아래 파일(zip 등)은 팩으로 보지 않는다
+                        continue
+                except OSError:
+                    continue
+                file_rel = os.path.join(rel, de.name)
+                kind, pack, ns, res = classify(file_rel)
+                record.files.append(IndexEntry(file_rel, de.path, kind, pack, ns, res))
+        record.subdirs.sort()
+        record.files.sort(key=lambda e: e.rel)
+        return record
+
+    # --- 저장/불러오기 (mc_cache) ---
+    @staticmethod
+    def _ensure_tables(conn: sqlite3.Connection):
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS index_dirs ("
+            "base TEXT NOT NULL, rel TEXT NOT NULL, mtime REAL NOT NULL, subdirs TEXT NOT NULL, "
+            "PRIMARY KEY (base, rel))"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS index_names ("
+            "base TEXT NOT NULL, dir TEXT NOT NULL, name TEXT NOT NULL, PRIMARY KEY (base, dir, name))"
+        )
+
+    def load(self, conn: sqlite3.Connection) -> int:
+        """저장된 인덱스를 읽는다. returns: 불러온 디렉터리 수"""
+        self._ensure_tables(conn)
+        dirs: Dict[str, DirRecord] = {}
+        for rel, mtime, subdirs in conn.execute(
+            "SELECT rel, mtime, subdirs FROM index_dirs WHERE base = ?", (self.base,)
+        ):
+            dirs[rel] = DirRecord(mtime=mtime, subdirs=subdirs.split("\n") if subdirs else [])
+        for dir_rel, name in conn.execute(
+            "SELECT dir, name FROM index_names WHERE base = ? ORDER BY dir, name", (self.base,)
+        ):
+            record = dirs.get(dir_rel)
+            if record is None:
+                continue
+            file_rel = os.path.join(dir_rel, name)
+            kind, pack, ns, res = classify(file_rel)
+            record.files.append(IndexEntry(file_rel, os.path.join(self.base, file_rel), kind, pack, ns, res))
+        self.dirs = dirs
+        self.entries = [e for rel in sorted(dirs) for e in dirs[rel].files]
+        self._dirty.clear()
+        self._removed.clear()
+        return len(dirs)
+
+    def save(self, conn: sqlite3.Connection) -> int:
+        """바뀐 디렉터리만 저장한다. returns: 저장한 디렉터리 수"""
+        if not (self._dirty or self._removed):
+            return 0
+        self._ensure_tables(conn)
+        with conn:
+            for rel in self._removed | self._dirty:
+                conn.execute("DELETE FROM index_dirs WHERE base = ? AND rel = ?", (self.base, rel))
+                conn.execute("DELETE FROM index_names WHERE base = ? AND dir = ?", (self.base, rel))
+            saved = 0
+            for rel in self._dirty:
+                record = self.dirs.get(rel)
+                if record is None:
+                    continue
+                conn.execute(
+                    "INSERT INTO index_dirs (base, rel, mtime, subdirs) VALUES (?, ?, ?, ?)",
+                    (self.base, rel, record.mtime, "\n".join(record.subdirs)),
+                )
+                conn.executemany(
+                    "INSERT INTO index_names (base, dir, name) VALUES (?, ?, ?)",
+                    [(self.base, rel, e.name) for e in record.files],
+                )
+                saved += 1
+        self._dirty.clear()
+        self._removed.clear()
+        return saved
+
+    # --- 조회 ---
+    def packs(self, kind: str) -> List[str]:
+        record = self.dirs.get(kind)
+        return list(record.subdirs) if record else []
+
+    def has_kind(self, kind: str) -> bool:
+        return kind in self.dirs
+
+    def files(
+        self,
+        kind: str | None = None,
+        pack: str | None = None,
+        namespace: str | None = None,
+        resource: str | None = None,
+        ext: str | Tuple[str, ...] | None = None,
+    ) -> Iterable[IndexEntry]:
+        for e in self.entries:
+            if kind is not None and e.kind != kind:
+                continue
+            if pack is not None and e.pack != pack:
+                continue
+            if namespace is not None and e.namespace != namespace:
+                continue
+            if resource is not None and e.resource != resource:
+                continue
+            if ext is not None and not e.rel.endswith(ext):
+                continue
+            yield e
+
+    def mcfunctions(self) -> List[IndexEntry]:
+        """datapacks/*/data/*/functions 아래 mcfunction 목록."""
+        return list(self.files(kind="datapacks", resource="functions", ext=".mcfunction"))
+
+
+_INDEXES: Dict[str, WorkspaceIndex] = {}
+_LOCK = threading.Lock()
+
+
+def get_index(base: str, rescan: bool = False, persist: bool = True) -> WorkspaceIndex:
+    """
+    워크스페이스별로 공유되는 인덱스를 반환한다.
+    호출할 때마다 디렉터리 mtime을 확인해 바뀐 부분만 갱신하므로,
+    여러 탭에서 연달아 스캔해도 전체 트리를 여러 번 읽지 않는다.
+    persist=True이면 처음 호출 시 mc_cache에서 이전 세션의 인덱스를 불러오고,
+    갱신된 디렉터리를 다시 저장한다. DB는 불러오거나 저장할 것이 있을 때만 연다.
+    캐시 DB를 쓸 수 없으면 메모리만 사용한다.
+    """
+    key = os.path.abspath(base)
+    with _LOCK:
+        index = _INDEXES.get(key)
+        fresh = index is None
+        if fresh:
+            index = _INDEXES[key] = WorkspaceIndex(key)
+        if persist and fresh and not rescan:
+            try:
+                conn = mc_cache.connect()
+                try:
+                    index.load(conn)
+                finally:
+                    conn.close()
+            except sqlite3.Error:
+                pass
+        index.refresh(rescan=rescan)
+        if persist and index.unsaved:
+            try:
+                conn = mc_cache.connect()
+                try:
+                    index.save(conn)
+                finally:
+                    conn.close()
+            except sqlite3.Error:
+                pass
+        return index
+
+
+__all__ = ["IndexEntry", "WorkspaceIndex", "get_index", "classify", "PACK_KINDS"]
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+백그라운드 작업 스케줄러.
+오래 걸리는 스캔/압축/비교 작업을 ThreadPoolExecutor에서 실행하고,
+진행률/결과 콜백은 Tk의 root.after 폴링으로 메인 스레드에 전달한다.
+GUI 모듈(tkinter)에 의존하지 않으므로 after 함수만 넘겨주면 된다.
+"""
+from __future__ import annotations
+
+import os
+import queue
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Tuple
+
+
+class JobCancelled(Exception):
+    """작업이 취소되었을 때 작업 함수 안에서 발생한다."""
+
+
+class Job:
+    def __init__(self, key: str, name: str, events: "queue.Queue[Tuple[str, Job, Any]]"):
+        self.key = key
+        self.name = name
+        self._events = events
+        self._cancel = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def check(self):
+        """취소 요청이 있으면 JobCancelled를 던진다 (작업 스레드에서 호출)."""
+        if self._cancel.is_set():
+            raise JobCancelled(self.name)
+
+    def progress(self, done: int, total: int = 0, message: str = ""):
+        """진행률 보고 겸 취소 확인 지점. mc_* 함수의 progress 콜백으로 넘긴다."""
+        self.check()
+        self._events.put(("progress", self, (done, total, message)))
+
+    def emit(self, payload: Any):
+        """부분 결과를 메인 스레드로 보낸다 (스트리밍 출력용)."""
+        self.check()
+        self._events.put(("emit", self, payload))
+
+
+class JobScheduler:
+    """
+    submit()으로 작업을 실행한다. 같은 key의 작업은 동시에 하나만 허용하고,
+    다른 key끼리는 병렬로 실행된다. 콜백은 모두 메인 스레드에서 호출된다.
+    """
+
+    def __init__(self, after: Callable[[int, Callable[[], None]], Any], max_workers: int | None = None, poll_ms: int = 80):
+        self._after = after
+        self._poll_ms = poll_ms
+        self._pool = ThreadPoolExecutor(max_workers=max_workers or min(8, (os.cpu_count() or 2) + 2), thread_name_prefix="mc-job")
+        self._events: "queue.Queue[Tuple[str, Job, Any]]" = queue.Queue()
+        self._jobs: Dict[str, Job] = {}
+        self._handlers: Dict[Job, Dict[str, Callable | None]] = {}
+        self._polling = False
+
+    def running(self, key: str) -> Job | None:
+        return self._jobs.get(key)
+
+    def active(self) -> List[Job]:
+        return list(self._jobs.values())
+
+    def submit(
+        self,
+        key: str,
+        name: str,
+        func: Callable[[Job], Any],
+        on_done: Callable[[Any], None] | None = None,
+        on_error: Callable[[BaseException], None] | None = None,
+        on_progress: Callable[[int, int, str], None] | None = None,
+        on_emit: Callable[[Any], None] | None = None,
+        on_cancel: Callable[[], None] | None = None,
+        on_finish: Callable[[], None] | None = None,
+    ) -> Job:
+        """func(job)을 작업 스레드에서 실행한다. 같은 key가 실행 중이면 RuntimeError."""
+        if key in self._jobs:
+            raise RuntimeError(f"이미 실행 중인 작업입니다: {self._jobs[key].name}")
+        job = Job(key, name, self._events)
+        self._jobs[key] = job
+        self._handlers[job] = {
+            "done": on_done,
+            "error": on_error,
+            "progress": on_progress,
+            "emit": on_emit,
+            "cancel": on_cancel,
+            "finish": on_finish,
+        }
+
+        def run():
+            try:
+                result = func(job)
+            except JobCancelled:
+                self._events.put(("cancel", job, None))
+            except BaseException as exc:  # noqa: BLE001 - 메인 스레드에서 표시
+                if job.cancelled:
+                    self._events.put(("cancel", job, None))
+                else:
+                    self._events.put(("error", job, exc))
+            else:
+                self._events.put(("done", job, result))
+
+        self._pool.submit(run)
+        self._schedule_poll()
+        return job
+
+    def cancel(self, key: str) -> bool:
+        job = self._jobs.get(key)
+        if job is None:
+            return False
+        job.cancel()
+        return True
+
+    def shutdown(self, cancel: bool = True):
+        if cancel:
+            for job in self._jobs.values():
+                job.cancel()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    # --- 메인 스레드 폴링 ---
+    def _schedule_poll(self):
+        if not self._polling:
+            self._polling = True
+            self._after(self._poll_ms, self._poll)
+
+    def _call(self, handler: Callable | None, *args):
+        """콜백 하나를 실행한다. 예외는 출력만 하고 삼켜서 폴링 루프와 다른 작업을 멈추지 않게 한다."""
+        if handler is None:
+            return
+        try:
+            handler(*args)
+        except Exception:  # noqa: BLE001 - 콜백 오류가 스케줄러를 멈추면 안 된다
+            traceback.print_exc()
+
+    def _poll(self):
+        self._polling = False
+        try:
+            latest_progress: Dict[Job, Tuple[int, int, str]] = {}
+            while True:
+                try:
+                    kind, job, payload = self._events.get_nowait()
+                except queue.Empty:
+                    break
+                handlers = self._handlers.get(job)
+                if handlers is None:
+                    continue
+                if kind == "progress":
+                    # 진행률은 폴링 주기당 마지막 값만 반영
+                    latest_progress[job] = payload
+                    continue
+                if kind == "emit":
+                    self._call(handlers["emit"], payload)
+                    continue
+                latest_progress.pop(job, None)
+                self._finish(job, kind, payload)
+            for job, payload in latest_progress.items():
+                self._call(self._handlers.get(job, {}).get("progress"), *payload)
+        finally:
+            if self._jobs:
+                self._schedule_poll()
+
+    def _finish(self, job: Job, kind: str, payload: Any):
+        handlers = self._handlers.pop(job)
+        if self._jobs.get(job.key) is job:
+            del self._jobs[job.key]
+        if kind == "done":
+            self._call(handlers["done"], payload)
+        elif kind == "error":
+            self._call(handlers["error"], payload)
+        elif kind == "cancel":
+            self._call(handlers["cancel"])
+        self._call(handlers["finish"])
+
+__all__ = ["Job", "JobCancelled", "JobScheduler"]
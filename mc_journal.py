@@ -0,0 +1,334 @@
+# -*- coding: utf-8 -*-
+"""
+일괄 수정용 쓰기 저널(되돌리기).
+파일을 덮어쓰기 전에 원본 바이트만 <워크스페이스>/.mc_helper_journal/<시각-작업명>/에 저장하고,
+새 내용은 임시 파일에 쓴 뒤 os.replace로 교체한다(중간에 죽어도 파일이 반쯤 쓰이지 않는다).
+with 블록 안에서 예외가 나면 자동으로 원래대로 되돌리고, 끝난 작업도 rollback()으로 되돌릴 수 있다.
+전체 폴더 백업(copytree) 대신 바뀐 파일만 보관한다.
+"""
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+from dataclasses import dataclass
+from typing import Dict, List
+
+JOURNAL_DIR = ".mc_helper_journal"
+MANIFEST = "journal.json"
+ENTRIES = "entries.ndjson"
+KEEP_JOURNALS = 20
+
+STATE_OPEN = "open"  # 진행 중이거나 비정상 종료
+STATE_COMMITTED = "committed"
+STATE_ROLLED_BACK = "rolled_back"
+
+# 이 프로세스에서 진행 중인 Journal 수 (워크스페이스별). 진행 중인 작업 밑에서 되돌리지 않도록 쓴다.
+_LIVE: Dict[str, int] = {}
+_LIVE_LOCK = threading.Lock()
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _text_digest(text: str) -> str:
+    """atomic_write_text가 디스크에 쓰는 바이트의 해시 (텍스트 모드는 \\n을 os.linesep으로 바꿔 쓴다)."""
+    return _digest(text.replace("\n", os.linesep).encode("utf-8"))
+
+
+def atomic_write_text(path: str, text: str):
+    """같은 폴더의 임시 파일에 쓰고 os.replace로 교체한다. 기존 파일 권한은 유지."""
+    folder = os.path.dirname(path) or "."
+    tmp = os.path.join(folder, f".{os.path.basename(path)}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        if os.path.exists(path):
+            shutil.copymode(path, tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def _atomic_write_bytes(path: str, data: bytes):
+    folder = os.path.dirname(path) or "."
+    os.makedirs(folder, exist_ok=True)
+    tmp = os.path.join(folder, f".{os.path.basename(path)}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+@dataclass
+class JournalInfo:
+    path: str
+    label: str
+    created: str
+    state: str
+    entries: int
+
+
+class Journal:
+    """
+    with Journal(base, "replace") as journal:
+        journal.write_text(path, new_content)
+        journal.move(src, dst)
+
+    경로는 base 기준 상대 경로로 기록한다. 변경이 하나도 없으면 저널 폴더를 남기지 않는다.
+    """
+
+    def __init__(self, base: str, label: str):
+        self.base = os.path.abspath(base)
+        self.label = label
+        stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        safe = re.sub(r"[^0-9A-Za-z_.-]+", "_", label) or "edit"
+        self.path = os.path.join(self.base, JOURNAL_DIR, f"{stamp}-{safe}")
+        self.created = datetime.datetime.now().isoformat(timespec="seconds")
+        self.count = 0
+        self._saved: Dict[str, bool] = {}
+        self._log = None
+
+    # --- with 블록 ---
+    def __enter__(self) -> "Journal":
+        with _LIVE_LOCK:
+            _LIVE[self.base] = _LIVE.get(self.base, 0) + 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self.commit()
+            else:
+                self.abort()
+        finally:
+            with _LIVE_LOCK:
+                _LIVE[self.base] -= 1
+                if not _LIVE[self.base]:
+                    del _LIVE[self.base]
+        return False
+
+    def _open(self):
+        if self._log is not None:
+            return
+        os.makedirs(os.path.join(self.path, "files"), exist_ok=True)
+        self._write_manifest(STATE_OPEN)
+        self._log = open(os.path.join(self.path, ENTRIES), "a", encoding="utf-8")
+        prune_journals(self.base, keep=KEEP_JOURNALS, exclude=self.path)
+
+    def _write_manifest(self, state: str):
+        data = {"label": self.label, "created": self.created, "state": state, "entries": self.count}
+        _atomic_write_bytes(
+            os.path.join(self.path, MANIFEST), json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        )
+
+    def _append(self, entry: Dict):
+        self._open()
+        self._log.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._log.flush()
+        self.count += 1
+
+    def _rel(self, path: str) -> str:
+        return os.path.relpath(os.path.abspath(path), self.base)
+
+    # --- 기록 + 실행 ---
+    def write_text(self, path: str, text: str):
+        """
+        원본을 저널에 보관한 뒤 text로 원자적 교체 (텍스트 모드, utf-8).
+        쓴 내용의 해시도 남겨, 되돌릴 때 그 뒤에 사용자가 고친 파일은 덮어쓰지 않게 한다.
+        """
+        rel = self._rel(path)
+        written = _text_digest(text)
+        if rel in self._saved:
+            atomic_write_text(path, text)
+            # 같은 파일을 다시 쓰면 원본은 그대로 두고 마지막으로 쓴 내용만 갱신한다
+            self._append({"op": "rewrite", "rel": rel, "written": written})
+            return
+        existed = os.path.exists(path)
+        blob = None
+        if existed:
+            with open(path, "rb") as f:
+                original = f.read()
+            blob = f"{self.count:06d}"
+            self._open()
+            _atomic_write_bytes(os.path.join(self.path, "files", blob), original)
+        self._append({"op": "write", "rel": rel, "existed": existed, "blob": blob, "written": written})
+        self._saved[rel] = True
+        atomic_write_text(path, text)
+
+    def move(self, src: str, dst: str):
+        """파일/폴더 이동을 기록하고 실행한다."""
+        self._append({"op": "move", "src": self._rel(src), "dst": self._rel(dst)})
+        shutil.move(src, dst)
+        # 이동 뒤 경로로 다시 쓰는 파일은 새로 보관해야 한다
+        self._saved.clear()
+
+    def commit(self):
+        if self._log is None:
+            return
+        self._log.close()
+        self._log = None
+        self._write_manifest(STATE_COMMITTED)
+
+    def abort(self) -> List[str]:
+        """지금까지의 변경을 되돌린다 (예외/취소 시 자동 호출)."""
+        if self._log is None:
+            return []
+        self._log.close()
+        self._log = None
+        return rollback(self.path)
+
+
+def _read_manifest(path: str) -> Dict:
+    with open(os.path.join(path, MANIFEST), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _read_entries(path: str) -> List[Dict]:
+    entries: List[Dict] = []
+    entries_path = os.path.join(path, ENTRIES)
+    if not os.path.exists(entries_path):
+        return entries
+    with open(entries_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                break  # 비정상 종료로 마지막 줄이 잘린 경우
+    return entries
+
+
+def list_journals(base: str) -> List[JournalInfo]:
+    """저널 목록 (최신 순)."""
+    root = os.path.join(base, JOURNAL_DIR)
+    if not os.path.isdir(root):
+        return []
+    infos: List[JournalInfo] = []
+    for name in sorted(os.listdir(root), reverse=True):
+        path = os.path.join(root, name)
+        try:
+            meta = _read_manifest(path)
+        except (OSError, json.JSONDecodeError):
+            continue
+        infos.append(
+            JournalInfo(path, meta.get("label", ""), meta.get("created", ""), meta.get("state", ""), meta.get("entries", 0))
+        )
+    return infos
+
+
+def rollback(journal_path: str) -> List[str]:
+    """
+    저널의 변경을 역순으로 되돌린다. 이미 원본과 같은 파일은 건너뛰고,
+    저널이 마지막으로 쓴 내용과 달라진 파일(그 뒤에 직접 고친 파일)은 덮어쓰지 않는다.
+    returns: 로그
+    """
+    meta = _read_manifest(journal_path)
+    if meta.get("state") == STATE_ROLLED_BACK:
+        return ["이미 되돌린 작업입니다."]
+    base = os.path.dirname(os.path.dirname(os.path.abspath(journal_path)))
+    logs: List[str] = []
+    latest: Dict[str, str] = {}  # rel -> 저널이 마지막으로 쓴 내용의 해시 (역순이므로 처음 본 rewrite)
+    for entry in reversed(_read_entries(journal_path)):
+        if entry["op"] == "move":
+            src = os.path.join(base, entry["src"])
+            dst = os.path.join(base, entry["dst"])
+            if os.path.exists(dst) and not os.path.exists(src):
+                shutil.move(dst, src)
+                logs.append(f"이동 복원: {entry['dst']} -> {entry['src']}")
+            else:
+                logs.append(f"이동 복원 불가(경로 충돌): {entry['dst']} -> {entry['src']}")
+            continue
+        if entry["op"] == "rewrite":
+            latest.setdefault(entry["rel"], entry["written"])
+            continue
+        # 예전 저널에는 "written"이 없다: 그때처럼 확인 없이 되돌린다
+        written = latest.pop(entry["rel"], entry.get("written"))
+        target = os.path.join(base, entry["rel"])
+        current = None
+        if os.path.exists(target):
+            with open(target, "rb") as f:
+                current = _digest(f.read())
+        if not entry["existed"]:
+            if current is None:
+                continue
+            if written is not None and current != written:
+                logs.append(f"복원 안 함(수정 이후 변경됨): {entry['rel']}")
+                continue
+            os.remove(target)
+            logs.append(f"생성 취소: {entry['rel']}")
+            continue
+        blob = os.path.join(journal_path, "files", entry["blob"])
+        with open(blob, "rb") as f:
+            original = f.read()
+        if current == _digest(original):
+            continue
+        if current is not None and written is not None and current != written:
+            logs.append(f"복원 안 함(수정 이후 변경됨): {entry['rel']}")
+            continue
+        _atomic_write_bytes(target, original)
+        logs.append(f"복원: {entry['rel']}")
+    meta["state"] = STATE_ROLLED_BACK
+    _atomic_write_bytes(
+        os.path.join(journal_path, MANIFEST), json.dumps(meta, ensure_ascii=False, indent=2).encode("utf-8")
+    )
+    if not logs:
+        logs.append("되돌릴 변경이 없습니다.")
+    return logs
+
+
+def journal_busy(base: str) -> bool:
+    """이 프로세스에서 base의 일괄 수정(Journal)이 아직 진행 중인지."""
+    with _LIVE_LOCK:
+        return os.path.abspath(base) in _LIVE
+
+
+def rollback_last(base: str) -> List[str]:
+    """
+    아직 되돌리지 않은 가장 최근 작업을 되돌린다.
+    같은 워크스페이스의 수정 작업이 진행 중이면 그 작업의 파일을 건드리지 않도록 되돌리지 않는다
+    (state가 open인 저널은 진행 중이 아닐 때만, 즉 비정상 종료로 남은 것만 되돌린다).
+    """
+    if journal_busy(base):
+        return ["수정 작업이 아직 진행 중입니다. 작업이 끝난 뒤 되돌리세요."]
+    for info in list_journals(base):
+        if info.state != STATE_ROLLED_BACK:
+            return [f"[{info.label}] {info.created} 작업 되돌리기"] + rollback(info.path)
+    return ["되돌릴 작업이 없습니다."]
+
+
+def prune_journals(base: str, keep: int = KEEP_JOURNALS, exclude: str | None = None) -> int:
+    """오래된 저널을 keep개만 남기고 지운다. returns: 지운 수"""
+    removed = 0
+    for info in list_journals(base)[keep:]:
+        if exclude and os.path.abspath(info.path) == os.path.abspath(exclude):
+            continue
+        shutil.rmtree(info.path, ignore_errors=True)
+        removed += 1
+    return removed
+
+
+__all__ = [
+    "Journal",
+    "JournalInfo",
+    "atomic_write_text",
+    "journal_busy",
+    "list_journals",
+    "rollback",
+    "rollback_last",
+    "prune_journals",
+    "JOURNAL_DIR",
+]
@@ -2,72 +2,249 @@
 """
 mcfunction 간단 린터: 흔히 실수하는 포맷 문제를 빠르게 알려준다.
 완벽한 문법 검사는 아니며, 배포 전 기본 품질 확인용이다.
+규칙은 mc_lintrules에 등록되어 있고, 워크스페이스의 mc_lint.json으로 켜고 끈다.
+파일별 결과는 mc_cache에 저장해 두고, 크기+mtime(또는 내용 해시)가 같으면 재사용한다.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
-from typing import List, Tuple
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Tuple
+
+import mc_cache
+from mc_index import get_index
+from mc_lintrules import load_config, rules_stamp, run_rules
+
+# 이보다 적은 파일은 프로세스 풀을 띄우지 않고 바로 검사한다
+PARALLEL_MIN_FILES = 200
 
 
 def iter_mcfunctions(base: str) -> List[Tuple[str, str]]:
     """datapacks/*/data/*/functions 내 mcfunction 경로를 리스트로 반환."""
-    results = []
-    dp_root = os.path.join(base, "datapacks")
-    if not os.path.isdir(dp_root):
-        return results
-    for pack in os.listdir(dp_root):
-        p_path = os.path.join(dp_root, pack)
-        if not os.path.isdir(p_path):
-            continue
-        data_dir = os.path.join(p_path, "data")
-        if not os.path.isdir(data_dir):
-            continue
-        for ns in os.listdir(data_dir):
-            fn_dir = os.path.join(data_dir, ns, "functions")
-            if not os.path.isdir(fn_dir):
-                continue
-            for root, _, files in os.walk(fn_dir):
-                for file in files:
-                    if file.endswith(".mcfunction"):
-                        full = os.path.join(root, file)
-                        rel = os.path.relpath(full, base)
-                        results.append((rel, full))
-    return results
+    return [(e.rel, e.path) for e in get_index(base).mcfunctions()]
 
 
-def lint_function(path: str) -> List[str]:
-    issues: List[str] = []
+def lint_text(text: str, enabled: Iterable[str] | None = None) -> List[str]:
+    """파일 내용에 켜진 규칙(기본: 기본 규칙 전체)을 실행한다."""
+    return run_rules(text, enabled)
+
+
+def lint_function(path: str, enabled: Iterable[str] | None = None) -> List[str]:
     with open(path, "r", encoding="utf-8", errors="replace") as f:
-        lines = f.readlines()
-    if not lines:
-        issues.append("빈 파일")
+        return lint_text(f.read(), enabled)
+
+
+def _lint_one(
+    path: str, cached_digest: str | None = None, enabled: Iterable[str] | None = None
+) -> Tuple[int, float, str, List[str] | None]:
+    """
+    파일을 읽어 (크기, mtime, 내용 해시, 문제 목록)을 반환한다.
+    내용 해시가 cached_digest와 같으면 문제 목록 대신 None(캐시 재사용).
+    """
+    st = os.stat(path)
+    with open(path, "rb") as f:
+        data = f.read()
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+    if digest == cached_digest:
+        return st.st_size, st.st_mtime, digest, None
+    return st.st_size, st.st_mtime, digest, lint_text(data.decode("utf-8", errors="replace"), enabled)
+
+
+def _lint_chunk(
+    items: List[Tuple[str, str | None]], enabled: FrozenSet[str]
+) -> List[Tuple[str, Tuple[int, float, str, List[str] | None] | None]]:
+    """작업 프로세스에서 실행: [(경로, 캐시된 해시)] -> [(경로, _lint_one 결과 또는 None)]"""
+    out = []
+    for path, cached_digest in items:
+        try:
+            out.append((path, _lint_one(path, cached_digest, enabled)))
+        except OSError:
+            out.append((path, None))
+    return out
+
+
+class LintCache:
+    """
+    파일별 린트 결과 캐시 (mc_cache의 lint_cache 테이블).
+    크기+mtime이 같으면 파일을 읽지 않고 재사용하고, 다르면 내용 해시를 비교한다.
+    항목에는 규칙 버전+켜진 규칙 목록(stamp)이 붙어 있어, 규칙 설정이 바뀌면 다시 검사한다.
+    DB를 쓸 수 없으면 캐시 없이 동작한다.
+    """
+
+    def __init__(self, conn: sqlite3.Connection | None, enabled: FrozenSet[str]):
+        self.conn = conn
+        self.enabled = enabled
+        self.stamp = rules_stamp(enabled)
+        self.rows: Dict[str, Tuple[int, float, str, List[str]]] = {}
+        self.updates: List[Tuple[str, int, float, str, str, str]] = []
+        if conn is None:
+            return
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS lint_cache ("
+            "path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime REAL NOT NULL, "
+            "digest TEXT NOT NULL, version TEXT NOT NULL, issues TEXT NOT NULL)"
+        )
+        for path, size, mtime, digest, issues in conn.execute(
+            "SELECT path, size, mtime, digest, issues FROM lint_cache WHERE version = ?", (self.stamp,)
+        ):
+            self.rows[path] = (size, mtime, digest, json.loads(issues))
+
+    def lookup(self, path: str) -> List[str] | None:
+        """크기+mtime이 캐시와 같으면 저장된 결과, 아니면 None."""
+        cached = self.rows.get(path)
+        if cached is None:
+            return None
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if cached[0] == st.st_size and cached[1] == st.st_mtime:
+            return cached[3]
+        return None
+
+    def digest(self, path: str) -> str | None:
+        cached = self.rows.get(path)
+        return cached[2] if cached else None
+
+    def store(self, path: str, result: Tuple[int, float, str, List[str] | None]) -> List[str]:
+        """_lint_one 결과를 기록하고 최종 문제 목록을 반환한다."""
+        size, mtime, digest, issues = result
+        if issues is None:
+            issues = self.rows[path][3]
+        self.rows[path] = (size, mtime, digest, issues)
+        self.updates.append((path, size, mtime, digest, self.stamp, json.dumps(issues, ensure_ascii=False)))
         return issues
-    for idx, line in enumerate(lines, start=1):
-        if line.rstrip("\n").endswith(" "):
-            issues.append(f"{idx}행: 끝 공백 존재")
-        if "\t" in line:
-            issues.append(f"{idx}행: 탭 문자가 있습니다 (스페이스 권장)")
-        if line.strip() == "":
-            continue
-        if line.startswith(" " * 4):
-            issues.append(f"{idx}행: 들여쓰기 4스페이스 (불필요할 수 있음)")
-    return issues
-
-
-def lint_workspace(base: str) -> List[str]:
-    results: List[str] = []
+
+    def lint(self, path: str) -> List[str]:
+        issues = self.lookup(path)
+        if issues is not None:
+            return issues
+        try:
+            return self.store(path, _lint_one(path, self.digest(path), self.enabled))
+        except OSError:
+            return lint_function(path, self.enabled)
+
+    def save(self):
+        if self.conn is None or not self.updates:
+            return
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO lint_cache (path, size, mtime, digest, version, issues) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                self.updates,
+            )
+        self.updates = []
+
+    def close(self):
+        try:
+            self.save()
+        except sqlite3.Error:
+            pass
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+def _open_cache(enabled: FrozenSet[str], use_cache: bool = True) -> LintCache:
+    if not use_cache:
+        return LintCache(None, enabled)
+    try:
+        return LintCache(mc_cache.connect(), enabled)
+    except sqlite3.Error:
+        return LintCache(None, enabled)
+
+
+def iter_lint(
+    base: str,
+    progress: Callable[[int, int], None] | None = None,
+    workers: int | None = None,
+    use_cache: bool = True,
+) -> Iterator[Tuple[str, List[str]]]:
+    """
+    (상대 경로, 문제 목록)을 끝나는 순서대로 내보낸다.
+    캐시에 있는 파일을 먼저 내보내고, 나머지는 CPU 수만큼의 프로세스 풀에서 검사한다.
+    검사할 파일이 PARALLEL_MIN_FILES보다 적거나 workers=1이면 현재 프로세스에서 처리한다.
+    규칙은 base/mc_lint.json 설정을 따른다 (형식 오류 시 ValueError).
+    """
+    enabled = load_config(base)
     mcfs = iter_mcfunctions(base)
-    if not mcfs:
+    total = len(mcfs)
+    done = 0
+    cache = _open_cache(enabled, use_cache)
+    try:
+        pending: List[Tuple[str, str]] = []
+        for rel, full in mcfs:
+            issues = cache.lookup(full)
+            if issues is None:
+                pending.append((rel, full))
+                continue
+            done += 1
+            if progress:
+                progress(done, total)
+            yield rel, issues
+
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(pending) < PARALLEL_MIN_FILES:
+            for rel, full in pending:
+                done += 1
+                if progress:
+                    progress(done, total)
+                yield rel, cache.lint(full)
+            return
+
+        rel_of = {full: rel for rel, full in pending}
+        chunk = max(16, len(pending) // (workers * 8))
+        pool = ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = [
+                pool.submit(_lint_chunk, [(full, cache.digest(full)) for _, full in pending[i : i + chunk]], enabled)
+                for i in range(0, len(pending), chunk)
+            ]
+            for fut in as_completed(futures):
+                for full, result in fut.result():
+                    done += 1
+                    if progress:
+                        progress(done, total)
+                    yield rel_of[full], (cache.store(full, result) if result else lint_function(full, enabled))
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+    finally:
+        cache.close()
+
+
+def lint_issues(
+    base: str,
+    progress: Callable[[int, int], None] | None = None,
+    workers: int | None = None,
+) -> List[Tuple[str, str]]:
+    """(상대 경로, 메시지) 목록을 경로 순으로. 파일이 없으면 빈 리스트. 바뀐 파일만 다시 검사한다."""
+    by_rel = dict(iter_lint(base, progress=progress, workers=workers))
+    return [(rel, msg) for rel in sorted(by_rel) for msg in by_rel[rel]]
+
+
+def lint_workspace(
+    base: str,
+    progress: Callable[[int, int], None] | None = None,
+    workers: int | None = None,
+) -> List[str]:
+    if not iter_mcfunctions(base):
         return ["검사할 mcfunction 파일이 없습니다."]
-    for rel, full in mcfs:
-        issues = lint_function(full)
-        if issues:
-            for msg in issues:
-                results.append(f"{rel}: {msg}")
+    results = [f"{rel}: {msg}" for rel, msg in lint_issues(base, progress=progress, workers=workers)]
     if not results:
         results.append("모든 mcfunction 기본 포맷 OK")
     return results
 
 
-__all__ = ["lint_workspace"]
+__all__ = [
+    "lint_workspace",
+    "lint_issues",
+    "iter_lint",
+    "lint_function",
+    "lint_text",
+    "LintCache",
+    "PARALLEL_MIN_FILES",
+]
@@ -0,0 +1,400 @@
+# -*- coding: utf-8 -*-
+"""
+mcfunction 린트 규칙 엔진.
+각 줄을 한 번만 토큰화(명령어 루트, 선택자, NBT/JSON 블록, 문자열, 좌표, 리소스 ID)하고,
+규칙은 관심 있는 토큰 종류에 등록해 한 번의 순회로 모두 실행된다.
+워크스페이스 루트의 mc_lint.json으로 규칙을 켜고 끌 수 있다.
+
+    {"disable": ["indent-4"], "enable": []}
+"""
+from __future__ import annotations
+
+import io
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Callable, Dict, FrozenSet, Iterable, List, Tuple
+
+# 규칙/토크나이저 동작을 바꾸면 올린다 (mc_lint 캐시 무효화)
+RULES_VERSION = "2"
+CONFIG_FILE = "mc_lint.json"
+
+# 규칙이 구독할 수 있는 대상: 토큰 종류 + raw(모든 줄), command(명령 줄), file(파일 전체)
+TOKEN_KINDS = ("word", "resource", "coord", "selector", "nbt", "string")
+TARGETS = ("raw", "command", "file") + TOKEN_KINDS
+
+KNOWN_COMMANDS = frozenset(
+    """
+    advancement attribute ban ban-ip banlist bossbar clear clone damage data datapack debug
+    defaultgamemode deop difficulty effect enchant execute experience fill fillbiome forceload
+    function gamemode gamerule give help item jfr kick kill list locate loot me msg op pardon
+    pardon-ip particle perf place playsound publish random recipe reload return ride rotate say
+    save-all save-off save-on schedule scoreboard seed setblock setidletimeout setworldspawn
+    spawnpoint spectate spreadplayers stop stopsound summon tag team teammsg teleport tell tellraw
+    test tick time title tm tp transfer trigger w weather whitelist worldborder xp
+    """.split()
+)
+SELECTOR_TYPES = frozenset("parsen")
+# 나머지 줄 전체를 메시지로 받는 명령어 (say hi :] 같은 본문은 토큰화하지 않는다)
+GREEDY_COMMANDS = frozenset(("say", "me", "tell", "msg", "w", "teammsg", "tm"))
+
+_CLOSE = {"{": "}", "[": "]"}
+_PLAIN = re.compile(r"[^ \t{}\[\]\"']+")
+_NUMBER = re.compile(r"^-?\d+(\.\d+)?$")
+
+
+@dataclass
+class Token:
+    kind: str
+    text: str
+    col: int
+    error: str | None = None  # 괄호/따옴표 짝 오류
+
+
+@dataclass
+class Line:
+    no: int
+    raw: str  # 줄바꿈 포함 원문
+    tokens: List[Token] = field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        return self.raw.rstrip("\n")
+
+    @property
+    def is_command(self) -> bool:
+        """빈 줄/주석/매크로($)가 아닌 명령 줄."""
+        stripped = self.raw.strip()
+        return bool(stripped) and stripped[0] not in "#$"
+
+    def commands(self) -> Iterable[int]:
+        """명령어 루트 토큰 위치: 줄 첫 토큰과 execute ... run 뒤의 토큰."""
+        if not self.tokens:
+            return
+        yield 0
+        if self.tokens[0].text != "execute":
+            return
+        for idx, tok in enumerate(self.tokens[:-1]):
+            if tok.kind == "word" and tok.text == "run":
+                yield idx + 1
+
+
+def _scan_quoted(text: str, i: int) -> Tuple[int, str | None]:
+    quote = text[i]
+    i += 1
+    n = len(text)
+    while i < n:
+        c = text[i]
+        if c == "\\":
+            i += 2
+            continue
+        if c == quote:
+            return i + 1, None
+        i += 1
+    return n, "닫는 따옴표 없음"
+
+
+def _scan_group(text: str, i: int) -> Tuple[int, str | None]:
+    """text[i]의 { 또는 [ 부터 짝이 맞는 닫는 괄호 다음 위치까지."""
+    stack = [_CLOSE[text[i]]]
+    i += 1
+    n = len(text)
+    while i < n:
+        c = text[i]
+        if c in "\"'":
+            i, err = _scan_quoted(text, i)
+            if err:
+                return n, err
+            continue
+        if c in "{[":
+            stack.append(_CLOSE[c])
+        elif c in "}]":
+            if c != stack[-1]:
+                return i + 1, f"'{stack[-1]}' 대신 '{c}'"
+            stack.pop()
+            if not stack:
+                return i + 1, None
+        i += 1
+    return n, f"'{stack[-1]}' 닫히지 않음"
+
+
+def _classify(text: str) -> str:
+    c = text[0]
+    if c == "@":
+        return "selector"
+    if c in "{[":
+        return "nbt"
+    if c in "\"'":
+        return "string"
+    if c in "~^" or _NUMBER.match(text):
+        return "coord"
+    if ":" in text:
+        return "resource"
+    return "word"
+
+
+def tokenize(text: str) -> List[Token]:
+    """
+    공백 기준으로 나누되, {...}/[...]/따옴표 안의 공백은 토큰을 끊지 않는다.
+    minecraft:stone[facing=north]{...}처럼 붙어 있는 블록은 하나의 토큰이다.
+    따옴표는 토큰 첫 글자일 때만 문자열로 본다 (don't 같은 본문 보호).
+    say 등 GREEDY_COMMANDS 뒤의 나머지는 string 토큰 하나로 둔다.
+    """
+    tokens: List[Token] = []
+    i = 0
+    n = len(text)
+    while i < n:
+        c = text[i]
+        if c in " \t":
+            i += 1
+            continue
+        start = i
+        error = None
+        while i < n and text[i] not in " \t":
+            m = _PLAIN.match(text, i)
+            if m:
+                i = m.end()
+                continue
+            c = text[i]
+            if c in "{[":
+                i, error = _scan_group(text, i)
+            elif c in "\"'":
+                if i != start:
+                    i += 1
+                    continue
+                i, error = _scan_quoted(text, i)
+            else:  # 짝 없는 닫는 괄호
+                i, error = i + 1, f"짝 없는 '{c}'"
+            if error:
+                break
+        word = text[start:i]
+        tokens.append(Token(_classify(word), word, start + 1, error))
+        if len(tokens) == 1 and word in GREEDY_COMMANDS:
+            rest = text[i:].strip(" \t")
+            if rest:
+                tokens.append(Token("string", rest, text.index(rest, i) + 1))
+            break
+    return tokens
+
+
+# --- 규칙 레지스트리 ---
+@dataclass
+class Rule:
+    id: str
+    description: str
+    targets: Tuple[str, ...]
+    check: Callable
+    default: bool = True
+
+
+RULES: Dict[str, Rule] = {}
+
+
+def rule(rule_id: str, description: str, on: Tuple[str, ...], default: bool = True):
+    """
+    규칙 등록 데코레이터. on은 TARGETS 중 구독할 대상.
+    check(line, token)은 문제 메시지(str) 또는 None을 반환한다.
+    file 대상 규칙은 check(lines)로 호출된다.
+    """
+    for target in on:
+        if target not in TARGETS:
+            raise ValueError(f"알 수 없는 규칙 대상: {target}")
+
+    def register(func):
+        if rule_id in RULES:
+            raise ValueError(f"이미 등록된 규칙: {rule_id}")
+        RULES[rule_id] = Rule(rule_id, description, tuple(on), func, default)
+        return func
+
+    return register
+
+
+@rule("empty-file", "빈 파일", on=("file",))
+def _empty_file(lines: List[Line]):
+    return None if lines else "빈 파일"
+
+
+@rule("trailing-whitespace", "줄 끝 공백", on=("raw",))
+def _trailing_whitespace(line: Line, token: Token | None):
+    return "끝 공백 존재" if line.text.endswith(" ") else None
+
+
+@rule("tab-character", "탭 문자", on=("raw",))
+def _tab_character(line: Line, token: Token | None):
+    return "탭 문자가 있습니다 (스페이스 권장)" if "\t" in line.raw else None
+
+
+@rule("indent-4", "4칸 들여쓰기", on=("raw",))
+def _indent_4(line: Line, token: Token | None):
+    if line.raw.strip() and line.raw.startswith(" " * 4):
+        return "들여쓰기 4스페이스 (불필요할 수 있음)"
+    return None
+
+
+@rule("unknown-command", "알 수 없는 명령어", on=("command",))
+def _unknown_command(line: Line, token: Token | None):
+    unknown = [
+        line.tokens[idx].text
+        for idx in line.commands()
+        if line.tokens[idx].kind == "word" and line.tokens[idx].text.lstrip("/") not in KNOWN_COMMANDS
+    ]
+    return f"알 수 없는 명령어: {', '.join(unknown)}" if unknown else None
+
+
+@rule("function-namespace", "function 호출의 네임스페이스 누락", on=("command",))
+def _function_namespace(line: Line, token: Token | None):
+    for idx in line.commands():
+        if line.tokens[idx].text == "function" and idx + 1 < len(line.tokens):
+            target = line.tokens[idx + 1]
+            if target.kind == "word" and ":" not in target.text:
+                return f"function 호출에 네임스페이스가 없습니다: {target.text}"
+    return None
+
+
+@rule("unbalanced-brackets", "괄호/따옴표 짝", on=TOKEN_KINDS)
+def _unbalanced_brackets(line: Line, token: Token):
+    if token.error:
+        return f"{token.col}열 괄호/따옴표 짝이 맞지 않습니다 ({token.error}): {token.text[:40]}"
+    return None
+
+
+@rule("bad-selector", "잘못된 대상 선택자", on=("selector",))
+def _bad_selector(line: Line, token: Token):
+    text = token.text
+    if len(text) < 2 or text[1] not in SELECTOR_TYPES:
+        return f"잘못된 선택자: {text[:40]}"
+    rest = text[2:]
+    if not rest:
+        return None
+    if rest[0] != "[" or token.error:
+        return None if token.error else f"잘못된 선택자: {text[:40]}"
+    args = rest[1:-1]
+    if not args.strip():
+        return None
+    for arg in _split_top_level(args):
+        if "=" not in arg:
+            return f"선택자 인자에 '='가 없습니다: {arg.strip()[:40]}"
+    return None
+
+
+def _split_top_level(text: str) -> List[str]:
+    """괄호/따옴표 밖의 콤마로 나눈다."""
+    parts: List[str] = []
+    depth = 0
+    quote = ""
+    start = 0
+    for i, c in enumerate(text):
+        if quote:
+            if c == quote:
+                quote = ""
+        elif c in "\"'":
+            quote = c
+        elif c in "{[":
+            depth += 1
+        elif c in "}]":
+            depth -= 1
+        elif c == "," and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return parts
+
+
+# --- 설정/실행 ---
+def default_rules() -> FrozenSet[str]:
+    return frozenset(r.id for r in RULES.values() if r.default)
+
+
+def load_config(base: str | None) -> FrozenSet[str]:
+    """
+    워크스페이스의 mc_lint.json을 읽어 켜진 규칙 ID 집합을 반환한다.
+    파일이 없으면 기본 규칙. 형식 오류나 모르는 규칙 ID는 ValueError.
+    """
+    enabled = set(default_rules())
+    if not base:
+        return frozenset(enabled)
+    path = os.path.join(base, CONFIG_FILE)
+    if not os.path.exists(path):
+        return frozenset(enabled)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            cfg = json.load(f)
+    except (OSError, json.JSONDecodeError) as exc:
+        raise ValueError(f"{CONFIG_FILE} 읽기 실패: {exc}") from exc
+    if not isinstance(cfg, dict):
+        raise ValueError(f"{CONFIG_FILE}는 객체여야 합니다.")
+    for key in ("disable", "enable"):
+        unknown = [rid for rid in cfg.get(key, []) if rid not in RULES]
+        if unknown:
+            raise ValueError(f"{CONFIG_FILE} {key}: 알 수 없는 규칙 {', '.join(unknown)}")
+    enabled -= set(cfg.get("disable", []))
+    enabled |= set(cfg.get("enable", []))
+    return frozenset(enabled)
+
+
+def rules_stamp(enabled: Iterable[str]) -> str:
+    """캐시 키로 쓰는 규칙 버전 + 켜진 규칙 목록."""
+    return RULES_VERSION + ":" + ",".join(sorted(enabled))
+
+
+def run_rules(text: str, enabled: Iterable[str] | None = None) -> List[str]:
+    """
+    파일 내용 전체에 켜진 규칙을 실행한다. 줄마다 토큰화는 한 번만 하고,
+    토큰/명령 규칙이 하나도 켜져 있지 않으면 토큰화 자체를 건너뛴다.
+    메시지는 'N행: ...' 형식(파일 규칙은 접두어 없음).
+    """
+    enabled = default_rules() if enabled is None else frozenset(enabled)
+    active = [RULES[rid] for rid in RULES if rid in enabled]
+    by_target: Dict[str, List[Rule]] = {target: [] for target in TARGETS}
+    for r in active:
+        for target in r.targets:
+            by_target[target].append(r)
+    needs_tokens = any(by_target[t] for t in ("command",) + TOKEN_KINDS)
+
+    # 텍스트 모드 open().readlines()와 같은 줄 분리 (universal newlines)
+    raw_lines = io.StringIO(text, newline=None).readlines()
+    lines = [Line(no, raw) for no, raw in enumerate(raw_lines, start=1)]
+    issues: List[str] = []
+    for r in by_target["file"]:
+        msg = r.check(lines)
+        if msg:
+            issues.append(msg)
+    if not lines:
+        return issues
+
+    for line in lines:
+        for r in by_target["raw"]:
+            msg = r.check(line, None)
+            if msg:
+                issues.append(f"{line.no}행: {msg}")
+        if not needs_tokens or not line.is_command:
+            continue
+        line.tokens = tokenize(line.text)
+        for r in by_target["command"]:
+            msg = r.check(line, None)
+            if msg:
+                issues.append(f"{line.no}행: {msg}")
+        for tok in line.tokens:
+            for r in by_target[tok.kind]:
+                msg = r.check(line, tok)
+                if msg:
+                    issues.append(f"{line.no}행: {msg}")
+    return issues
+
+
+__all__ = [
+    "Token",
+    "Line",
+    "Rule",
+    "RULES",
+    "rule",
+    "tokenize",
+    "run_rules",
+    "load_config",
+    "default_rules",
+    "rules_stamp",
+    "KNOWN_COMMANDS",
+    "RULES_VERSION",
+    "CONFIG_FILE",
+]
@@ -1,29 +1,176 @@
 # -*- coding: utf-8 -*-
 """
 서버/클라이언트 latest.log에서 오류/경고를 빠르게 추출하는 유틸.
+마지막 N줄은 파일 끝에서부터 블록 단위로 거꾸로 읽으므로 로그 크기와 상관없이 일정한 시간/메모리로 읽는다.
+LogFollower는 tail -f처럼 마지막으로 읽은 위치 이후의 새 바이트만 읽어 키워드 줄을 찾는다.
 """
 from __future__ import annotations
 
+import glob
+import gzip
+import io
 import os
-from typing import List
+import re
+from typing import List, Tuple
+
+TAIL_BLOCK = 64 * 1024
+FOLLOW_MAX_READ = 4 * 1024 * 1024  # poll() 한 번에 읽는 최대 바이트 (UI가 멈추지 않도록)
+HEAD_SIZE = 256  # 회전된 .log.gz가 같은 로그인지 확인할 때 비교하는 앞부분
 
 
 ERROR_KEYWORDS = ["[ERROR]", "Exception", "Caused by", "Couldn't", "Failed", "java.lang"]
 
 
+def find_errors(lines: List[str]) -> List[str]:
+    """ERROR_KEYWORDS 중 하나라도 포함한 줄."""
+    return [line.rstrip("\n") for line in lines if any(key in line for key in ERROR_KEYWORDS)]
+
+
+def keyword_pattern(keywords: List[str] = ERROR_KEYWORDS) -> "re.Pattern[bytes]":
+    """키워드 중 하나와 맞는 바이트 정규식 (한 번에 검사)."""
+    return re.compile(b"|".join(re.escape(k.encode("utf-8")) for k in keywords))
+
+
+def match_lines(data: bytes, pattern: "re.Pattern[bytes]") -> List[str]:
+    """
+    data(완전한 줄들) 안에서 pattern과 맞는 줄만 디코딩해 돌려준다.
+    정규식이 바이트 전체를 C 수준에서 훑고, 맞은 위치의 줄만 잘라 내므로 맞는 줄이 없으면 거의 비용이 없다.
+    """
+    hits: List[str] = []
+    pos = 0
+    while True:
+        m = pattern.search(data, pos)
+        if m is None:
+            return hits
+        start = data.rfind(b"\n", 0, m.start()) + 1
+        end = data.find(b"\n", m.end())
+        end = len(data) if end < 0 else end
+        hits.append(data[start:end].decode("utf-8", errors="replace").rstrip("\r"))
+        pos = end + 1
+
+
+class LogFollower:
+    """
+    tail -f 방식 로그 추적. poll()을 주기적으로 호출하면 그 사이 새로 추가된 줄 중 키워드 줄을 돌려준다.
+    파일을 계속 열어 두지 않으므로(Windows에서 서버의 로그 회전을 막지 않도록) 매번 stat 후 새 부분만 읽는다.
+    파일이 바뀌었거나(inode) 작아지면 회전으로 보고, 같은 폴더(또는 logs/)의 가장 최근 .log.gz에서
+    못 읽은 나머지를 읽은 뒤 새 latest.log의 처음부터 따라간다.
+    """
+
+    def __init__(self, path: str, keywords: List[str] = ERROR_KEYWORDS, from_start: bool = False):
+        self.path = path
+        self.pattern = keyword_pattern(keywords)
+        self.offset = 0
+        self.partial = b""
+        self.head = b""
+        self.identity: Tuple[int, int] | None = None
+        self.rotations = 0
+        if not from_start:
+            try:
+                st = os.stat(path)
+            except OSError:
+                return
+            self.offset = st.st_size
+            self.identity = (st.st_dev, st.st_ino)
+            self.head = self._read_head()
+
+    def _read_head(self) -> bytes:
+        try:
+            with open(self.path, "rb") as f:
+                return f.read(HEAD_SIZE)
+        except OSError:
+            return b""
+
+    def _rotated_remainder(self) -> bytes:
+        """회전되어 압축된 이전 로그에서 self.offset 이후 부분."""
+        folder = os.path.dirname(os.path.abspath(self.path))
+        candidates = glob.glob(os.path.join(folder, "*.log.gz"))
+        if os.path.basename(folder) != "logs":
+            candidates += glob.glob(os.path.join(folder, "logs", "*.log.gz"))
+        for gz_path in sorted(candidates, key=os.path.getmtime, reverse=True)[:3]:
+            try:
+                with gzip.open(gz_path, "rb") as g:
+                    if self.head and g.read(len(self.head)) != self.head:
+                        continue
+                    g.seek(self.offset)
+                    return g.read(FOLLOW_MAX_READ)
+            except (OSError, EOFError):
+                continue
+        return b""
+
+    def poll(self) -> List[str]:
+        """새로 추가된 줄 중 키워드 줄. 변화가 없으면 stat 한 번만 하고 빈 목록."""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return []  # 회전 중이라 잠시 없을 수 있다
+        identity = (st.st_dev, st.st_ino)
+        chunks: List[bytes] = []
+        if (self.identity is not None and identity != self.identity) or st.st_size < self.offset:
+            chunks.append(self._rotated_remainder())
+            if self.partial or chunks[-1]:
+                chunks.append(b"\n")  # 이전 파일의 마지막 줄 마무리
+            self.offset = 0
+            self.head = b""
+            self.rotations += 1
+        self.identity = identity
+        if st.st_size > self.offset:
+            with open(self.path, "rb") as f:
+                f.seek(self.offset)
+                data = f.read(min(st.st_size - self.offset, FOLLOW_MAX_READ))
+            if self.offset == 0:
+                self.head = data[:HEAD_SIZE]
+            self.offset += len(data)
+            chunks.append(data)
+        if not any(chunks):
+            return []
+        data = self.partial + b"".join(chunks)
+        cut = data.rfind(b"\n") + 1
+        self.partial = data[cut:]
+        return match_lines(data[:cut], self.pattern)
+
+
+def tail_lines(path: str, count: int, block_size: int = TAIL_BLOCK) -> List[str]:
+    """
+    파일의 마지막 count줄 (f.readlines()[-count:]와 같은 결과, 줄바꿈 포함).
+    끝에서부터 block_size씩 거꾸로 읽다가 줄바꿈이 count개 모이면 멈춘다.
+    """
+    if count <= 0:
+        return []
+    blocks: List[bytes] = []
+    newlines = 0
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        while pos > 0 and newlines <= count:  # 마지막 줄 끝의 줄바꿈 하나는 세지 않는 셈
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            block = f.read(step)
+            blocks.append(block)
+            newlines += block.count(b"\n")
+    data = b"".join(reversed(blocks))
+    if pos > 0:
+        data = data[data.index(b"\n") + 1 :]  # 블록 경계에서 잘린 첫 줄은 버린다
+    text = data.decode("utf-8", errors="replace")
+    return io.StringIO(text, newline=None).readlines()[-count:]
+
+
 def parse_log(log_path: str, tail: int = 400) -> List[str]:
     if not os.path.exists(log_path):
         raise FileNotFoundError(f"log 파일을 찾을 수 없습니다: {log_path}")
-    with open(log_path, "r", encoding="utf-8", errors="replace") as f:
-        lines = f.readlines()
-    lines = lines[-tail:]
-    hits = []
-    for line in lines:
-        if any(key in line for key in ERROR_KEYWORDS):
-            hits.append(line.rstrip("\n"))
+    lines = tail_lines(log_path, tail)
+    hits = find_errors(lines)
     if not hits:
         hits.append("오류/경고 패턴이 발견되지 않았습니다.")
     return hits
 
 
-__all__ = ["parse_log", "ERROR_KEYWORDS"]
+__all__ = [
+    "parse_log",
+    "tail_lines",
+    "find_errors",
+    "keyword_pattern",
+    "match_lines",
+    "LogFollower",
+    "ERROR_KEYWORDS",
+]
@@ -0,0 +1,366 @@
+# -*- coding: utf-8 -*-
+"""
+회전된 서버 로그(logs/YYYY-MM-DD-N.log.gz)와 latest.log를 한 번에 분석한다.
+- .log.gz는 풀어 두지 않고 스트리밍으로 읽으며, 파일 단위로 프로세스 풀에 나눠 처리한다.
+- 헤더 줄([시각] [스레드/레벨]) 뒤에 이어지는 줄(스택 트레이스 등)은 하나의 이벤트로 묶는다.
+- 숫자/UUID/16진수를 지운 메시지 + 예외 클래스 + 상위 프레임으로 지문을 만들어 같은 오류를 합치고,
+  지문별로 처음/마지막 발생 시각과 날짜(또는 시간)별 횟수를 센다.
+"""
+from __future__ import annotations
+
+import datetime
+import gzip
+import hashlib
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import BinaryIO, Callable, Dict, List, Tuple
+
+LEVELS = ("WARN", "ERROR", "FATAL")
+BUCKETS = ("day", "hour")
+TRACE_FRAMES = 8  # 지문에 쓰는 스택 프레임 수
+SAMPLE_LINES = 12  # 대표 예시로 남기는 줄 수
+PARALLEL_MIN_FILES = 2
+READ_BLOCK = 1 << 20
+
+ROTATED_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})-(\d+)\.log(?:\.gz)?$")
+# [12:34:56] [Server thread/ERROR]: ... / [18Oct2026 12:34:56.789] [main/WARN] [logger/]: ...
+HEADER_RE = re.compile(rb"\[([^\]\n]*?(\d{2}):(\d{2}):(\d{2})[^\]\n]*)\] \[([^\]\n]*)/([A-Z]+)\]")
+MESSAGE_PREFIX_RE = re.compile(r"^(?:\s*\[[^\]]*\])?(?:\s*\([^)]*\))?:?\s*")
+EXCEPTION_RE = re.compile(r"^(?:Caused by: |Suppressed: )?([\w$]+(?:\.[\w$]+)+(?:Exception|Error|Throwable))\b")
+CONTINUATION_RE = re.compile(rb"\n[^\[\r\n]")  # 다음 줄이 헤더가 아님 (스택 트레이스 등). ^와 re.M보다 훨씬 빠르다
+FRAME_SUFFIX_RE = re.compile(r"\s*(?:~?\[[^\]]*\]|\{[^}]*\})\s*")
+NORMALIZE_RES = [
+    (re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"), "<uuid>"),
+    (re.compile(r"\b0x[0-9a-fA-F]+\b|\b[0-9a-fA-F]{16,}\b"), "<hex>"),
+    (re.compile(r"-?\d+(?:\.\d+)?"), "<n>"),
+]
+
+
+@dataclass
+class EventGroup:
+    fingerprint: str
+    level: str
+    title: str
+    sample: List[str]
+    count: int = 0
+    first_seen: str = ""
+    last_seen: str = ""
+    files: List[str] = field(default_factory=list)
+    timeline: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class LogStats:
+    groups: List[EventGroup]
+    files: int = 0
+    lines: int = 0
+    events: int = 0
+    read_bytes: int = 0
+    seconds: float = 0.0
+
+
+def find_log_files(path: str) -> List[str]:
+    """
+    분석할 로그 목록을 시간 순으로. path는 로그 파일 하나, logs 폴더, 또는 logs 폴더를 가진 서버 폴더.
+    회전된 로그(날짜-번호)를 날짜/번호 순으로 두고 latest.log를 마지막에 둔다.
+    """
+    if os.path.isfile(path):
+        return [path]
+    folder = path
+    if not os.path.isdir(folder):
+        raise FileNotFoundError(f"로그 폴더를 찾을 수 없습니다: {path}")
+    if os.path.isdir(os.path.join(folder, "logs")):
+        folder = os.path.join(folder, "logs")
+    rotated: List[Tuple[str, int, str]] = []
+    for name in os.listdir(folder):
+        m = ROTATED_RE.match(name)
+        if m:
+            rotated.append((m.group(1), int(m.group(2)), os.path.join(folder, name)))
+    files = [full for _, _, full in sorted(rotated)]
+    latest = os.path.join(folder, "latest.log")
+    if os.path.isfile(latest):
+        files.append(latest)
+    return files
+
+
+def log_date(path: str, days: int = 0) -> datetime.date:
+    """
+    로그가 시작된 날짜. 회전된 로그는 파일 이름의 날짜이고, 그 밖(latest.log 등)은 마지막으로 쓴 날(mtime)에서
+    로그 안에서 자정을 넘긴 횟수(days)만큼 거슬러 올라간다.
+    """
+    m = ROTATED_RE.match(os.path.basename(path))
+    if m:
+        return datetime.date.fromisoformat(m.group(1))
+    return datetime.date.fromtimestamp(os.path.getmtime(path)) - datetime.timedelta(days=days)
+
+
+def normalize(text: str) -> str:
+    """바뀌는 값(숫자, UUID, 16진수)을 자리표시자로 바꾼다."""
+    for pattern, repl in NORMALIZE_RES:
+        text = pattern.sub(repl, text)
+    return text
+
+
+def fingerprint(level: str, message: str, trace: List[str]) -> Tuple[str, str]:
+    """
+    (지문, 제목). 스택 트레이스가 있으면 예외 클래스들과 상위 TRACE_FRAMES개 프레임을 쓰고,
+    프레임은 jar/변환 정보(~[...], {...})만 떼고 그대로 쓴다 (난독화 이름의 숫자를 지우면 다른 메서드가 합쳐진다).
+    """
+    title = normalize(message.strip())
+    parts = [level, title]
+    frames = 0
+    for line in trace:
+        line = line.strip()
+        if line.startswith("at "):
+            if frames < TRACE_FRAMES:
+                parts.append(FRAME_SUFFIX_RE.sub("", line))
+            frames += 1
+            continue
+        m = EXCEPTION_RE.match(line)
+        if m:
+            parts.append(m.group(1))
+            frames = 0  # Caused by마다 그 예외의 상위 프레임을 다시 센다
+            if not title or title == "<n>":
+                title = normalize(line)
+    digest = hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()[:12]
+    return digest, title[:200]
+
+
+class _EventScanner:
+    """
+    완전한 줄들로 된 블록을 받아 이벤트를 모은다. 줄마다 파이썬 코드를 돌리지 않고,
+    관심 있는 줄(원하는 레벨의 헤더, '['로 시작하지 않는 이어진 줄)만 정규식으로 찾아 그 줄만 본다.
+    이어진 줄은 바로 앞 헤더 줄(INFO여도)에 붙는다. 이벤트는 블록 경계를 넘어 이어질 수 있다.
+    자정을 넘긴 횟수는 살펴본 헤더(이벤트 헤더와 블록마다 마지막 헤더)의 시각이 12시간 넘게 거꾸로 갈 때 센다.
+    """
+
+    def __init__(self, levels: Tuple[str, ...]):
+        self.wanted = {lvl.encode("ascii") for lvl in levels}
+        self.level_re = re.compile(rb"/(?:" + b"|".join(re.escape(lvl) for lvl in sorted(self.wanted)) + rb")\]")
+        self.events: List[tuple] = []
+        self.lines = 0
+        self.current: list | None = None  # [헤더 match, 헤더 줄, 이어진 줄들, 관심 헤더 여부]
+        self.last_header: Tuple[re.Match, bytes] | None = None  # 이전 블록의 마지막 헤더
+        self.open_end = 0  # current의 마지막 줄 끝 (블록 안 위치, 블록이 바뀌면 0)
+        self.days = 0  # 지금까지 자정을 넘긴 횟수
+        self.last_seconds = -1
+
+    def _mark(self, m: re.Match):
+        seconds = int(m.group(2)) * 3600 + int(m.group(3)) * 60 + int(m.group(4))
+        if seconds + 12 * 3600 < self.last_seconds:
+            self.days += 1
+        self.last_seconds = seconds
+
+    def _close(self):
+        if self.current is not None and (self.current[3] or self.current[2]):
+            self.events.append(_event(self.current))
+        self.current = None
+
+    def _last_header(self, data: bytes, lo: int, hi: int):
+        """data[lo:hi]에서 시작하는 마지막 헤더 줄 (match, 줄) 또는 None."""
+        end = hi
+        while end > lo:
+            start = max(data.rfind(b"\n", lo, end - 1) + 1, lo)
+            if data[start : start + 1] == b"[":
+                line = data[start : data.index(b"\n", start)]
+                m = HEADER_RE.match(line)
+                if m:
+                    return m, line
+            end = start
+        return None
+
+    def _start(self, header, wanted: bool):
+        self._close()
+        m, line = header
+        if header is not self.last_header:
+            self._mark(m)
+        self.current = [m, line, [], wanted, self.days]
+        self.last_header = header
+
+    def feed(self, data: bytes):
+        self.lines += data.count(b"\n")
+        starts = {m.start() + 1 for m in CONTINUATION_RE.finditer(data)}
+        if data[:1] not in b"[\r\n":
+            starts.add(0)
+        starts.update(data.rfind(b"\n", 0, m.start()) + 1 for m in self.level_re.finditer(data))
+        self.open_end = 0
+        for pos in sorted(starts):
+            end = data.index(b"\n", pos)
+            line = data[pos:end]
+            if line[:1] == b"[":
+                m = HEADER_RE.match(line)
+                if m:
+                    self._start((m, line), m.group(6) in self.wanted)
+                    self.open_end = end + 1
+                continue
+            if pos != self.open_end:
+                # 사이에 다른 헤더가 있었으면 이 줄은 그 헤더에 붙는다
+                header = self._last_header(data, self.open_end, pos)
+                if header is not None:
+                    self._start(header, False)
+            if self.current is None and self.last_header is not None:
+                self._start(self.last_header, False)  # 헤더가 이전 블록에 있었다
+            if self.current is not None:
+                self.current[2].append(line)
+            self.open_end = end + 1
+        header = self._last_header(data, self.open_end, len(data))
+        if header is not None:
+            self._close()
+            self._mark(header[0])
+            self.last_header = header
+
+    def finish(self) -> Tuple[List[tuple], int, int]:
+        self._close()
+        return self.events, self.lines, self.days
+
+
+def _event(current) -> tuple:
+    m, line, extra, _, day = current
+    message = MESSAGE_PREFIX_RE.sub("", line[m.end() :].decode("utf-8", errors="replace").rstrip(), count=1)
+    trace = [raw.decode("utf-8", errors="replace").rstrip() for raw in extra]
+    return day, int(m.group(2)), int(m.group(3)), int(m.group(4)), m.group(6).decode("ascii"), message, trace
+
+
+def read_events(stream: BinaryIO, levels: Tuple[str, ...] = LEVELS) -> Tuple[List[tuple], int, int]:
+    """
+    ([(시작 후 자정을 넘긴 횟수, 시, 분, 초, 레벨, 메시지, 이어진 줄 목록)], 줄 수, 파일 전체에서 자정을 넘긴 횟수).
+    levels 레벨이거나 이어진 줄(스택 트레이스)이 있는 헤더만 이벤트가 된다.
+    (INFO 줄까지 ERROR_KEYWORDS로 훑으면 전체 시간이 몇 배가 되므로 레벨로만 고른다.)
+    READ_BLOCK씩 읽어 완전한 줄까지만 검사하고, 이벤트가 될 줄만 디코딩한다.
+    """
+    scanner = _EventScanner(levels)
+    pending = b""
+    for block in iter(lambda: stream.read(READ_BLOCK), b""):
+        data = pending + block
+        cut = data.rfind(b"\n") + 1
+        pending = data[cut:]
+        if cut:
+            scanner.feed(data[:cut])
+    if pending:
+        scanner.feed(pending + b"\n")
+    return scanner.finish()
+
+
+def analyze_file(path: str, bucket: str = "day", levels: Tuple[str, ...] = LEVELS) -> Tuple[Dict[str, EventGroup], int, int]:
+    """로그 파일 하나를 분석한다 (프로세스 풀 작업 단위). returns: (지문 -> 그룹, 줄 수, 읽은 바이트)"""
+    groups: Dict[str, EventGroup] = {}
+    name = os.path.basename(path)
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rb") as f:
+        events, lines, days = read_events(f, levels)
+    start = log_date(path, days)
+    for event in events:
+        offset, hour, minute, second, level, message, trace = event
+        day = start + datetime.timedelta(days=offset)
+        stamp = f"{day.isoformat()} {hour:02d}:{minute:02d}:{second:02d}"
+        fp, title = fingerprint(level, message, trace)
+        group = groups.get(fp)
+        if group is None:
+            sample = [f"[{stamp}] [{level}] {message}", *trace[: SAMPLE_LINES - 1]]
+            group = groups[fp] = EventGroup(fp, level, title, sample, first_seen=stamp, files=[name])
+        group.count += 1
+        group.last_seen = stamp
+        key = stamp[:10] if bucket == "day" else stamp[:13]
+        group.timeline[key] = group.timeline.get(key, 0) + 1
+    return groups, lines, os.path.getsize(path)
+
+
+def merge_groups(into: Dict[str, EventGroup], groups: Dict[str, EventGroup]):
+    for fp, group in groups.items():
+        have = into.get(fp)
+        if have is None:
+            into[fp] = group
+            continue
+        have.count += group.count
+        if group.first_seen < have.first_seen:
+            have.first_seen, have.sample = group.first_seen, group.sample
+        have.last_seen = max(have.last_seen, group.last_seen)
+        have.files.extend(name for name in group.files if name not in have.files)
+        for key, n in group.timeline.items():
+            have.timeline[key] = have.timeline.get(key, 0) + n
+
+
+def analyze_logs(
+    path: str,
+    bucket: str = "day",
+    levels: Tuple[str, ...] = LEVELS,
+    workers: int | None = None,
+    progress: Callable[..., None] | None = None,
+) -> LogStats:
+    """
+    path(파일/logs 폴더/서버 폴더)의 로그를 모두 분석해 지문별 그룹을 횟수 순으로 돌려준다.
+    파일이 PARALLEL_MIN_FILES보다 적거나 workers=1이면 현재 프로세스에서 처리한다.
+    """
+    if bucket not in BUCKETS:
+        raise ValueError(f"지원하지 않는 구간: {bucket} (가능: {', '.join(BUCKETS)})")
+    started = time.perf_counter()
+    files = find_log_files(path)
+    stats = LogStats(groups=[], files=len(files))
+    merged: Dict[str, EventGroup] = {}
+
+    def add(result: Tuple[Dict[str, EventGroup], int, int]):
+        groups, lines, nbytes = result
+        merge_groups(merged, groups)
+        stats.lines += lines
+        stats.read_bytes += nbytes
+        if progress:
+            progress(done, len(files), f"{done}/{len(files)}개 로그, 이벤트 종류 {len(merged)}개")
+
+    workers = workers or os.cpu_count() or 1
+    done = 0
+    if workers <= 1 or len(files) < PARALLEL_MIN_FILES:
+        for full in files:
+            done += 1
+            add(analyze_file(full, bucket, levels))
+    else:
+        pool = ProcessPoolExecutor(max_workers=min(workers, len(files)))
+        try:
+            # 큰 파일부터 넣어 마지막에 큰 파일 하나만 남는 일을 줄인다
+            order = sorted(files, key=os.path.getsize, reverse=True)
+            futures = [pool.submit(analyze_file, full, bucket, levels) for full in order]
+            for fut in as_completed(futures):
+                done += 1
+                add(fut.result())
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+    stats.groups = sorted(merged.values(), key=lambda g: (-g.count, g.first_seen))
+    stats.events = sum(g.count for g in stats.groups)
+    stats.seconds = time.perf_counter() - started
+    return stats
+
+
+def format_stats(stats: LogStats, top: int = 20) -> List[str]:
+    """사람이 읽을 요약 (횟수 많은 순 top개, 각 그룹의 구간별 횟수 포함)."""
+    mb = stats.read_bytes / (1024 * 1024)
+    lines = [
+        f"로그 {stats.files}개 ({mb:.1f} MB, {stats.lines:,}줄) → 이벤트 {stats.events:,}건, "
+        f"종류 {len(stats.groups)}개 ({stats.seconds:.2f}초)"
+    ]
+    for group in stats.groups[:top]:
+        lines.append("")
+        lines.append(f"[{group.fingerprint}] {group.level} ×{group.count}  {group.first_seen} ~ {group.last_seen}")
+        lines.append(f"  {group.title}")
+        lines.append("  " + ", ".join(f"{key}: {n}" for key, n in sorted(group.timeline.items())))
+        lines.extend("    " + line for line in group.sample[1:4])
+    if len(stats.groups) > top:
+        lines.append("")
+        lines.append(f"... 외 {len(stats.groups) - top}종류")
+    return lines
+
+
+__all__ = [
+    "EventGroup",
+    "LogStats",
+    "find_log_files",
+    "normalize",
+    "fingerprint",
+    "read_events",
+    "analyze_file",
+    "analyze_logs",
+    "format_stats",
+    "LEVELS",
+    "BUCKETS",
+]
@@ -7,7 +7,11 @@ from __future__ import annotations
 
 import os
 import shutil
-from typing import List, Tuple
+from typing import Callable, List, Tuple
+
+from mc_index import get_index
+from mc_journal import Journal
+from mc_replace import ReplaceEngine, ReplaceRule, rules_from_mapping
 
 MIGRATION_RULES = {
     # 예시: 1.20→1.21 데이터팩에서 변경되는 리소스 키가 있다면 여기에 매핑
@@ -23,44 +27,48 @@ GUIDE_LINES = [
 ]
 
 
-def apply_migration(base: str, kind: str, dry_run: bool = True) -> List[str]:
+def apply_migration(
+    base: str,
+    kind: str,
+    dry_run: bool = True,
+    progress: Callable[[int, int], None] | None = None,
+    rules: List[ReplaceRule] | None = None,
+) -> List[str]:
     """
-    매우 제한적인 자동 변환: MIGRATION_RULES에 따라 문자열 치환.
-    dry_run=True이면 변경 없이 보고만 한다.
+    매우 제한적인 자동 변환: MIGRATION_RULES(또는 rules)에 따라 문자열/정규식 치환.
+    규칙 전체를 mc_replace 엔진 하나로 묶어 파일마다 한 번만 훑는다.
+    dry_run=True이면 변경 없이 보고만 한다. 실제 적용은 mc_journal에 원본을 남기고
+    원자적으로 쓰며, 중간에 실패/취소되면 모두 되돌린다 (rollback_last로 나중에 되돌리기도 가능).
     """
     results: List[str] = []
-    root = os.path.join(base, kind)
-    if not os.path.isdir(root):
+    index = get_index(base)
+    if not index.has_kind(kind):
         return [f"{kind} 폴더가 없습니다."]
-    for pack in os.listdir(root):
-        pack_dir = os.path.join(root, pack)
-        if not os.path.isdir(pack_dir):
-            continue
-        for sub, _, files in os.walk(pack_dir):
-            for f in files:
-                if not f.endswith((".json", ".mcfunction")):
-                    continue
-                path = os.path.join(sub, f)
-                try:
-                    with open(path, "r", encoding="utf-8", errors="replace") as rf:
-                        content = rf.read()
-                    new_content = content
-                    for old, new in MIGRATION_RULES.items():
-                        if old in new_content:
-                            new_content = new_content.replace(old, new)
-                    if new_content != content:
-                        results.append(f"{pack}/{os.path.relpath(path, pack_dir)}: 변경 발생")
-                        if not dry_run:
-                            with open(path, "w", encoding="utf-8") as wf:
-                                wf.write(new_content)
-                except Exception as exc:
-                    results.append(f"{pack}/{os.path.relpath(path, pack_dir)}: 처리 실패 {exc}")
+    engine = ReplaceEngine(rules if rules is not None else rules_from_mapping(MIGRATION_RULES))
+    entries = list(index.files(kind=kind, ext=(".json", ".mcfunction")))
+    with Journal(base, f"migration_{kind}") as journal:
+        for done, entry in enumerate(entries, start=1):
+            if progress:
+                progress(done, len(entries))
+            path = entry.path
+            label = entry.rel.split(os.sep, 1)[1].replace(os.sep, "/")
+            try:
+                with open(path, "r", encoding="utf-8", errors="replace") as rf:
+                    content = rf.read()
+                new_content, count = engine.apply(content)
+                if new_content != content:
+                    results.append(f"{label}: 변경 발생 ({count}곳)")
+                    if not dry_run:
+                        journal.write_text(path, new_content)
+            except Exception as exc:
+                results.append(f"{label}: 처리 실패 {exc}")
     if not results:
         results.append("변경 또는 치환 대상이 없습니다.")
     return results
 
 
 def backup_before_migrate(base: str, kind: str) -> str:
+    """kind 폴더 전체 복사본. apply_migration은 저널로 되돌릴 수 있으므로 필수는 아니다."""
     root = os.path.join(base, kind)
     if not os.path.isdir(root):
         raise FileNotFoundError(f"{kind} 폴더가 없습니다: {root}")
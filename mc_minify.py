@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+릴리스용 최소화 단계 (팩 zip 빌드 중에만 적용, 원본 파일은 그대로).
+- JSON/.mcmeta: 들여쓰기/공백 제거 (키 순서 유지, 파싱 실패 시 원본 유지)
+- mcfunction: 주석 줄(#)과 빈 줄 제거, 앞뒤 공백 제거 (줄 이어쓰기 '\\' 안은 주석으로 보지 않음)
+- OS 부산물(.DS_Store, Thumbs.db, desktop.ini, ._*, __MACOSX/)은 zip에서 제외
+"""
+from __future__ import annotations
+
+import json
+import os
+from typing import Dict, List, Tuple
+
+MINIFY_VERSION = "1"  # 규칙이 바뀌면 올린다 (빌드 캐시 키에 포함)
+
+JSON_EXTS = (".json", ".mcmeta")
+JUNK_NAMES = {".ds_store", "thumbs.db", "desktop.ini"}
+JUNK_DIRS = {"__macosx"}
+
+
+def is_junk(arcname: str) -> bool:
+    """zip 내부 경로(/ 구분)가 OS 부산물인지."""
+    parts = arcname.split("/")
+    name = parts[-1]
+    if name.lower() in JUNK_NAMES or name.startswith("._"):
+        return True
+    return any(part.lower() in JUNK_DIRS for part in parts[:-1])
+
+
+def split_junk(items: List[Tuple[str, str]]) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+    """(zip 내부 경로, 실제 경로) 목록을 (남길 것, 부산물)로 나눈다."""
+    kept: List[Tuple[str, str]] = []
+    junk: List[Tuple[str, str]] = []
+    for item in items:
+        (junk if is_junk(item[0]) else kept).append(item)
+    return kept, junk
+
+
+def minify_json(text: str) -> str:
+    """공백 없는 JSON. 파싱할 수 없으면 ValueError."""
+    data = json.loads(text)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def minify_mcfunction(text: str) -> str:
+    """주석/빈 줄을 빼고 각 줄의 앞뒤 공백을 없앤다. 매크로 줄($)은 그대로 둔다."""
+    lines: List[str] = []
+    continued = False
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not continued and (not line or line.startswith("#")):
+            continue
+        lines.append(line)
+        continued = line.endswith("\\")
+    return "\n".join(lines) + ("\n" if lines else "")
+
+
+def minify_bytes(arcname: str, data: bytes) -> bytes:
+    """확장자에 맞게 최소화한 바이트. 대상이 아니거나 실패하면 원본 그대로."""
+    ext = os.path.splitext(arcname)[1].lower()
+    if ext not in JSON_EXTS and ext != ".mcfunction":
+        return data
+    try:
+        text = data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        return data
+    try:
+        out = minify_json(text) if ext in JSON_EXTS else minify_mcfunction(text)
+    except ValueError:
+        return data
+    encoded = out.encode("utf-8")
+    return encoded if len(encoded) < len(data) else data
+
+
+def type_of(arcname: str) -> str:
+    ext = os.path.splitext(arcname)[1].lower()
+    return ext or "(확장자 없음)"
+
+
+def format_savings(savings: Dict[str, Tuple[int, int, int]], junk: int = 0, junk_bytes: int = 0) -> List[str]:
+    """savings: 확장자 -> (파일 수, 원본 바이트, 최소화 후 바이트). 줄인 것이 있는 형식만 표시."""
+    lines: List[str] = []
+    total_before = total_after = 0
+    for ext, (files, before, after) in sorted(savings.items(), key=lambda kv: kv[1][1] - kv[1][2], reverse=True):
+        total_before += before
+        total_after += after
+        if before == after:
+            continue
+        pct = (before - after) * 100 / before if before else 0.0
+        lines.append(f"{ext}: {files}개, {before:,} → {after:,} 바이트 (-{pct:.1f}%)")
+    if junk:
+        lines.append(f"OS 부산물 제외: {junk}개 ({junk_bytes:,} 바이트)")
+    saved = total_before - total_after + junk_bytes
+    lines.insert(0, f"최소화로 줄인 크기: {saved:,} 바이트")
+    return lines
+
+
+__all__ = [
+    "MINIFY_VERSION",
+    "is_junk",
+    "split_junk",
+    "minify_json",
+    "minify_mcfunction",
+    "minify_bytes",
+    "type_of",
+    "format_savings",
+]
@@ -14,7 +14,8 @@ def load_json(path: str) -> Dict:
         return json.load(f)
 
 
-def check_models(base: str, pack: str) -> List[str]:
+def model_issues(base: str, pack: str) -> List[str]:
+    """누락/파싱 오류 목록. 문제가 없으면 빈 리스트."""
     rp_dir = os.path.join(base, "resourcepacks", pack)
     assets = os.path.join(rp_dir, "assets")
     if not os.path.isdir(assets):
@@ -45,9 +46,14 @@ def check_models(base: str, pack: str) -> List[str]:
                         issues.append(f"{rel}: 텍스처 없음 -> {tex_path}")
             except Exception as exc:
                 issues.append(f"{rel}: 파싱 실패 {exc}")
+    return issues
+
+
+def check_models(base: str, pack: str) -> List[str]:
+    issues = model_issues(base, pack)
     if not issues:
         issues.append("모델 텍스처 누락 없음")
     return issues
 
 
-__all__ = ["check_models"]
+__all__ = ["check_models", "model_issues"]
@@ -6,13 +6,15 @@ datapacks/<old>/data/<old>/... 구조와 파일 내용 내 old:new 문자열을
 from __future__ import annotations
 
 import os
-import shutil
 from typing import List, Tuple
 
+from mc_journal import Journal
+
 
 def rename_namespace(base: str, old: str, new: str) -> List[str]:
     """
     데이터팩 폴더 이름 및 내부 참조를 old->new로 바꾼다.
+    변경은 mc_journal에 기록되며, 도중에 실패하면 폴더 이동까지 모두 되돌린다.
     returns: 변경된 항목 로그 리스트
     """
     logs: List[str] = []
@@ -24,23 +26,23 @@ def rename_namespace(base: str, old: str, new: str) -> List[str]:
         raise FileNotFoundError(f"대상 데이터팩 없음: {old_pack}")
 
     new_pack = os.path.join(dp_root, new)
-    if not os.path.exists(new_pack):
-        shutil.move(old_pack, new_pack)
-        logs.append(f"폴더 이동: {old_pack} -> {new_pack}")
-
-    # 내부 파일 치환
-    for root, _, files in os.walk(new_pack):
-        for f in files:
-            if not f.endswith((".mcfunction", ".json")):
-                continue
-            path = os.path.join(root, f)
-            with open(path, "r", encoding="utf-8", errors="replace") as rf:
-                content = rf.read()
-            new_content = content.replace(f"{old}:", f"{new}:")
-            if new_content != content:
-                with open(path, "w", encoding="utf-8") as wf:
-                    wf.write(new_content)
-                logs.append(f"치환: {os.path.relpath(path, base)}")
+    with Journal(base, f"namespace_{old}_{new}") as journal:
+        if not os.path.exists(new_pack):
+            journal.move(old_pack, new_pack)
+            logs.append(f"폴더 이동: {old_pack} -> {new_pack}")
+
+        # 내부 파일 치환
+        for root, _, files in os.walk(new_pack):
+            for f in files:
+                if not f.endswith((".mcfunction", ".json")):
+                    continue
+                path = os.path.join(root, f)
+                with open(path, "r", encoding="utf-8", errors="replace") as rf:
+                    content = rf.read()
+                new_content = content.replace(f"{old}:", f"{new}:")
+                if new_content != content:
+                    journal.write_text(path, new_content)
+                    logs.append(f"치환: {os.path.relpath(path, base)}")
     if not logs:
         logs.append("변경 사항 없음")
     return logs
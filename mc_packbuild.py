@@ -0,0 +1,645 @@
+# -*- coding: utf-8 -*-
+"""
+재현 가능한(결정적) 팩 zip 빌더.
+같은 내용의 팩은 언제 빌드해도 바이트 단위로 같은 zip이 나오도록
+항목을 경로(UTF-8 바이트) 순으로 정렬하고, 시각은 1980-01-01 00:00:00,
+권한은 0644로 고정한다. 4 GB를 넘는 항목/위치나 65535개를 넘는 항목은 Zip64 확장으로 기록한다
+(필요한 항목에만 붙이므로 작은 팩의 출력은 그대로). 각 파일은 작업 스레드에서 raw deflate로 압축하고
+(zlib은 압축 중 GIL을 놓는다), 메인 스레드가 순서대로 zip 구조를 조립한다.
+서버 server.properties의 resource-pack-sha1에 넣을 SHA-1도 함께 계산한다.
+
+빌드 캐시(BuildCache): 압축한 스트림을 "내용 해시 + 압축 레벨" 이름의 파일로 mc_cache 옆에 보관하고,
+파일 경로별 (크기, mtime) -> 내용 해시를 캐시 DB에 기록한다. 바뀌지 않은 파일은 원본을 읽지도,
+다시 압축하지도 않고 저장된 스트림을 그대로 zip에 이어 붙인다.
+
+minify=True이면 mc_minify로 JSON/mcfunction을 줄이고 OS 부산물을 빼며, 형식별 절감량을 보고한다.
+
+build_all: 워크스페이스의 모든 팩(또는 이름 패턴으로 거른 팩)을 동시에 빌드한다.
+팩 단위 작업은 pack_jobs개까지만 동시에 돌리고, 압축은 하나의 공유 스레드 풀에서 처리해
+전체 스레드 수가 팩 수와 상관없이 일정하다. 결과는 출력 폴더의 manifest.json에 기록한다.
+"""
+from __future__ import annotations
+
+import contextlib
+import datetime
+import fnmatch
+import hashlib
+import json
+import os
+import sqlite3
+import struct
+import threading
+import time
+import zlib
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Tuple
+
+import mc_cache
+from mc_archive import collect_files
+from mc_minify import MINIFY_VERSION, minify_bytes, split_junk, type_of
+from mc_release import list_packs
+
+# (zip 내부 경로, 원본 바이트) -> 실제로 넣을 바이트
+Transform = Callable[[str, bytes], bytes]
+
+DEFAULT_LEVEL = 9
+FIXED_DOS_TIME = 0  # 00:00:00
+FIXED_DOS_DATE = (0 << 9) | (1 << 5) | 1  # 1980-01-01
+FILE_ATTR = (0o100644 << 16)  # 일반 파일, rw-r--r--
+MADE_BY = (3 << 8) | 20  # UNIX, zip 2.0 (외부 속성을 권한으로 해석)
+VERSION_NEEDED = 20
+VERSION_ZIP64 = 45
+FLAG_UTF8 = 0x800
+ZIP_MAX = 0xFFFFFFFF  # 이 값 이상인 크기/위치는 Zip64 확장 필드에 적는다
+ZIP_COUNT_MAX = 0xFFFF  # 항목 수가 이 값 이상이면 Zip64 끝 레코드를 쓴다
+ZIP64_MARK = 0xFFFFFFFF  # "값은 Zip64 필드에 있음" 표시
+ZIP64_COUNT_MARK = 0xFFFF
+ZIP64_EXTRA = 0x0001
+BLOB_HEADER = struct.Struct("<IQB")  # crc, 원본 크기, 방식
+BUILD_CACHE_LIMIT = 2 << 30  # 압축 스트림 캐시 최대 크기 (2 GB)
+MANIFEST_NAME = "manifest.json"
+PACK_KINDS = ("datapacks", "resourcepacks")
+
+STORED = 0
+DEFLATED = 8
+
+
+@dataclass
+class CompressedEntry:
+    arcname: str
+    crc: int
+    size: int
+    method: int
+    payload: bytes
+    reused: bool = False  # 빌드 캐시에서 가져온 스트림
+    source_size: int = -1  # 변환(최소화) 전 크기, -1이면 size와 같음
+
+
+@dataclass
+class BuildResult:
+    path: str
+    sha1: str
+    entries: int
+    size: int  # zip 파일 크기 (바이트)
+    raw_size: int  # 압축 전 합계
+    reused: int = 0  # 빌드 캐시에서 그대로 가져온 항목 수
+    savings: Dict[str, Tuple[int, int, int]] = field(default_factory=dict)  # 확장자 -> (파일 수, 원본, 넣은 크기)
+    junk: int = 0  # 제외한 OS 부산물 수
+    junk_bytes: int = 0
+
+
+def compress_bytes(data: bytes, level: int = DEFAULT_LEVEL) -> Tuple[int, bytes]:
+    """raw deflate(zip 방식 8). 압축해도 작아지지 않으면 저장(방식 0). returns: (방식, 데이터)"""
+    if not data:
+        return STORED, b""
+    co = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    packed = co.compress(data) + co.flush()
+    if len(packed) >= len(data):
+        return STORED, data
+    return DEFLATED, packed
+
+
+def compress_file(
+    arcname: str, path: str, level: int = DEFAULT_LEVEL, transform: Transform | None = None
+) -> CompressedEntry:
+    with open(path, "rb") as f:
+        data = f.read()
+    source_size = len(data)
+    if transform is not None:
+        data = transform(arcname, data)
+    method, payload = compress_bytes(data, level)
+    return CompressedEntry(arcname, zlib.crc32(data), len(data), method, payload, source_size=source_size)
+
+
+class BuildCache:
+    """
+    압축 스트림 캐시. 작업 스레드에서 known_digest/load/save를 호출하고,
+    DB 기록(경로 -> 해시)은 메인 스레드에서 flush()로 한 번에 한다.
+    """
+
+    def __init__(self, folder: str | None = None, conn: sqlite3.Connection | None = None):
+        self.folder = folder or mc_cache.blob_dir("packbuild")
+        self.conn = conn
+        self.rows: Dict[str, Tuple[int, float, str]] = {}
+        self.updates: Dict[str, Tuple[int, float, str]] = {}
+        if conn is None:
+            return
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS packbuild_files ("
+            "path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime REAL NOT NULL, digest TEXT NOT NULL)"
+        )
+        for path, size, mtime, digest in conn.execute("SELECT path, size, mtime, digest FROM packbuild_files"):
+            self.rows[path] = (size, mtime, digest)
+
+    @classmethod
+    def open(cls) -> "BuildCache":
+        """기본 위치의 캐시. DB를 쓸 수 없으면 내용 해시 조회만 한다."""
+        try:
+            return cls(conn=mc_cache.connect())
+        except sqlite3.Error:
+            return cls()
+
+    def _blob_path(self, digest: str, level: int, variant: str = "") -> str:
+        suffix = f"-{variant}" if variant else ""
+        return os.path.join(self.folder, digest[:2], f"{digest}-{level}{suffix}.bin")
+
+    def known_digest(self, path: str, size: int, mtime: float) -> str | None:
+        row = self.rows.get(os.path.abspath(path))
+        if row and row[0] == size and row[1] == mtime:
+            return row[2]
+        return None
+
+    def remember(self, path: str, size: int, mtime: float, digest: str):
+        self.updates[os.path.abspath(path)] = (size, mtime, digest)
+
+    def load(self, arcname: str, digest: str, level: int, variant: str = "") -> CompressedEntry | None:
+        """variant: 변환 종류 (예: 최소화 규칙 버전). 변환마다 다른 스트림을 보관한다."""
+        path = self._blob_path(digest, level, variant)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)  # prune()이 최근에 쓴 스트림을 남기도록
+        except OSError:
+            return None
+        if len(data) < BLOB_HEADER.size:
+            return None
+        crc, size, method = BLOB_HEADER.unpack_from(data)
+        return CompressedEntry(arcname, crc, size, method, data[BLOB_HEADER.size :], reused=True)
+
+    def save(self, digest: str, level: int, entry: CompressedEntry, variant: str = ""):
+        path = self._blob_path(digest, level, variant)
+        if os.path.exists(path):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{id(entry)}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(BLOB_HEADER.pack(entry.crc, entry.size, entry.method))
+                f.write(entry.payload)
+            os.replace(tmp, path)
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def flush(self):
+        if self.conn is None or not self.updates:
+            return
+        try:
+            with self.conn:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO packbuild_files (path, size, mtime, digest) VALUES (?, ?, ?, ?)",
+                    [(path, *row) for path, row in self.updates.items()],
+                )
+            self.rows.update(self.updates)
+            self.updates = {}
+        except sqlite3.Error:
+            pass
+
+    def close(self):
+        self.flush()
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def prune(self, limit: int = BUILD_CACHE_LIMIT) -> int:
+        """오래 쓰지 않은 스트림부터 지워 limit 이하로 줄인다. returns: 지운 파일 수"""
+        blobs: List[Tuple[float, int, str]] = []
+        for root, _, files in os.walk(self.folder):
+            for name in files:
+                full = os.path.join(root, name)
+                try:
+                    st = os.stat(full)
+                except OSError:
+                    continue
+                blobs.append((st.st_mtime, st.st_size, full))
+        total = sum(size for _, size, _ in blobs)
+        removed = 0
+        for _, size, full in sorted(blobs):
+            if total <= limit:
+                break
+            try:
+                os.remove(full)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
+
+
+def cached_compress_file(
+    arcname: str,
+    path: str,
+    level: int,
+    cache: BuildCache,
+    transform: Transform | None = None,
+    variant: str = "",
+) -> CompressedEntry:
+    """
+    캐시에 같은 내용의 스트림이 있으면 재사용하고, 없으면 압축해서 저장한다.
+    transform을 쓰면 variant로 변환 종류를 구분해야 한다 (캐시 키 = 원본 해시 + 레벨 + variant).
+    """
+    st = os.stat(path)
+    digest = cache.known_digest(path, st.st_size, st.st_mtime)
+    if digest is not None:
+        entry = cache.load(arcname, digest, level, variant)
+        if entry is not None:
+            entry.source_size = st.st_size
+            return entry
+    with open(path, "rb") as f:
+        data = f.read()
+    digest = hashlib.blake2b(data, digest_size=20).hexdigest()
+    cache.remember(path, st.st_size, st.st_mtime, digest)
+    entry = cache.load(arcname, digest, level, variant)  # 이동/복사된 파일 등 내용이 같은 경우
+    if entry is not None:
+        entry.source_size = len(data)
+        return entry
+    source_size = len(data)
+    if transform is not None:
+        data = transform(arcname, data)
+    method, payload = compress_bytes(data, level)
+    entry = CompressedEntry(arcname, zlib.crc32(data), len(data), method, payload, source_size=source_size)
+    cache.save(digest, level, entry, variant)
+    return entry
+
+
+def _flags(name: bytes) -> int:
+    return FLAG_UTF8 if any(b >= 0x80 for b in name) else 0
+
+
+def _is_zip64(entry: CompressedEntry) -> bool:
+    return entry.size >= ZIP_MAX or len(entry.payload) >= ZIP_MAX
+
+
+def local_header(entry: CompressedEntry) -> bytes:
+    name = entry.arcname.encode("utf-8")
+    extra = b""
+    version, compressed, size = VERSION_NEEDED, len(entry.payload), entry.size
+    if _is_zip64(entry):
+        # 로컬 헤더의 Zip64 필드에는 두 크기를 모두 적어야 한다
+        extra = struct.pack("<HHQQ", ZIP64_EXTRA, 16, size, compressed)
+        version, compressed, size = VERSION_ZIP64, ZIP64_MARK, ZIP64_MARK
+    return struct.pack(
+        "<IHHHHHIIIHH",
+        0x04034B50,
+        version,
+        _flags(name),
+        entry.method,
+        FIXED_DOS_TIME,
+        FIXED_DOS_DATE,
+        entry.crc,
+        compressed,
+        size,
+        len(name),
+        len(extra),
+    ) + name + extra
+
+
+def central_header(entry: CompressedEntry, offset: int) -> bytes:
+    name = entry.arcname.encode("utf-8")
+    # 중앙 헤더의 Zip64 필드에는 넘친 값만 (원본 크기, 압축 크기, 위치) 순서로 적는다
+    fields = []
+    size, compressed = entry.size, len(entry.payload)
+    if size >= ZIP_MAX:
+        fields.append(size)
+        size = ZIP64_MARK
+    if compressed >= ZIP_MAX:
+        fields.append(compressed)
+        compressed = ZIP64_MARK
+    if offset >= ZIP_MAX:
+        fields.append(offset)
+        offset = ZIP64_MARK
+    extra = struct.pack(f"<HH{len(fields)}Q", ZIP64_EXTRA, 8 * len(fields), *fields) if fields else b""
+    return struct.pack(
+        "<IHHHHHHIIIHHHHHII",
+        0x02014B50,
+        MADE_BY,
+        VERSION_ZIP64 if fields else VERSION_NEEDED,
+        _flags(name),
+        entry.method,
+        FIXED_DOS_TIME,
+        FIXED_DOS_DATE,
+        entry.crc,
+        compressed,
+        size,
+        len(name),
+        len(extra),
+        0,
+        0,
+        0,
+        FILE_ATTR,
+        offset,
+    ) + name + extra
+
+
+def end_record(count: int, cd_size: int, cd_offset: int) -> bytes:
+    """
+    끝 레코드. 항목 수나 중앙 디렉터리 크기/위치가 넘치면 Zip64 끝 레코드와 로케이터를 앞에 붙이고,
+    일반 끝 레코드의 넘친 칸은 0xFFFF/0xFFFFFFFF로 채운다.
+    """
+    if count < ZIP_COUNT_MAX and cd_size < ZIP_MAX and cd_offset < ZIP_MAX:
+        return struct.pack("<IHHHHIIH", 0x06054B50, 0, 0, count, count, cd_size, cd_offset, 0)
+    eocd64_offset = cd_offset + cd_size
+    return (
+        struct.pack("<IQHHIIQQQQ", 0x06064B50, 44, MADE_BY, VERSION_ZIP64, 0, 0, count, count, cd_size, cd_offset)
+        + struct.pack("<IIQI", 0x07064B50, 0, eocd64_offset, 1)
+        + struct.pack(
+            "<IHHHHIIH",
+            0x06054B50,
+            0,
+            0,
+            ZIP64_COUNT_MARK if count >= ZIP_COUNT_MAX else count,
+            ZIP64_COUNT_MARK if count >= ZIP_COUNT_MAX else count,
+            ZIP64_MARK if cd_size >= ZIP_MAX else cd_size,
+            ZIP64_MARK if cd_offset >= ZIP_MAX else cd_offset,
+            0,
+        )
+    )
+
+
+def pack_entries(root_dir: str) -> List[Tuple[str, str]]:
+    """(zip 내부 경로, 실제 경로)를 내부 경로의 UTF-8 바이트 순으로 정렬."""
+    return sorted(collect_files(root_dir), key=lambda item: item[0].encode("utf-8"))
+
+
+def build_zip(
+    items: List[Tuple[str, str]],
+    out_path: str,
+    level: int = DEFAULT_LEVEL,
+    workers: int | None = None,
+    progress: Callable[[int, int], None] | None = None,
+    cache: BuildCache | None = None,
+    transform: Transform | None = None,
+    variant: str = "",
+    pool: Executor | None = None,
+) -> BuildResult:
+    """
+    items(zip 내부 경로, 실제 경로)를 주어진 순서대로 결정적 zip으로 만든다.
+    cache가 있으면 바뀌지 않은 항목은 저장된 압축 스트림을 그대로 쓴다 (flush는 호출 쪽에서).
+    transform은 압축 전에 각 파일 내용에 적용된다 (variant: 캐시 구분용 이름).
+    pool을 주면 그 스레드 풀을 함께 쓴다 (여러 zip을 동시에 만들 때, 종료는 호출 쪽에서).
+    압축은 스레드 풀에서 앞서 진행하되, 메모리를 아끼기 위해 작업자 수의 4배까지만 미리 받는다.
+    임시 파일에 쓴 뒤 완료 시 교체하므로 실패/취소해도 기존 zip이 깨지지 않는다.
+    """
+    workers = workers or min(32, (os.cpu_count() or 1) + 4)
+    tmp_path = out_path + ".part"
+    sha1 = hashlib.sha1()
+    central: List[bytes] = []
+    offset = 0
+    raw_size = 0
+    reused = 0
+    savings: Dict[str, List[int]] = {}
+
+    def compress(arcname: str, path: str) -> CompressedEntry:
+        if cache is None:
+            return compress_file(arcname, path, level, transform)
+        return cached_compress_file(arcname, path, level, cache, transform, variant)
+
+    def put(f, data: bytes):
+        nonlocal offset
+        f.write(data)
+        sha1.update(data)
+        offset += len(data)
+
+    try:
+        own_pool = None
+        if pool is None:
+            own_pool = pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="mc-deflate")
+        with open(tmp_path, "wb") as f, (own_pool or contextlib.nullcontext()):
+            pending: deque = deque()
+            queue = iter(items)
+            window = max(1, workers) * 4
+            done = 0
+            try:
+                for _ in range(window):
+                    arcname, path = next(queue)
+                    pending.append(pool.submit(compress, arcname, path))
+            except StopIteration:
+                pass
+            while pending:
+                entry: CompressedEntry = pending.popleft().result()
+                nxt = next(queue, None)
+                if nxt is not None:
+                    pending.append(pool.submit(compress, nxt[0], nxt[1]))
+                done += 1
+                if progress:
+                    progress(done, len(items))
+                central.append(central_header(entry, offset))
+                put(f, local_header(entry))
+                put(f, entry.payload)
+                raw_size += entry.size
+                reused += entry.reused
+                row = savings.setdefault(type_of(entry.arcname), [0, 0, 0])
+                row[0] += 1
+                row[1] += entry.source_size if entry.source_size >= 0 else entry.size
+                row[2] += entry.size
+            cd_offset = offset
+            for header in central:
+                put(f, header)
+            put(f, end_record(len(central), offset - cd_offset, cd_offset))
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return BuildResult(
+        out_path,
+        sha1.hexdigest(),
+        len(items),
+        offset,
+        raw_size,
+        reused,
+        {ext: (row[0], row[1], row[2]) for ext, row in savings.items()},
+    )
+
+
+def build_pack_zip(
+    root_dir: str,
+    out_path: str,
+    level: int = DEFAULT_LEVEL,
+    workers: int | None = None,
+    progress: Callable[[int, int], None] | None = None,
+    use_cache: bool = True,
+    minify: bool = False,
+) -> BuildResult:
+    """
+    팩 폴더 하나를 결정적 zip으로 빌드한다. use_cache=True이면 빌드 캐시를 쓴다.
+    minify=True이면 릴리스용 최소화(mc_minify)를 적용하고 OS 부산물을 뺀다.
+    """
+    cache = BuildCache.open() if use_cache else None
+    try:
+        result = _build_pack(root_dir, out_path, level, workers, progress, cache, minify)
+        if cache is not None:
+            cache.prune()
+    finally:
+        if cache is not None:
+            cache.close()
+    return result
+
+
+def _pack_items(root_dir: str, minify: bool) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+    items = pack_entries(root_dir)
+    return split_junk(items) if minify else (items, [])
+
+
+def _build_pack(
+    root_dir: str,
+    out_path: str,
+    level: int,
+    workers: int | None,
+    progress: Callable[[int, int], None] | None,
+    cache: BuildCache | None,
+    minify: bool,
+    pool: Executor | None = None,
+    items: Tuple[List[Tuple[str, str]], List[Tuple[str, str]]] | None = None,
+) -> BuildResult:
+    kept, junk = items if items is not None else _pack_items(root_dir, minify)
+    options: Dict = {"level": level, "workers": workers, "progress": progress, "cache": cache, "pool": pool}
+    if minify:
+        options.update(transform=minify_bytes, variant=f"min{MINIFY_VERSION}")
+    result = build_zip(kept, out_path, **options)
+    result.junk = len(junk)
+    result.junk_bytes = sum(os.path.getsize(path) for _, path in junk)
+    return result
+
+
+@dataclass
+class PackBuild:
+    kind: str
+    name: str
+    result: BuildResult
+    seconds: float
+
+
+def select_packs(
+    base: str, kinds: Tuple[str, ...] = PACK_KINDS, patterns: List[str] | None = None
+) -> List[Tuple[str, str]]:
+    """(종류, 팩 이름) 목록. patterns가 있으면 fnmatch로 하나라도 맞는 팩만 (예: "core_*")."""
+    selected: List[Tuple[str, str]] = []
+    for kind in kinds:
+        for name in list_packs(base, kind):
+            if not patterns or any(fnmatch.fnmatch(name, pat) for pat in patterns):
+                selected.append((kind, name))
+    return selected
+
+
+def build_all(
+    base: str,
+    out_dir: str | None = None,
+    kinds: Tuple[str, ...] = PACK_KINDS,
+    patterns: List[str] | None = None,
+    level: int = DEFAULT_LEVEL,
+    workers: int | None = None,
+    pack_jobs: int = 3,
+    use_cache: bool = True,
+    minify: bool = False,
+    progress: Callable[[int, int], None] | None = None,
+) -> Tuple[List[PackBuild], str]:
+    """
+    선택한 팩을 <out_dir>/<종류>/<팩>.zip으로 동시에 빌드하고 manifest.json을 쓴다.
+    진행률은 모든 팩의 파일 수 합계 기준이다. 한 팩이라도 실패하면 나머지를 기다린 뒤 그 예외를 다시 낸다.
+    returns: (팩별 결과, manifest 경로)
+    """
+    out_dir = out_dir or os.path.join(base, "build")
+    packs = select_packs(base, kinds, patterns)
+    if not packs:
+        raise ValueError("빌드할 팩이 없습니다.")
+    plans = [(kind, name, _pack_items(os.path.join(base, kind, name), minify)) for kind, name in packs]
+    total = sum(len(items[0]) for _, _, items in plans)
+    done = 0
+    lock = threading.Lock()
+
+    def step(*_):
+        nonlocal done
+        with lock:
+            done += 1
+            current = done
+        if progress:
+            progress(current, total)
+
+    def one(kind: str, name: str, items) -> PackBuild:
+        started = time.perf_counter()
+        target = os.path.join(out_dir, kind, f"{name}.zip")
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        result = _build_pack(os.path.join(base, kind, name), target, level, None, step, cache, minify, pool, items)
+        return PackBuild(kind, name, result, time.perf_counter() - started)
+
+    workers = workers or min(32, (os.cpu_count() or 1) + 4)
+    cache = BuildCache.open() if use_cache else None
+    builds: List[PackBuild] = []
+    error: BaseException | None = None
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="mc-deflate") as pool:
+            with ThreadPoolExecutor(max_workers=max(1, pack_jobs), thread_name_prefix="mc-pack") as packer:
+                # 큰 팩부터 시작해 마지막에 큰 팩 하나만 남아 도는 일을 줄인다
+                order = sorted(plans, key=lambda plan: len(plan[2][0]), reverse=True)
+                futures = [packer.submit(one, kind, name, items) for kind, name, items in order]
+                for fut in as_completed(futures):
+                    try:
+                        builds.append(fut.result())
+                    except BaseException as exc:  # 취소 포함: 다른 팩도 곧 progress에서 멈춘다
+                        error = error or exc
+        if error is not None:
+            raise error
+        if cache is not None:
+            cache.prune()
+    finally:
+        if cache is not None:
+            cache.close()
+    builds.sort(key=lambda b: (PACK_KINDS.index(b.kind) if b.kind in PACK_KINDS else 99, b.name))
+    manifest = write_manifest(out_dir, builds, minify)
+    return builds, manifest
+
+
+def write_manifest(out_dir: str, builds: List[PackBuild], minify: bool = False) -> str:
+    """out_dir/manifest.json: 팩별 zip 경로(상대), 크기, SHA-1, 항목 수, 빌드 시간."""
+    data = {
+        "generated": datetime.datetime.now().isoformat(timespec="seconds"),
+        "minify": minify,
+        "packs": [
+            {
+                "kind": b.kind,
+                "name": b.name,
+                "zip": os.path.relpath(b.result.path, out_dir).replace(os.sep, "/"),
+                "bytes": b.result.size,
+                "sha1": b.result.sha1,
+                "entries": b.result.entries,
+                "reused": b.result.reused,
+                "seconds": round(b.seconds, 3),
+            }
+            for b in builds
+        ],
+    }
+    path = os.path.join(out_dir, MANIFEST_NAME)
+    os.makedirs(out_dir, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    return path
+
+
+def file_sha1(path: str) -> str:
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+__all__ = [
+    "BuildCache",
+    "BuildResult",
+    "CompressedEntry",
+    "compress_bytes",
+    "compress_file",
+    "cached_compress_file",
+    "pack_entries",
+    "build_zip",
+    "build_pack_zip",
+    "PackBuild",
+    "select_packs",
+    "build_all",
+    "write_manifest",
+    "file_sha1",
+    "DEFAULT_LEVEL",
+]
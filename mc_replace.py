@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+다중 규칙 일괄 치환 엔진.
+문자열(리터럴) 규칙은 하나의 Aho-Corasick 오토마톤으로 묶어 파일을 한 번만 훑고,
+정규식 규칙은 그 뒤에 순서대로 re.sub로 적용한다.
+
+리터럴 규칙끼리는 연쇄되지 않는다: 원문에서 가장 왼쪽·가장 긴 일치를 한 번에 바꾸므로
+"a"→"b", "b"→"c" 규칙이 있어도 "a"는 "b"가 된다 (순차 str.replace와 다름).
+
+규칙 파일(JSON) 형식:
+    {"minecraft:old_id": "minecraft:new_id", ...}
+    [{"pattern": "scoreboard players (\\w+)", "replacement": "...", "regex": true}, ...]
+"""
+from __future__ import annotations
+
+import json
+import re
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Mapping, Tuple
+
+
+@dataclass
+class ReplaceRule:
+    pattern: str
+    replacement: str
+    regex: bool = False
+
+
+class AhoCorasick:
+    """여러 문자열을 한 번의 순회로 찾는 오토마톤 (문자 단위)."""
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = []
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.out: List[List[int]] = [[]]  # 상태에서 끝나는 패턴 (접미사 링크 포함)
+        for pat in patterns:
+            if not pat:
+                raise ValueError("빈 문자열 패턴은 사용할 수 없습니다.")
+            self._add(pat)
+        self._build()
+
+    def _add(self, pat: str):
+        state = 0
+        for ch in pat:
+            nxt = self.goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[state][ch] = nxt
+                self.goto.append({})
+                self.fail.append(0)
+                self.out.append([])
+            state = nxt
+        self.out[state].append(len(self.patterns))
+        self.patterns.append(pat)
+
+    def _build(self):
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+                f = self.fail[state]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                target = self.goto[f].get(ch, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                self.out[nxt] = self.out[nxt] + self.out[self.fail[nxt]]
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """(시작, 끝, 패턴 번호)를 끝 위치 순으로 모두 (겹치는 것 포함)."""
+        goto, fail, out, patterns = self.goto, self.fail, self.out, self.patterns
+        state = 0
+        for pos, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                end = pos + 1
+                for idx in out[state]:
+                    yield end - len(patterns[idx]), end, idx
+
+    def leftmost_longest(self, text: str) -> List[Tuple[int, int, int]]:
+        """겹치지 않는 일치 목록: 왼쪽 우선, 같은 시작이면 가장 긴 것."""
+        found = sorted(self.finditer(text), key=lambda m: (m[0], -(m[1] - m[0])))
+        picked: List[Tuple[int, int, int]] = []
+        last_end = 0
+        for start, end, idx in found:
+            if start >= last_end:
+                picked.append((start, end, idx))
+                last_end = end
+        return picked
+
+
+class ReplaceEngine:
+    """리터럴 규칙(한 번의 Aho-Corasick 순회) + 정규식 규칙(순서대로)."""
+
+    def __init__(self, rules: Iterable[ReplaceRule]):
+        self.rules = list(rules)
+        literals: Dict[str, str] = {}
+        for r in self.rules:
+            if not r.regex:
+                literals[r.pattern] = r.replacement  # 같은 패턴은 마지막 규칙 우선
+        self.literals = literals
+        self.automaton = AhoCorasick(literals) if literals else None
+        self.replacements = [literals[p] for p in self.automaton.patterns] if self.automaton else []
+        self.regexes: List[Tuple[re.Pattern, str]] = []
+        for r in self.rules:
+            if r.regex:
+                try:
+                    self.regexes.append((re.compile(r.pattern, re.MULTILINE), r.replacement))
+                except re.error as exc:
+                    raise ValueError(f"정규식 오류: {r.pattern} ({exc})") from exc
+
+    @property
+    def literal_only(self) -> bool:
+        return not self.regexes
+
+    def apply(self, text: str) -> Tuple[str, int]:
+        """치환 결과와 치환 횟수."""
+        count = 0
+        if self.automaton is not None:
+            matches = self.automaton.leftmost_longest(text)
+            if matches:
+                parts: List[str] = []
+                last = 0
+                for start, end, idx in matches:
+                    parts.append(text[last:start])
+                    parts.append(self.replacements[idx])
+                    last = end
+                parts.append(text[last:])
+                text = "".join(parts)
+                count += len(matches)
+        for pattern, replacement in self.regexes:
+            text, n = pattern.subn(replacement, text)
+            count += n
+        return text, count
+
+
+def rules_from_mapping(mapping: Mapping[str, str]) -> List[ReplaceRule]:
+    return [ReplaceRule(old, new) for old, new in mapping.items()]
+
+
+def load_rules(path: str) -> List[ReplaceRule]:
+    """JSON 규칙 파일을 읽는다 (형식은 모듈 설명 참고). 형식 오류는 ValueError."""
+    with open(path, "r", encoding="utf-8") as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"규칙 파일 JSON 오류: {exc}") from exc
+    if isinstance(data, dict):
+        return rules_from_mapping({str(k): str(v) for k, v in data.items()})
+    if not isinstance(data, list):
+        raise ValueError("규칙 파일은 객체 또는 배열이어야 합니다.")
+    rules: List[ReplaceRule] = []
+    for i, item in enumerate(data, start=1):
+        if not isinstance(item, dict) or "pattern" not in item or "replacement" not in item:
+            raise ValueError(f"{i}번째 규칙에 pattern/replacement가 없습니다.")
+        rules.append(ReplaceRule(str(item["pattern"]), str(item["replacement"]), bool(item.get("regex", False))))
+    return rules
+
+
+__all__ = ["ReplaceRule", "AhoCorasick", "ReplaceEngine", "rules_from_mapping", "load_rules"]
@@ -10,7 +10,9 @@ from __future__ import annotations
 import json
 import os
 import re
-from typing import List
+from typing import Callable, List
+
+from mc_index import get_index
 
 VALID_NS = re.compile(r"^[a-z0-9_\-\.]+$")
 
@@ -99,17 +101,21 @@ def scan_resourcepack(path: str) -> List[str]:
     return issues
 
 
-def scan_workspace(base: str) -> List[str]:
+def scan_workspace(base: str, progress: Callable[[int, int], None] | None = None) -> List[str]:
     issues: List[str] = []
+    index = get_index(base)
+    total = sum(len(index.packs(kind)) for kind in ("datapacks", "resourcepacks"))
+    done = 0
     for kind, scan_func in (("datapacks", scan_datapack), ("resourcepacks", scan_resourcepack)):
         root = os.path.join(base, kind)
-        if not os.path.isdir(root):
+        if not index.has_kind(kind):
             issues.append(f"[{kind}] 폴더 없음: {root}")
             continue
-        for entry in sorted(os.listdir(root)):
+        for entry in index.packs(kind):
+            done += 1
+            if progress:
+                progress(done, total)
             pack_path = os.path.join(root, entry)
-            if not os.path.isdir(pack_path):
-                continue
             sub = scan_func(pack_path)
             if sub:
                 for msg in sub:
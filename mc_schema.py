@@ -7,7 +7,10 @@ from __future__ import annotations
 
 import json
 import os
-from typing import Dict, List
+from typing import Callable, Dict, List, Tuple
+
+from mc_index import PACK_KINDS, WorkspaceIndex, get_index
+from mc_journal import JOURNAL_DIR
 
 
 def load_json(path: str) -> Dict:
@@ -81,27 +84,51 @@ def validate_file(path: str) -> List[str]:
     return issues
 
 
-def scan_workspace_json(base: str) -> List[str]:
-    results: List[str] = []
-    for root, _, files in os.walk(base):
-        for f in files:
-            if not f.endswith(".json"):
-                continue
-            full = os.path.join(root, f)
-            validator, kind = guess_validator(full)
-            if not validator:
-                continue
-            try:
-                data = load_json(full)
-                issues = validator(data)
-                if issues:
-                    for msg in issues:
-                        results.append(f"{os.path.relpath(full, base)}: {msg}")
-            except Exception as exc:
-                results.append(f"{os.path.relpath(full, base)}: 파싱 실패 {exc}")
+def _loose_json(base: str, index: WorkspaceIndex) -> List[Tuple[str, str]]:
+    """
+    인덱스가 다루지 않는 .json의 (상대 경로, 경로) 목록.
+    워크스페이스 최상위나 다른 폴더, datapacks/ 바로 아래 파일 등 (편집 저널 폴더는 뺀다).
+    """
+    found: List[Tuple[str, str]] = []
+    for root, dirs, files in os.walk(base):
+        rel_root = os.path.relpath(root, base)
+        if rel_root == ".":
+            dirs[:] = [d for d in dirs if d != JOURNAL_DIR]
+        elif rel_root in PACK_KINDS and index.has_kind(rel_root):
+            dirs[:] = []  # 팩 폴더 안은 인덱스에서 가져온다
+        dirs.sort()
+        for name in sorted(files):
+            if name.endswith(".json"):
+                full = os.path.join(root, name)
+                found.append((os.path.relpath(full, base), full))
+    return found
+
+
+def json_issues(base: str, progress: Callable[[int, int], None] | None = None) -> List[Tuple[str, str]]:
+    """워크스페이스 JSON의 (상대 경로, 메시지) 목록. 팩 안은 인덱스로, 나머지 폴더는 직접 훑는다."""
+    results: List[Tuple[str, str]] = []
+    index = get_index(base)
+    entries = [(entry.rel, entry.path) for entry in index.files(ext=".json")] + _loose_json(base, index)
+    for done, (rel, path) in enumerate(entries, start=1):
+        if progress:
+            progress(done, len(entries))
+        validator, kind = guess_validator(path)
+        if not validator:
+            continue
+        try:
+            data = load_json(path)
+            for msg in validator(data):
+                results.append((rel, msg))
+        except Exception as exc:
+            results.append((rel, f"파싱 실패 {exc}"))
+    return results
+
+
+def scan_workspace_json(base: str, progress: Callable[[int, int], None] | None = None) -> List[str]:
+    results = [f"{rel}: {msg}" for rel, msg in json_issues(base, progress=progress)]
     if not results:
         results.append("검사 대상 JSON에서 오류를 찾지 못했습니다.")
     return results
 
 
-__all__ = ["validate_file", "scan_workspace_json"]
+__all__ = ["validate_file", "scan_workspace_json", "json_issues"]
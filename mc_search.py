@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+"""
+mcfunction/JSON 내용 검색용 트라이그램 역색인.
+각 파일의 줄 안 3글자 조각(트라이그램)을 모아 '트라이그램 -> 파일' 목록을 만들고,
+검색어의 트라이그램을 모두 가진 파일만 실제로 열어 확인한다.
+색인은 mc_cache(SQLite)에 저장되고, 크기/mtime이 바뀐 파일만 다시 색인한다.
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from array import array
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+
+import mc_cache
+from mc_index import get_index
+
+GRAM = 3
+
+
+def text_grams(text: str) -> Set[str]:
+    """줄 단위 트라이그램 집합 (줄바꿈을 넘는 조각은 만들지 않는다)."""
+    grams: Set[str] = set()
+    for line in text.replace("\r\n", "\n").replace("\r", "\n").split("\n"):
+        if len(line) >= GRAM:
+            grams.update(line[i : i + GRAM] for i in range(len(line) - GRAM + 1))
+    return grams
+
+
+def search_targets(base: str) -> List[Tuple[str, str]]:
+    """색인 대상 (상대 경로, 실제 경로): 함수 폴더의 mcfunction + 팩 안의 JSON."""
+    index = get_index(base)
+    return [(e.rel, e.path) for e in index.mcfunctions()] + [(e.rel, e.path) for e in index.files(ext=".json")]
+
+
+class SearchIndex:
+    """
+    files: 상대 경로 -> (파일 ID, 크기, mtime)
+    postings: 트라이그램 ID -> 파일 ID 목록 (불러온 그대로는 array, 수정하면 set)
+    """
+
+    def __init__(self, base: str):
+        self.base = os.path.abspath(base)
+        self.vocab: Dict[str, int] = {}
+        self.files: Dict[str, Tuple[int, int, float]] = {}
+        self.rel_of: Dict[int, str] = {}
+        self.file_grams: Dict[int, array] = {}
+        self.postings: Dict[int, "array | Set[int]"] = {}
+        self._next_fid = 1
+        self._new_grams: List[Tuple[str, int]] = []
+        self._dirty_files: Set[str] = set()
+        self._removed_files: Set[str] = set()
+        self._dirty_postings: Set[int] = set()
+
+    # --- 저장/불러오기 ---
+    @staticmethod
+    def _ensure_tables(conn: sqlite3.Connection):
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS search_files ("
+            "base TEXT NOT NULL, rel TEXT NOT NULL, fid INTEGER NOT NULL, size INTEGER NOT NULL, "
+            "mtime REAL NOT NULL, grams BLOB NOT NULL, PRIMARY KEY (base, rel))"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS search_vocab ("
+            "base TEXT NOT NULL, gram TEXT NOT NULL, gid INTEGER NOT NULL, PRIMARY KEY (base, gram))"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS search_postings ("
+            "base TEXT NOT NULL, gid INTEGER NOT NULL, fids BLOB NOT NULL, PRIMARY KEY (base, gid))"
+        )
+
+    def load(self, conn: sqlite3.Connection):
+        self._ensure_tables(conn)
+        for gram, gid in conn.execute("SELECT gram, gid FROM search_vocab WHERE base = ?", (self.base,)):
+            self.vocab[gram] = gid
+        for rel, fid, size, mtime, grams in conn.execute(
+            "SELECT rel, fid, size, mtime, grams FROM search_files WHERE base = ?", (self.base,)
+        ):
+            self.files[rel] = (fid, size, mtime)
+            self.rel_of[fid] = rel
+            self.file_grams[fid] = array("I", grams)
+            self._next_fid = max(self._next_fid, fid + 1)
+        for gid, fids in conn.execute("SELECT gid, fids FROM search_postings WHERE base = ?", (self.base,)):
+            self.postings[gid] = array("I", fids)
+
+    def save(self, conn: sqlite3.Connection):
+        if not (self._new_grams or self._dirty_files or self._removed_files or self._dirty_postings):
+            return
+        self._ensure_tables(conn)
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO search_vocab (base, gram, gid) VALUES (?, ?, ?)",
+                [(self.base, gram, gid) for gram, gid in self._new_grams],
+            )
+            conn.executemany(
+                "DELETE FROM search_files WHERE base = ? AND rel = ?",
+                [(self.base, rel) for rel in self._removed_files],
+            )
+            rows = []
+            for rel in self._dirty_files:
+                if rel in self.files:
+                    fid, size, mtime = self.files[rel]
+                    rows.append((self.base, rel, fid, size, mtime, self.file_grams[fid].tobytes()))
+            conn.executemany(
+                "INSERT OR REPLACE INTO search_files (base, rel, fid, size, mtime, grams) VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            upserts = []
+            deletes = []
+            for gid in self._dirty_postings:
+                fids = self.postings.get(gid)
+                if fids:
+                    upserts.append((self.base, gid, array("I", sorted(fids)).tobytes()))
+                else:
+                    deletes.append((self.base, gid))
+            conn.executemany("INSERT OR REPLACE INTO search_postings (base, gid, fids) VALUES (?, ?, ?)", upserts)
+            conn.executemany("DELETE FROM search_postings WHERE base = ? AND gid = ?", deletes)
+        self._new_grams.clear()
+        self._dirty_files.clear()
+        self._removed_files.clear()
+        self._dirty_postings.clear()
+
+    # --- 갱신 ---
+    def _posting_set(self, gid: int) -> Set[int]:
+        fids = self.postings.get(gid)
+        if not isinstance(fids, set):
+            fids = set(fids) if fids is not None else set()
+            self.postings[gid] = fids
+        self._dirty_postings.add(gid)
+        return fids
+
+    def _gid(self, gram: str) -> int:
+        gid = self.vocab.get(gram)
+        if gid is None:
+            gid = self.vocab[gram] = len(self.vocab) + 1
+            self._new_grams.append((gram, gid))
+        return gid
+
+    def _set_grams(self, fid: int, gids: Set[int]):
+        old = set(self.file_grams.get(fid, ()))
+        for gid in old - gids:
+            self._posting_set(gid).discard(fid)
+        for gid in gids - old:
+            self._posting_set(gid).add(fid)
+        self.file_grams[fid] = array("I", sorted(gids))
+
+    def _drop(self, rel: str):
+        fid = self.files.pop(rel)[0]
+        self._set_grams(fid, set())
+        del self.file_grams[fid]
+        del self.rel_of[fid]
+        self._removed_files.add(rel)
+        self._dirty_files.discard(rel)
+
+    def refresh(self, targets: List[Tuple[str, str]], progress: Callable[[int, int], None] | None = None) -> int:
+        """
+        targets(상대 경로, 실제 경로)에 맞춰 색인을 갱신한다.
+        크기/mtime이 같으면 건너뛰고, 사라진 파일은 색인에서 뺀다.
+        returns: 다시 색인한 파일 수
+        """
+        current = dict(targets)
+        for rel in [rel for rel in self.files if rel not in current]:
+            self._drop(rel)
+        updated = 0
+        total = len(targets)
+        for done, (rel, full) in enumerate(targets, start=1):
+            if progress and done % 500 == 0:
+                progress(done, total)
+            try:
+                st = os.stat(full)
+            except OSError:
+                if rel in self.files:
+                    self._drop(rel)
+                continue
+            known = self.files.get(rel)
+            if known and known[1] == st.st_size and known[2] == st.st_mtime:
+                continue
+            try:
+                with open(full, "r", encoding="utf-8", errors="replace") as f:
+                    text = f.read()
+            except OSError:
+                continue
+            if known:
+                fid = known[0]
+            else:
+                fid = self._next_fid
+                self._next_fid += 1
+                self.rel_of[fid] = rel
+            self.files[rel] = (fid, st.st_size, st.st_mtime)
+            self._set_grams(fid, {self._gid(g) for g in text_grams(text)})
+            self._dirty_files.add(rel)
+            updated += 1
+        return updated
+
+    # --- 조회 ---
+    def candidates(self, needle: str, rels: Iterable[str] | None = None) -> List[str]:
+        """
+        needle을 포함할 수 있는 파일(상대 경로, 정렬). 실제 포함 여부는 호출 쪽에서 확인한다.
+        needle이 트라이그램보다 짧으면 색인된 파일 전체.
+        """
+        allowed = set(rels) if rels is not None else None
+        grams = text_grams(needle)
+        if not grams:
+            found: Iterable[str] = self.files.keys()
+        else:
+            lists = []
+            for gram in grams:
+                gid = self.vocab.get(gram)
+                fids = self.postings.get(gid) if gid is not None else None
+                if not fids:
+                    return []
+                lists.append(fids)
+            lists.sort(key=len)
+            result = set(lists[0])
+            for fids in lists[1:]:
+                result.intersection_update(fids)
+                if not result:
+                    return []
+            found = (self.rel_of[fid] for fid in result if fid in self.rel_of)
+        return sorted(rel for rel in found if allowed is None or rel in allowed)
+
+
+_INDEXES: Dict[str, SearchIndex] = {}
+_LOCK = threading.Lock()
+
+
+def get_search_index(
+    base: str, progress: Callable[[int, int], None] | None = None, persist: bool = True
+) -> SearchIndex:
+    """
+    워크스페이스별로 공유되는 검색 색인을 갱신해 반환한다.
+    처음 호출 시 mc_cache에서 이전 색인을 불러오고, 바뀐 부분을 다시 저장한다.
+    캐시 DB를 쓸 수 없으면 메모리에서만 유지한다.
+    갱신 중 취소/오류가 나도 그때까지 색인한 파일(파일 단위로 완결)은 저장하고 연결을 닫는다.
+    """
+    key = os.path.abspath(base)
+    targets = search_targets(base)
+    with _LOCK:
+        index = _INDEXES.get(key)
+        fresh = index is None
+        if fresh:
+            index = _INDEXES[key] = SearchIndex(key)
+        conn = None
+        if persist:
+            try:
+                conn = mc_cache.connect()
+                if fresh:
+                    index.load(conn)
+            except sqlite3.Error:
+                if conn is not None:
+                    conn.close()
+                conn = None
+        try:
+            index.refresh(targets, progress=progress)
+        finally:
+            if conn is not None:
+                try:
+                    index.save(conn)
+                except sqlite3.Error:
+                    pass
+                finally:
+                    conn.close()
+        return index
+
+
+__all__ = ["SearchIndex", "get_search_index", "search_targets", "text_grams"]
@@ -10,6 +10,8 @@ import os
 from dataclasses import dataclass
 from typing import Dict, Tuple
 
+from mc_index import get_index
+
 
 @dataclass
 class PackStats:
@@ -28,40 +30,33 @@ def human_size(num: int) -> str:
     return f"{num:.1f}TB"
 
 
+def _file_size(path: str) -> int:
+    """인덱스에는 크기가 없으므로 직접 stat (제자리 수정도 반영)."""
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
 def collect_stats(base: str) -> Dict[str, PackStats]:
     stats: Dict[str, PackStats] = {"datapacks": PackStats(), "resourcepacks": PackStats()}
+    index = get_index(base)
+    for kind, st in stats.items():
+        st.packs = len(index.packs(kind))
 
     # 데이터 팩
-    dp_root = os.path.join(base, "datapacks")
-    if os.path.isdir(dp_root):
-        for pack in os.listdir(dp_root):
-            pack_path = os.path.join(dp_root, pack)
-            if not os.path.isdir(pack_path):
-                continue
-            stats["datapacks"].packs += 1
-            for root, _, files in os.walk(pack_path):
-                for f in files:
-                    full = os.path.join(root, f)
-                    stats["datapacks"].size_bytes += os.path.getsize(full)
-                    if f.endswith(".mcfunction"):
-                        stats["datapacks"].mcfunctions += 1
+    for e in index.files(kind="datapacks"):
+        stats["datapacks"].size_bytes += _file_size(e.path)
+        if e.rel.endswith(".mcfunction"):
+            stats["datapacks"].mcfunctions += 1
 
     # 리소스 팩
-    rp_root = os.path.join(base, "resourcepacks")
-    if os.path.isdir(rp_root):
-        for pack in os.listdir(rp_root):
-            pack_path = os.path.join(rp_root, pack)
-            if not os.path.isdir(pack_path):
-                continue
-            stats["resourcepacks"].packs += 1
-            for root, _, files in os.walk(pack_path):
-                for f in files:
-                    full = os.path.join(root, f)
-                    stats["resourcepacks"].size_bytes += os.path.getsize(full)
-                    if f.endswith(".png"):
-                        stats["resourcepacks"].textures += 1
-                    if f.endswith(".json") and "lang" in root:
-                        stats["resourcepacks"].lang += 1
+    for e in index.files(kind="resourcepacks"):
+        stats["resourcepacks"].size_bytes += _file_size(e.path)
+        if e.rel.endswith(".png"):
+            stats["resourcepacks"].textures += 1
+        if e.rel.endswith(".json") and e.resource == "lang":
+            stats["resourcepacks"].lang += 1
     return stats
 
 